@@ -0,0 +1,235 @@
+import threading
+from array import array
+from itertools import islice
+from history_store import record_answers
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Questions per adaptive quiz when the engine has no quiz_length
+ADAPTIVE_QUIZ_LENGTH = 10
+# New responses collected before a background refit starts
+REFIT_BATCH = 200
+# Newton iterations per fit
+FIT_ITERATIONS = 10
+# Variance of the N(0, 1) prior on abilities and difficulties; keeps
+# estimates finite for players or questions with all-correct answers
+PRIOR_VARIANCE = 1.0
+# Largest change of one parameter in a single Newton step
+MAX_STEP = 1.0
+
+
+def fit_rasch(players, items, correct, ability, difficulty, iterations=FIT_ITERATIONS):
+    """MAP fit of a 1PL (Rasch) model, P(correct) = sigmoid(ability - difficulty)
+
+    players, items and correct are parallel arrays with one entry per
+    response. ability and difficulty are starting values (warm start);
+    new arrays are returned. Each iteration is one Newton step for all
+    abilities, then one for all difficulties, computed with bincount.
+    """
+    ability = ability.copy()
+    difficulty = difficulty.copy()
+    precision = 1.0 / PRIOR_VARIANCE
+    for _ in range(iterations):
+        p = 1.0 / (1.0 + np.exp(difficulty[items] - ability[players]))
+        residual = correct - p
+        weight = p * (1.0 - p)
+        gradient = np.bincount(players, residual, len(ability)) - ability * precision
+        curvature = np.bincount(players, weight, len(ability)) + precision
+        ability += np.clip(gradient / curvature, -MAX_STEP, MAX_STEP)
+
+        p = 1.0 / (1.0 + np.exp(difficulty[items] - ability[players]))
+        residual = correct - p
+        weight = p * (1.0 - p)
+        gradient = -np.bincount(items, residual, len(difficulty)) - difficulty * precision
+        curvature = np.bincount(items, weight, len(difficulty)) + precision
+        difficulty += np.clip(gradient / curvature, -MAX_STEP, MAX_STEP)
+    return ability, difficulty
+
+
+class AdaptiveSelector:
+    """Chooses each next question to be the most informative for the player
+
+    Item difficulties and player abilities come from a Rasch fit of every
+    recorded answer. Answers given during a quiz update the player's
+    ability at once with a single Newton step; full refits run on a
+    background thread every `refit_batch` new answers, warm-started from
+    the current estimates, and replace them when done. Selection only
+    reads the latest estimates, so it never waits for a fit.
+    """
+
+    def __init__(self, model, refit_batch=REFIT_BATCH, background=True):
+        if np is None:
+            raise RuntimeError("adaptive mode requires numpy")
+        self.model = model
+        self.refit_batch = refit_batch
+        self.background = background
+        self.lock = threading.Lock()
+        self.fitting = False
+        self.pending = 0
+        # Responses as parallel columns
+        self.response_players = array('i')
+        self.response_items = array('i')
+        self.response_correct = array('d')
+        self.players = {}
+        self.items = {}
+        self.ability = np.zeros(0)
+        self.difficulty = np.zeros(0)
+        # Per category: item columns in bank order
+        self.category_items = {}
+        self.started = False
+
+    def ensure_started(self):
+        """Fit the saved history the first time the selector is used"""
+        if not self.started:
+            self.started = True
+            self.model.history.ensure_loaded()
+            self.start_fit(self.load_history)
+
+    # Responses
+    def player_column(self, name):
+        column = self.players.get(name)
+        if column is None:
+            column = self.players[name] = len(self.players)
+        return column
+
+    def item_column(self, question_id):
+        column = self.items.get(question_id)
+        if column is None:
+            column = self.items[question_id] = len(self.items)
+        return column
+
+    def add_response(self, player_name, question_id, is_correct):
+        with self.lock:
+            self.response_players.append(self.player_column(player_name))
+            self.response_items.append(self.item_column(question_id))
+            self.response_correct.append(1.0 if is_correct else 0.0)
+
+    def load_history(self):
+        """Collect the answers of the quizzes saved before the selector
+        started; later ones arrive through record()
+
+        Uses iter_records(), which only reads, since the store may be
+        appended to meanwhile.
+        """
+        saved = len(self.model.history)
+        for record in islice(self.model.history.store.iter_records(), saved):
+            player_name = record.get('player_name', '')
+            for question_id, _, is_correct, _ in record_answers(record):
+                self.add_response(player_name, question_id, is_correct)
+
+    def record(self, player_name, question_id, is_correct):
+        """Add an answer given during a quiz and update the player's ability"""
+        self.ensure_started()
+        self.add_response(player_name, question_id, is_correct)
+        with self.lock:
+            ability, difficulty = self.estimates()
+            player = self.players[player_name]
+            item = self.items[question_id]
+            p = 1.0 / (1.0 + np.exp(difficulty[item] - ability[player]))
+            step = ((1.0 if is_correct else 0.0) - p) / (p * (1.0 - p) + 1.0 / PRIOR_VARIANCE)
+            ability[player] += max(-MAX_STEP, min(MAX_STEP, step))
+            self.ability = ability
+            self.pending += 1
+            refit = self.pending >= self.refit_batch and not self.fitting
+        if refit:
+            self.start_fit()
+
+    def estimates(self):
+        """Current (ability, difficulty), padded with the prior mean for
+        players and questions seen since the last fit; call under lock"""
+        if len(self.ability) < len(self.players):
+            self.ability = np.concatenate([self.ability, np.zeros(len(self.players) - len(self.ability))])
+        if len(self.difficulty) < len(self.items):
+            self.difficulty = np.concatenate([self.difficulty, np.zeros(len(self.items) - len(self.difficulty))])
+        return self.ability, self.difficulty
+
+    # Fitting
+    def start_fit(self, before=None):
+        """Refit on a background thread (or inline when background=False)"""
+        with self.lock:
+            if self.fitting:
+                return
+            self.fitting = True
+        if self.background:
+            threading.Thread(target=self.fit, args=(before,), name="irt-fit", daemon=True).start()
+        else:
+            self.fit(before)
+
+    def fit(self, before=None):
+        try:
+            if before is not None:
+                before()
+            with self.lock:
+                count = len(self.response_items)
+                self.pending = 0
+                # Snapshot: the columns only grow, so the first `count`
+                # entries stay valid while the fit runs
+                players = np.frombuffer(self.response_players, dtype=np.int32, count=count).copy()
+                items = np.frombuffer(self.response_items, dtype=np.int32, count=count).copy()
+                correct = np.frombuffer(self.response_correct, dtype=np.float64, count=count).copy()
+                ability, difficulty = self.estimates()
+                ability, difficulty = ability.copy(), difficulty.copy()
+            if count:
+                ability, difficulty = fit_rasch(players, items, correct, ability, difficulty)
+            with self.lock:
+                # Keep abilities updated during the fit for players it did not see
+                fitted = np.bincount(players, minlength=len(ability)) > 0
+                ability = np.where(fitted, ability, self.ability[:len(ability)])
+                self.ability = np.concatenate([ability, self.ability[len(ability):]])
+                self.difficulty = np.concatenate([difficulty, self.difficulty[len(difficulty):]])
+        except Exception as e:
+            print(f"Error fitting question statistics: {e}")
+        finally:
+            with self.lock:
+                self.fitting = False
+                # Answers that piled up during the fit
+                again = self.pending >= self.refit_batch
+        if again:
+            self.start_fit()
+
+    # Selection
+    def columns(self, category):
+        """Item columns of a category's questions, in bank order"""
+        columns = self.category_items.get(category)
+        if columns is None:
+            ids = self.model.get_question_ids(category)
+            with self.lock:
+                columns = np.fromiter(
+                    (self.item_column(question_id) for question_id in ids),
+                    dtype=np.int64, count=len(ids)
+                )
+            self.category_items[category] = columns
+        return columns
+
+    def next_index(self, category, player_name, asked):
+        """Index of the unasked question with the most information, or None
+
+        For a Rasch item the information is p * (1 - p), which peaks for
+        the question whose difficulty is closest to the player's ability.
+        """
+        self.ensure_started()
+        columns = self.columns(category)
+        if len(asked) >= len(columns):
+            return None
+        with self.lock:
+            ability, difficulty = self.estimates()
+            player = self.players.get(player_name)
+            theta = ability[player] if player is not None else 0.0
+            p = 1.0 / (1.0 + np.exp(difficulty[columns] - theta))
+        information = p * (1.0 - p)
+        if asked:
+            information[np.fromiter(asked, dtype=np.int64, count=len(asked))] = -1.0
+        return int(np.argmax(information))
+
+    def ability_of(self, player_name):
+        with self.lock:
+            player = self.players.get(player_name)
+            return float(self.ability[player]) if player is not None and player < len(self.ability) else 0.0
+
+    def difficulty_of(self, question_id):
+        with self.lock:
+            item = self.items.get(question_id)
+            return float(self.difficulty[item]) if item is not None and item < len(self.difficulty) else 0.0
@@ -0,0 +1,37 @@
+import os
+import customtkinter as ctk
+from PIL import Image
+
+ASSET_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Decoded source images by path (None marks a failed load)
+_images = {}
+# CTkImage instances by (path, size)
+_ctk_images = {}
+
+
+def load_pil_image(filename):
+    """Decode an image file once per process"""
+    path = os.path.join(ASSET_DIR, filename)
+    if path not in _images:
+        try:
+            with Image.open(path) as img:
+                img.load()
+                _images[path] = img.copy()
+        except (OSError, ValueError) as e:
+            # Reported once; later calls hit the cached None
+            print(f"Warning: could not load image {filename}: {e}")
+            _images[path] = None
+    return _images[path]
+
+
+def load_image(filename, size):
+    """Return a shared CTkImage for filename at size, or None if unavailable"""
+    key = (filename, size)
+    if key not in _ctk_images:
+        img = load_pil_image(filename)
+        if img is None:
+            _ctk_images[key] = None
+        else:
+            _ctk_images[key] = ctk.CTkImage(light_image=img, dark_image=img, size=size)
+    return _ctk_images[key]
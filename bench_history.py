@@ -0,0 +1,185 @@
+import argparse
+import datetime
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from history_repository import HistoryRepository
+from history_store import JsonlHistoryStore, SqliteHistoryStore
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+CATEGORIES = ["Core", "Advanced", "Modules", "Techniques"]
+# Rows the history page materializes for one screen of its virtual list
+PAGE_ROWS = 10
+
+
+def generate_history(count, seed=0, legacy_ratio=0.05, with_answers=True, players=200):
+    """Synthetic history rows in the quiz_history schema
+
+    About legacy_ratio of the rows use the old layout with a "7/10"
+    string score and a 'time' field instead of time_seconds.
+    """
+    rng = random.Random(seed)
+    start = datetime.datetime(2024, 1, 1)
+    span_minutes = 2 * 365 * 24 * 60
+    records = []
+    for i in range(count):
+        date = (start + datetime.timedelta(minutes=rng.randrange(span_minutes))).strftime("%Y-%m-%d %H:%M")
+        player = f"Player{rng.randrange(players)}"
+        category = rng.choice(CATEGORIES)
+        total = 10
+        score = sum(rng.random() < 0.7 for _ in range(total))
+        seconds = rng.randrange(30, 600)
+        if rng.random() < legacy_ratio:
+            records.append({
+                "date": date,
+                "player_name": player,
+                "category": category,
+                "score": f"{score}/{total}",
+                "percentage": score / total * 100,
+                "time": f"{seconds // 60}:{seconds % 60:02d}"
+            })
+            continue
+        record = {
+            "id": i + 1,
+            "date": date,
+            "player_name": player,
+            "category": category,
+            "score": score,
+            "total": total,
+            "percentage": score / total * 100,
+            "time_seconds": seconds,
+            "time_formatted": f"{seconds // 60}:{seconds % 60:02d}",
+        }
+        if with_answers:
+            answers = []
+            for q in range(total):
+                selected_index = rng.randrange(4)
+                answers.append([f"{category}-q{q}", selected_index, q < score, rng.randrange(2, 60)])
+            record["answers"] = answers
+        records.append(record)
+    return records
+
+
+def create_store(backend, workdir):
+    if backend == "sqlite":
+        return SqliteHistoryStore(os.path.join(workdir, "history.db"), legacy_path="", log_path="")
+    return JsonlHistoryStore(os.path.join(workdir, "history.jsonl"), legacy_path="")
+
+
+def measure(func, repeat):
+    """Time func over `repeat` runs, then trace one more run for peak memory
+
+    Tracing is kept out of the timed runs because tracemalloc slows
+    allocation-heavy code by an order of magnitude.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {
+        "min_ms": min(timings) * 1000,
+        "median_ms": statistics.median(timings) * 1000,
+        "peak_kb": peak / 1024,
+    }
+
+
+def bench_size(count, backend, repeat, with_answers, seed):
+    """Time every history operation against a history of `count` rows"""
+    workdir = tempfile.mkdtemp(prefix="quiz-bench-")
+    try:
+        return _bench_store(workdir, count, backend, repeat, with_answers, seed)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def _bench_store(workdir, count, backend, repeat, with_answers, seed):
+    records = generate_history(count, seed=seed, with_answers=with_answers)
+    store = create_store(backend, workdir)
+    store.append_many(records)
+    del records
+
+    results = {}
+    repository = [None]
+
+    def load():
+        repository[0] = HistoryRepository(create_store(backend, workdir))
+        repository[0].ensure_loaded()
+
+    results["load_quiz_history"] = measure(load, repeat)
+    history = repository[0]
+    now = datetime.datetime(2026, 1, 1)
+
+    # Tab queries return lazy rows; time what the page does with them:
+    # materialize one screen of rows, or every row when scrolled through
+    operations = {
+        "get_filtered_data[All Scores]": lambda: list(history.all_scores()[:PAGE_ROWS]),
+        "get_filtered_data[All Scores, all rows]": lambda: list(history.all_scores()),
+        "get_filtered_data[Last 30 Days]": lambda: list(history.last_days(30, now=now)[:PAGE_ROWS]),
+        "get_filtered_data[Top 10]": lambda: list(history.top(10)),
+        "get_podium_data": lambda: list(history.podium(3)),
+    }
+    for name, func in operations.items():
+        results[name] = measure(func, repeat)
+
+    extra = generate_history(repeat + 1, seed=seed + 1, with_answers=with_answers)
+    pending = iter(extra)
+    results["save_quiz_history"] = measure(lambda: history.add(next(pending)), repeat)
+    return results
+
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except OSError:
+        return ""
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark history operations at scale")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="history sizes to test, e.g. 1000 10000 100000 1000000")
+    parser.add_argument("--backend", choices=["jsonl", "sqlite"], default="jsonl")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--no-answers", action="store_true",
+                        help="omit per-question answers from synthetic rows")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="bench_history.jsonl",
+                        help="results are appended here, one JSON object per run")
+    args = parser.parse_args()
+
+    run = {
+        "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "backend": args.backend,
+        "repeat": args.repeat,
+        "with_answers": not args.no_answers,
+        "sizes": {},
+    }
+    for size in args.sizes:
+        results = bench_size(size, args.backend, args.repeat, not args.no_answers, args.seed)
+        run["sizes"][str(size)] = results
+        print(f"\n{size} records ({args.backend})")
+        for name, stats in results.items():
+            print(f"  {name:<42}{stats['median_ms']:>12.3f} ms  peak {stats['peak_kb']:>12.1f} KB")
+
+    with open(args.output, "a") as f:
+        f.write(json.dumps(run) + "\n")
+    print(f"\nResults appended to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
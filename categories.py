@@ -0,0 +1,74 @@
+import json
+import math
+import zlib
+from collections import namedtuple
+
+CategoryInfo = namedtuple("CategoryInfo", ["name", "description", "emoji", "color", "count"])
+
+DEFAULT_EMOJI = "📚"
+# Colors for categories without metadata, picked by a stable hash of the name
+PALETTE = ["#FF6B6B", "#4ECDC4", "#45B7D1", "#96CEB4", "#ECB45E", "#A78BFA", "#F28482", "#84A59D"]
+
+
+class CategoryCatalog:
+    """Categories discovered from the question bank
+
+    Names and question counts come from the bank's index; descriptions,
+    emojis and colors come from an optional metadata file, with defaults
+    for categories it does not list. Entries are built on first use and
+    cached.
+    """
+
+    def __init__(self, bank, metadata_path=None):
+        self.bank = bank
+        self.metadata = self.load_metadata(metadata_path) if metadata_path else {}
+        self.cache = {}
+        self._names = None
+
+    @staticmethod
+    def load_metadata(path):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except json.JSONDecodeError:
+            print(f"Error: Invalid JSON in {path}")
+            return {}
+
+    def names(self):
+        """Categories that have at least one question, in bank order"""
+        if self._names is None:
+            self._names = [name for name in self.bank.categories() if self.bank.count(name) > 0]
+        return self._names
+
+    def __len__(self):
+        return len(self.names())
+
+    def info(self, name):
+        """CategoryInfo for a category"""
+        info = self.cache.get(name)
+        if info is None:
+            meta = self.metadata.get(name, {})
+            count = self.bank.count(name)
+            info = self.cache[name] = CategoryInfo(
+                name,
+                meta.get("description", f"{count} questions"),
+                meta.get("emoji", DEFAULT_EMOJI),
+                meta.get("color", PALETTE[zlib.crc32(name.encode("utf-8")) % len(PALETTE)]),
+                count,
+            )
+        return info
+
+    def page_count(self, size):
+        return max(1, math.ceil(len(self) / size))
+
+    def page(self, number, size):
+        """CategoryInfo entries on page `number` (from 0)"""
+        names = self.names()[number * size:(number + 1) * size]
+        return [self.info(name) for name in names]
+
+    def invalidate(self):
+        """Forget cached entries, e.g. after the bank is reloaded"""
+        self.cache.clear()
+        self._names = None
@@ -6,19 +6,35 @@ from views.page3_view import Page3View
 from views.results_page import ResultsPageView
 from views.history_page import HistoryPageView
 from views.review_answers_page import ReviewAnswersPage  # NEW IMPORT
-import datetime
-import time
+from scheduler import AfterScheduler
+from engine import QuizEngine, result_message
 
 class QuizController:
+    # Lazy view registry, in pre-warm order
+    VIEW_CLASSES = {
+        "page1": Page1View,
+        "page2": Page2View,
+        "page3": Page3View,
+        "results_page": ResultsPageView,
+        "review_answers_page": ReviewAnswersPage,
+        "history_page": HistoryPageView,
+    }
+    
+    # Build the remaining views in the background once the window is idle
+    PREWARM_VIEWS = True
+    
     def __init__(self, root):
         self.root = root
         self.model = QuizModel()
+        
+        # Quiz flow lives in the headless engine; this class adapts it to Tk
+        self.engine = QuizEngine(self.model)
+        self.session = None
         self.current_view = None
+        self.current_view_name = None
         
-        # Time tracking
-        self.quiz_start_time = 0
-        self.total_quiz_time = 0
-        self.question_times = []  # Track time spent on each question
+        # Pending screen transitions, dropped when navigating away
+        self.scheduler = AfterScheduler(root)
         
         # Set window properties
         self.root.title("PyWizz - Python Quiz App")
@@ -30,141 +46,130 @@ class QuizController:
         except:
             pass
         
-        # Initialize all views
-        self.page1 = Page1View(root, self)
-        self.page2 = Page2View(root, self)
-        self.page3 = Page3View(root, self)
-        self.results_page = ResultsPageView(root, self)
-        self.history_page = HistoryPageView(root, self)
-        self.review_answers_page = ReviewAnswersPage(root, self)  # NEW VIEW
+        # Views are built on first use; see get_view()
+        self.views = {}
+    
+    def get_view(self, name):
+        """Return the named view, creating it on first access"""
+        view = self.views.get(name)
+        if view is None:
+            view = self.VIEW_CLASSES[name](self.root, self)
+            self.views[name] = view
+        return view
+    
+    page1 = property(lambda self: self.get_view("page1"))
+    page2 = property(lambda self: self.get_view("page2"))
+    page3 = property(lambda self: self.get_view("page3"))
+    results_page = property(lambda self: self.get_view("results_page"))
+    history_page = property(lambda self: self.get_view("history_page"))
+    review_answers_page = property(lambda self: self.get_view("review_answers_page"))
+    
+    def prewarm_views(self):
+        """Build one not-yet-created view per idle slot, then load the
+        history if no view has needed it yet"""
+        for name in self.VIEW_CLASSES:
+            if name not in self.views:
+                self.get_view(name)
+                self.root.after_idle(self.prewarm_views)
+                return
+        self.model.history.ensure_loaded()
     
     def run(self):
         """Start the application"""
         self.show_page1()
+        if self.PREWARM_VIEWS:
+            self.root.after_idle(self.prewarm_views)
         self.root.mainloop()
     
+    def _show_view(self, name):
+        """Hide the current view and show the named one"""
+        view = self.get_view(name)
+        self.scheduler.cancel_all()
+        if name != "page3" and "page3" in self.views:
+            self.views["page3"].stop_question_timer()
+        self._hide_all_views()
+        view.pack(fill="both", expand=True)
+        self.current_view = view
+        self.current_view_name = name
+        return view
+    
     def show_page1(self):
         """Show the welcome page"""
-        self._hide_all_views()
-        self.page1.pack(fill="both", expand=True)
-        self.current_view = self.page1
-        
-        # Reset time tracking
-        self.quiz_start_time = 0
-        self.total_quiz_time = 0
-        self.question_times = []
+        self._show_view("page1")
     
     def show_page2(self, user_name):
         """Show category selection page"""
         self.model.player.set_name(user_name)
-        self._hide_all_views()
-        self.page2.pack(fill="both", expand=True)
-        self.current_view = self.page2
+        self._show_view("page2")
     
     def select_category(self, category):
         """Handle category selection"""
-        self.model.player.set_category(category)
-        self.model.player.reset_quiz()
-        
-        # Reset time tracking for new quiz
-        self.quiz_start_time = time.time()
-        self.question_times = []
-        
+        self.session = self.engine.start_session(
+            self.model.player.get_name(), category, player=self.model.player
+        )
+        self.show_page3()
+    
+    def start_review(self):
+        """Start a session of questions due for review; False if none are due"""
+        session = self.engine.start_review_session(
+            self.model.player.get_name(), player=self.model.player
+        )
+        if not session.questions:
+            return False
+        self.session = session
         self.show_page3()
+        return True
     
     def show_page3(self):
         """Show quiz question page"""
-        self._hide_all_views()
-        self.page3.pack(fill="both", expand=True)
-        self.current_view = self.page3
+        self._show_view("page3")
         self.load_current_question()
     
     def load_current_question(self):
         """Load the current question"""
-        category = self.model.player.get_category()
-        question_data = self.model.get_current_question(category)
-        total_questions = self.model.get_total_questions(category)
-        current_q = self.model.player.current_question_index + 1
+        question_data = self.engine.get_question(self.session)
         
         if question_data:
+            current_q, total_questions = self.engine.get_progress(self.session)
             self.page3.update_question(
                 question_data, 
                 current_q, 
                 total_questions,
-                category
+                self.session.player.get_category()
             )
         else:
             self.show_results()
     
     def submit_answer(self, selected_index, question_time=None):
         """Handle answer submission"""
-        category = self.model.player.get_category()
-        question_data = self.model.get_current_question(category)
+        if self.session is None or self.engine.get_question(self.session) is None:
+            return
         
-        if question_data:
-            # Get correct answer index - handle both "answer" and "correct_answer" keys
-            if "answer" in question_data:
-                correct_index = question_data["answer"]
-            elif "correct_answer" in question_data:
-                correct_index = question_data["correct_answer"]
-            else:
-                # Fallback if no correct answer key found
-                print(f"ERROR: No correct answer key found in question data. Keys: {list(question_data.keys())}")
-                correct_index = 0
-            
-            # Track time spent on this question
-            if question_time is not None:
-                self.question_times.append(question_time)
-            
-            # Check if answer is correct
-            is_correct = self.model.check_answer(category, selected_index)
-            
-            # DEBUG: Print for troubleshooting
-            print(f"Selected: {selected_index}, Correct: {correct_index}, Is correct: {is_correct}")
-            
-            # Show feedback on the page
-            self.page3.show_answer_feedback(selected_index, correct_index)
-            
-            # Schedule next question after delay
-            self.root.after(1500, self.next_question)
+        is_correct, correct_index = self.engine.submit_answer(
+            self.session, selected_index, question_time
+        )
+        
+        # Show feedback on the page
+        self.page3.show_answer_feedback(selected_index, correct_index)
+        
+        # Schedule next question after delay
+        self.scheduler.schedule("advance", 1500, self.next_question)
     
     def time_expired(self):
         """Handle timer expiration"""
-        category = self.model.player.get_category()
-        question_data = self.model.get_current_question(category)
-        if question_data:
-            # Get correct answer index
-            if "answer" in question_data:
-                correct_index = question_data["answer"]
-            elif "correct_answer" in question_data:
-                correct_index = question_data["correct_answer"]
-            else:
-                correct_index = 0
-            
-            # Record as wrong answer (no selection)
-            self.model.check_answer(category, -1)  # -1 indicates no answer
-            
-            # Track time (use default or calculate)
-            current_question_index = self.model.player.current_question_index
-            if current_question_index < len(self.question_times):
-                # Use existing time if available
-                pass
-            else:
-                # Estimate time (could use a default)
-                self.question_times.append(30)  # 30 seconds default
-            
-            self.page3.show_correct_answer_only(correct_index)
-            self.root.after(1500, self.next_question)
+        if self.session is None or self.engine.get_question(self.session) is None:
+            return
+        
+        correct_index = self.engine.time_expired(self.session)
+        self.page3.show_correct_answer_only(correct_index)
+        self.scheduler.schedule("advance", 1500, self.next_question)
     
     def next_question(self):
         """Move to the next question or show results"""
-        # Move to next question index
-        self.model.next_question()
-        
-        category = self.model.player.get_category()
-        question_data = self.model.get_current_question(category)
+        # A manual "Next" click supersedes the pending auto-advance
+        self.scheduler.cancel("advance")
         
-        if question_data:
+        if self.engine.advance(self.session):
             # Reset for next question
             self.page3.reset_for_next_question()
             self.load_current_question()
@@ -174,17 +179,10 @@ class QuizController:
     
     def show_results(self):
         """Show quiz results page"""
-        # Calculate total quiz time
-        if self.quiz_start_time:
-            self.total_quiz_time = int(time.time() - self.quiz_start_time)
-        
-        # Fallback: sum of question times if available
-        if self.total_quiz_time == 0 and self.question_times:
-            self.total_quiz_time = sum(self.question_times)
-        
-        # Get quiz results
-        score_correct = self.model.player.get_score()
-        total_questions = self.model.get_total_questions(self.model.player.get_category())
+        # finish() saves to history only the first time it is called
+        result = self.engine.finish(self.session)
+        score_correct = result['score']
+        total_questions = result['total']
         
         if total_questions == 0:
             # Handle edge case: no questions in category
@@ -192,124 +190,37 @@ class QuizController:
             self.show_page2(self.model.player.get_name())
             return
         
-        correct_count = score_correct
-        wrong_count = total_questions - score_correct
-        
-        # Format total time
-        minutes = self.total_quiz_time // 60
-        seconds = self.total_quiz_time % 60
-        total_time = f"{minutes}:{seconds:02d}"
-        
-        # Get result message
-        message = self._get_result_message(score_correct, total_questions)
-        
-        # Save quiz results to history
-        quiz_result = self._save_quiz_result(score_correct, total_questions, self.total_quiz_time)
-        
-        # Update history page with new data
-        self.history_page.update_history_data(self.model.quiz_history)
-        
-        # Show results page
-        self._hide_all_views()
-        self.results_page.pack(fill="both", expand=True)
-        self.current_view = self.results_page
+        self._show_view("results_page")
         
         # Update results page with data
         self.results_page.update_results(
             score_correct=score_correct,
             total_questions=total_questions,
-            correct_count=correct_count,
-            wrong_count=wrong_count,
-            total_time=total_time,
-            message=message
+            correct_count=score_correct,
+            wrong_count=total_questions - score_correct,
+            total_time=result['time_formatted'],
+            message=self._get_result_message(score_correct, total_questions)
         )
-        
-        # Pass answer history for review
-        self.results_page.set_answer_history(self.model.get_answer_history())
     
     def show_review_answers(self):
         """Show the review answers page"""
-        self._hide_all_views()
-        self.review_answers_page.pack(fill="both", expand=True)
-        self.current_view = self.review_answers_page
-        
-        # Get answer history and questions data
-        answer_history = self.model.get_answer_history()
-        category = self.model.player.get_category()
+        self._show_view("review_answers_page")
         
-        # Get all questions for the category
-        questions_data = self.model.get_all_questions(category)
+        # Resolve the compact answer records against the question bank
+        questions_data, answer_details = self.model.resolve_answers(self.session.answers)
         
         # Set data for review
-        self.review_answers_page.set_answer_data(answer_history, questions_data)
-    
-    def _save_quiz_result(self, score, total, quiz_time):
-        """Save the current quiz result to history"""
-        quiz_result = {
-            'id': len(self.model.quiz_history) + 1,
-            'date': datetime.datetime.now().strftime("%Y-%m-%d %H:%M"),
-            'player_name': self.model.player.get_name(),
-            'category': self.model.player.get_category(),
-            'score': score,
-            'total': total,
-            'percentage': (score / total * 100) if total > 0 else 0,
-            'time_seconds': quiz_time,
-            'time_formatted': f"{quiz_time // 60}:{quiz_time % 60:02d}",
-            'answer_history': self.model.get_answer_history(),
-            'question_times': self.question_times
-        }
-        self.model.quiz_history.append(quiz_result)
-        self.model.save_quiz_history()
-        return quiz_result
+        self.review_answers_page.set_answer_data(answer_details, questions_data)
     
     def show_history(self):
         """Show history page"""
-        self._hide_all_views()
-        self.history_page.pack(fill="both", expand=True)
-        self.current_view = self.history_page
-        
-        # Get history data from model
-        history_data = self.model.quiz_history
+        self._show_view("history_page")
         
-        if history_data:
-            # Format data for display
-            formatted_data = []
-            for result in history_data:
-                formatted_data.append({
-                    'date': result['date'],
-                    'player_name': result['player_name'],
-                    'category': result['category'],
-                    'score': f"{result['score']}/{result['total']}",
-                    'percentage': result['percentage'],
-                    'time': result.get('time_formatted', '0:00')
-                })
-            
-            # Update history page with actual data
-            self.history_page.update_history_data(formatted_data)
-        else:
-            # Show empty state
-            self.history_page.update_history_data([])
+        self.history_page.refresh_if_needed()
     
     def _get_result_message(self, score, total):
         """Generate appropriate message based on score"""
-        if total == 0:
-            return "No questions answered"
-        
-        percentage = (score / total) * 100
-        if percentage == 100:
-            return "Perfect Score! 🎯"
-        elif percentage >= 90:
-            return "Excellent Work! 🌟"
-        elif percentage >= 80:
-            return "Great Job! 👍"
-        elif percentage >= 70:
-            return "Good Work! 💪"
-        elif percentage >= 60:
-            return "Not Bad! 😊"
-        elif percentage >= 50:
-            return "Keep Practicing! 📚"
-        else:
-            return "Try Again! 🔄"
+        return result_message(score, total)
     
     # Results page callbacks
     def on_play_again(self):
@@ -349,23 +260,20 @@ class QuizController:
     # Navigation
     def go_back(self):
         """Go back to previous page"""
-        if self.current_view == self.page3:
+        if self.current_view_name == "page3":
             # Stop any pending timers before going back
-            if hasattr(self.page3, 'stop_question_timer'):
-                self.page3.stop_question_timer()
+            self.page3.stop_question_timer()
             self.show_page2(self.model.player.get_name())
-        elif self.current_view == self.results_page:
+        elif self.current_view_name == "results_page":
             self.show_page1()
-        elif self.current_view == self.history_page:
+        elif self.current_view_name == "history_page":
             self.show_page2(self.model.player.get_name())
-        elif self.current_view == self.review_answers_page:  # NEW
+        elif self.current_view_name == "review_answers_page":
             self.show_results()
     
     def _hide_all_views(self):
-        """Hide all views"""
-        for view in [self.page1, self.page2, self.page3, 
-                    self.results_page, self.history_page, 
-                    self.review_answers_page]:  # NEW VIEW ADDED
+        """Hide all views that have been built"""
+        for view in self.views.values():
             view.pack_forget()
     
     def _show_message(self, title, message):
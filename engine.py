@@ -0,0 +1,258 @@
+import datetime
+import random
+import time
+from adaptive import ADAPTIVE_QUIZ_LENGTH, AdaptiveSelector
+from models import ADAPTIVE_MODE, Answer, Player, QuizModel
+
+# Time recorded for a question when the timer runs out without an answer
+DEFAULT_EXPIRED_TIME = 30
+# Category name of review sessions, whose questions are picked by id
+REVIEW_CATEGORY = "Review"
+# Questions per review session
+REVIEW_SESSION_SIZE = 10
+
+
+class QuizSession:
+    """State of one quiz attempt"""
+
+    __slots__ = ("player", "questions", "length", "option_orders", "answers",
+                 "started_at", "last_active", "result")
+
+    def __init__(self, player, questions, started_at, shuffle_options=False, length=None):
+        self.player = player
+        # Question indexes within the category, in the order they are asked;
+        # adaptive quizzes append each one as the previous is answered.
+        # Review sessions hold question ids instead
+        self.questions = questions
+        self.length = len(questions) if length is None else length
+        # Presented -> original option index, by position; None keeps bank order
+        self.option_orders = {} if shuffle_options else None
+        # Answer tuple per answered question
+        self.answers = []
+        self.started_at = started_at
+        self.last_active = started_at
+        self.result = None
+
+    def is_finished(self):
+        return self.result is not None
+
+    @property
+    def question_times(self):
+        return [answer.time for answer in self.answers]
+
+
+class QuizEngine:
+    """Tk-free quiz flow: start, question, answer, finish, result
+
+    The GUI controller, tests and simulations all drive quizzes through
+    this class. `clock` returns seconds and `now` returns a datetime, so
+    both can be replaced for deterministic runs.
+
+    With quiz_length set, each quiz asks that many questions sampled
+    without replacement from the category, in random order; otherwise it
+    walks the whole category in bank order. shuffle_options presents the
+    options of each question in random order. With adaptive=True (the
+    default when models.ADAPTIVE_MODE is set) each next question is the
+    one an AdaptiveSelector expects to be most informative for the player.
+    """
+
+    def __init__(self, model=None, clock=time.time, now=datetime.datetime.now,
+                 quiz_length=None, shuffle_options=False, rng=None, adaptive=ADAPTIVE_MODE):
+        self.model = model if model is not None else QuizModel()
+        self.clock = clock
+        self.now = now
+        self.quiz_length = quiz_length
+        self.shuffle_options = shuffle_options
+        self.rng = rng if rng is not None else random.Random()
+        self.selector = None
+        if adaptive:
+            try:
+                self.selector = AdaptiveSelector(self.model)
+            except RuntimeError as e:
+                print(f"Warning: {e}; questions are served in bank order")
+
+    def start_session(self, player_name, category, player=None, length=None, shuffle_options=None):
+        """Begin a quiz for player_name in category
+
+        length and shuffle_options override the engine's defaults.
+        """
+        player = player if player is not None else Player()
+        player.set_name(player_name)
+        player.set_category(category)
+        player.reset_quiz()
+        if shuffle_options is None:
+            shuffle_options = self.shuffle_options
+        length = length or self.quiz_length
+        if self.selector is not None:
+            count = self.model.get_total_questions(category)
+            length = min(length or ADAPTIVE_QUIZ_LENGTH, count)
+            first = self.selector.next_index(category, player_name, ())
+            questions = [first] if first is not None else []
+            return QuizSession(player, questions, self.clock(), shuffle_options, length)
+        questions = self.pick_questions(category, length)
+        return QuizSession(player, questions, self.clock(), shuffle_options)
+
+    def start_review_session(self, player_name, player=None, limit=REVIEW_SESSION_SIZE):
+        """Begin a session of the player's questions due for review"""
+        player = player if player is not None else Player()
+        player.set_name(player_name)
+        player.set_category(REVIEW_CATEGORY)
+        player.reset_quiz()
+        questions = [question_id for question_id in self.model.reviews.due(player_name, limit, self.clock())
+                     if self.model.get_question_by_id(question_id) is not None]
+        return QuizSession(player, questions, self.clock(), self.shuffle_options)
+
+    def pick_questions(self, category, length=None):
+        """Question indexes for a quiz, O(length) in time and memory
+
+        Samples indexes of the category instead of its question list, so
+        nothing is loaded until a question is asked.
+        """
+        count = self.model.get_total_questions(category)
+        if not length:
+            return range(count)
+        return self.rng.sample(range(count), min(length, count))
+
+    def get_question(self, session):
+        """Current question dict, or None when the quiz is over"""
+        position = session.player.current_question_index
+        if position >= len(session.questions):
+            return None
+        category = session.player.get_category()
+        if category == REVIEW_CATEGORY:
+            question = self.model.get_question_by_id(session.questions[position])
+        else:
+            question = self.model.get_question(category, session.questions[position])
+        if question is None or session.option_orders is None:
+            return question
+        return self.shuffled(session, position, question)
+
+    def shuffled(self, session, position, question):
+        """Copy of question with its options in the session's order"""
+        order = session.option_orders.get(position)
+        if order is None:
+            order = list(range(len(question.get("options", []))))
+            self.rng.shuffle(order)
+            session.option_orders[position] = order
+        correct_index = self.model.get_correct_index(question)
+        presented = dict(question)
+        presented.pop("correct_answer", None)
+        presented["options"] = [question["options"][i] for i in order]
+        presented["answer"] = order.index(correct_index) if correct_index in order else -1
+        return presented
+
+    def get_progress(self, session):
+        """(current question number, total questions)"""
+        return session.player.current_question_index + 1, session.length
+
+    def submit_answer(self, session, selected_index, question_time=None):
+        """Grade an answer; returns (is_correct, correct_index)
+
+        Indexes are as presented; the answer is recorded against the
+        bank's option order so it can be reviewed later.
+        """
+        question = self.get_question(session)
+        if question is None:
+            return False, -1
+        correct_index = self.model.get_correct_index(question)
+        is_correct = selected_index == correct_index and selected_index != -1
+        if is_correct:
+            session.player.increment_score()
+        recorded_index = selected_index
+        if session.option_orders is not None:
+            order = session.option_orders[session.player.current_question_index]
+            if 0 <= selected_index < len(order):
+                recorded_index = order[selected_index]
+        session.answers.append(Answer(question["id"], recorded_index, is_correct, question_time or 0))
+        if self.selector is not None:
+            self.selector.record(session.player.get_name(), question["id"], is_correct)
+        self.model.reviews.record(session.player.get_name(), question["id"], recorded_index,
+                                  is_correct, question_time, self.clock())
+        return is_correct, correct_index
+
+    def time_expired(self, session):
+        """Record an unanswered question; returns the correct index"""
+        if self.get_question(session) is None:
+            return -1
+        _, correct_index = self.submit_answer(session, -1, DEFAULT_EXPIRED_TIME)
+        return correct_index
+
+    def advance(self, session):
+        """Move to the next question; returns False when none is left"""
+        session.player.next_question()
+        position = session.player.current_question_index
+        if self.selector is not None and position == len(session.questions) < session.length:
+            index = self.selector.next_index(session.player.get_category(),
+                                             session.player.get_name(), set(session.questions))
+            if index is not None:
+                session.questions.append(index)
+        return self.get_question(session) is not None
+
+    def finish(self, session, save=True):
+        """Assemble the result and record it in history once
+
+        With save=False the caller stores the result (if should_save())
+        and flushes the review schedule itself, e.g. off the event loop.
+        """
+        if session.result is not None:
+            return session.result
+        total = session.length
+        score = session.player.get_score()
+        finished_at = self.now()
+        quiz_time = int(self.clock() - session.started_at)
+        # Fallback: sum of question times if available
+        if quiz_time == 0 and session.answers:
+            quiz_time = int(sum(session.question_times))
+        session.result = {
+            'id': self.model.history.next_id(),
+            'date': finished_at.strftime("%Y-%m-%d %H:%M"),
+            'timestamp': finished_at.timestamp(),
+            'player_name': session.player.get_name(),
+            'category': session.player.get_category(),
+            'score': score,
+            'total': total,
+            'percentage': (score / total * 100) if total > 0 else 0,
+            'time_seconds': quiz_time,
+            'time_formatted': f"{quiz_time // 60}:{quiz_time % 60:02d}",
+            'answers': session.answers
+        }
+        if save:
+            self.model.reviews.flush()
+            if self.should_save(session.result):
+                self.model.add_quiz_result(session.result)
+        return session.result
+
+    @staticmethod
+    def should_save(result):
+        """Whether a result belongs in history
+
+        Review sessions are practice of already missed questions; keeping
+        them out of history keeps them off the leaderboard and player stats.
+        """
+        return result['total'] > 0 and result['category'] != REVIEW_CATEGORY
+
+    def result(self, session):
+        """Finished result for session, or None if still running"""
+        return session.result
+
+
+def result_message(score, total):
+    """Generate appropriate message based on score"""
+    if total == 0:
+        return "No questions answered"
+
+    percentage = (score / total) * 100
+    if percentage == 100:
+        return "Perfect Score! 🎯"
+    elif percentage >= 90:
+        return "Excellent Work! 🌟"
+    elif percentage >= 80:
+        return "Great Job! 👍"
+    elif percentage >= 70:
+        return "Good Work! 💪"
+    elif percentage >= 60:
+        return "Not Bad! 😊"
+    elif percentage >= 50:
+        return "Keep Practicing! 📚"
+    else:
+        return "Try Again! 🔄"
@@ -0,0 +1,177 @@
+import datetime
+import heapq
+from array import array
+from bisect import bisect_left, bisect_right
+from history_store import normalize_record
+from history_table import HistoryTable, TableRows
+from leaderboard import Leaderboard
+from player_stats import PlayerStatsCache
+
+# Size of the incrementally maintained top results list; also the
+# largest limit the server's /leaderboard accepts
+LEADERBOARD_SIZE = 100
+
+
+class HistoryRepository:
+    """Single owner of quiz history state and its persistence
+
+    Views subscribe to change notifications instead of loading or saving
+    the history file themselves. The store is read on first use, so
+    creating the repository costs nothing until history is needed.
+    """
+
+    def __init__(self, store, stats_path=None):
+        self.store = store
+        self._listeners = []
+        self.leaderboard = Leaderboard(LEADERBOARD_SIZE)
+        # Per-player aggregates, snapshotted next to the history
+        if stats_path is None and getattr(store, 'path', None):
+            stats_path = store.path + '.stats.json'
+        self.stats = PlayerStatsCache(stats_path)
+        # Summary rows in columns; answers stay in the store
+        self.table = HistoryTable()
+        # Row numbers ordered by timestamp
+        self._by_time = array('i')
+        self.loaded = False
+
+    def ensure_loaded(self):
+        """Load the store now unless that has already happened"""
+        if not self.loaded:
+            self.loaded = True
+            self.load()
+
+    def load(self):
+        """Stream the history store once into the table
+
+        The player stats snapshot only takes the records it does not
+        cover yet, and is rebuilt if it does not match the log.
+        """
+        self.stats.load()
+        covered, covered_timestamp = self.stats.records, self.stats.last_timestamp
+        try:
+            for record in self.store.stream():
+                record = normalize_record(record)
+                record.pop('answers', None)
+                self.index(record)
+        except OSError as e:
+            print(f"Error loading quiz history: {e}")
+        if covered > len(self.table) or (
+                covered and self.table.timestamps[covered - 1] != covered_timestamp):
+            self.stats.rebuild(self.table)
+        elif self.stats.unsaved:
+            self.stats.save()
+
+    @property
+    def records(self):
+        """All results in insertion order, materialized lazily"""
+        self.ensure_loaded()
+        return TableRows(self.table, range(len(self.table)))
+
+    def subscribe(self, callback):
+        """Call callback(record) whenever a result is added"""
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def unsubscribe(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def add(self, record, persist=True):
+        """Add a finished quiz result with exactly one store write
+
+        Callers that write to the store themselves (e.g. off the event
+        loop) pass persist=False and call persist() later. The record is
+        normalized in place, so older layouts are accepted as on load.
+        """
+        self.ensure_loaded()
+        normalized = normalize_record(record)
+        record.clear()
+        record.update(normalized)
+        self.index(record)
+        if persist:
+            self.persist(record)
+        for callback in list(self._listeners):
+            callback(record)
+
+    def persist(self, record):
+        """Write a record to the store, and the player stats snapshot
+        when it is due; runs on the server's writer thread"""
+        try:
+            self.store.append(record)
+        except Exception as e:
+            print(f"Error saving quiz history: {e}")
+        self.stats.save_if_due()
+
+    def index(self, record):
+        """Add a record to the table, the leaderboard, the player stats
+        and the time index"""
+        row = self.table.append(record)
+        self.leaderboard.add(row, self.table.percentages[row], self.table.player_name(row))
+        if row == self.stats.records:
+            self.stats.add_row(self.table, row)
+        timestamps = self.table.timestamps
+        timestamp = timestamps[row]
+        if not self._by_time or timestamp >= timestamps[self._by_time[-1]]:
+            # Usual case: results arrive in time order
+            self._by_time.append(row)
+        else:
+            position = bisect_right(self._by_time, timestamp, key=timestamps.__getitem__)
+            self._by_time.insert(position, row)
+
+    def next_id(self):
+        self.ensure_loaded()
+        return len(self.table) + 1
+
+    def __len__(self):
+        self.ensure_loaded()
+        return len(self.table)
+
+    # Queries used by the history page
+    def all_scores(self):
+        """All results, newest first"""
+        self.ensure_loaded()
+        return TableRows(self.table, self._by_time[::-1])
+
+    def between(self, start=None, end=None):
+        """Results with start <= time <= end, newest first
+
+        Bounds are datetimes or epoch seconds; None leaves a side open.
+        Served by binary search over the time index.
+        """
+        self.ensure_loaded()
+        if isinstance(start, datetime.datetime):
+            start_ts = start.timestamp()
+        else:
+            start_ts = start
+        if isinstance(end, datetime.datetime):
+            end_ts = end.timestamp()
+        else:
+            end_ts = end
+        key = self.table.timestamps.__getitem__
+        lo = 0 if start_ts is None else bisect_left(self._by_time, start_ts, key=key)
+        hi = len(self._by_time) if end_ts is None else bisect_right(self._by_time, end_ts, key=key)
+        return TableRows(self.table, self._by_time[lo:hi][::-1])
+
+    def last_days(self, days, now=None):
+        """Results from the last `days` days (7, 30, 90, ...), newest first"""
+        now = now or datetime.datetime.now()
+        return self.between(now - datetime.timedelta(days=days), None)
+
+    def top(self, limit=10):
+        """Best results by percentage"""
+        self.ensure_loaded()
+        if limit <= self.leaderboard.k:
+            return TableRows(self.table, self.leaderboard.top(limit))
+        percentages = self.table.percentages
+        rows = heapq.nlargest(limit, range(len(self.table)), key=percentages.__getitem__)
+        return TableRows(self.table, rows)
+
+    def player_stats(self, player):
+        """PlayerStats aggregates for a player, or None"""
+        self.ensure_loaded()
+        return self.stats.get(player)
+
+    def podium(self, limit=3):
+        """Best result of each player, top players first"""
+        self.ensure_loaded()
+        return TableRows(self.table, self.leaderboard.podium(limit))
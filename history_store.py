@@ -0,0 +1,276 @@
+import datetime
+import json
+import os
+import sqlite3
+from functools import lru_cache
+from question_bank import question_id
+
+DATE_FORMAT = "%Y-%m-%d %H:%M"
+
+
+@lru_cache(maxsize=65536)
+def parse_timestamp(date):
+    """Epoch seconds for a "YYYY-MM-DD HH:MM" history date (cached per minute)"""
+    try:
+        return datetime.datetime.strptime(date, DATE_FORMAT).timestamp()
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def record_answers(record):
+    """(question_id, selected_index, is_correct, time) per answered question
+
+    Reads the compact 'answers' lists, or the legacy 'answer_history'
+    dicts with their parallel 'question_times', whose questions are
+    identified by text the same way the question bank derives ids.
+    """
+    answers = record.get('answers')
+    if answers:
+        return [tuple(a) for a in answers if isinstance(a, (list, tuple)) and len(a) == 4]
+    times = record.get('question_times') or ()
+    category = record.get('category', '')
+    result = []
+    for index, entry in enumerate(record.get('answer_history') or ()):
+        if not isinstance(entry, dict):
+            continue
+        qid = question_id(category, {"question": entry.get('question_text', '')})
+        time_taken = times[index] if index < len(times) else 0
+        result.append((qid, entry.get('selected_index', -1), bool(entry.get('is_correct')), time_taken))
+    return result
+
+
+def normalize_record(record):
+    """Bring legacy history rows up to the current schema
+
+    Early versions stored the score as a "10/10" string, the time as
+    "m:ss" under 'time', and each answer as a dict with the question's
+    text and options under 'answer_history'. Returns a new dict in the
+    current layout.
+    """
+    record = dict(record)
+    score = record.get('score', 0)
+    if isinstance(score, str):
+        correct, _, total = score.partition('/')
+        try:
+            record['score'] = int(correct)
+            record['total'] = int(total) if total else record.get('total', 0)
+        except ValueError:
+            record['score'] = 0
+    record.setdefault('total', 0)
+    if 'time_formatted' not in record and 'time' in record:
+        record['time_formatted'] = record.pop('time')
+    if 'time_seconds' not in record:
+        minutes, _, seconds = str(record.get('time_formatted', '0:00')).partition(':')
+        try:
+            record['time_seconds'] = int(minutes) * 60 + int(seconds or 0)
+        except ValueError:
+            record['time_seconds'] = 0
+    if 'percentage' not in record:
+        total = record['total']
+        record['percentage'] = (record['score'] / total * 100) if total > 0 else 0
+    if 'timestamp' not in record:
+        record['timestamp'] = parse_timestamp(record.get('date', ''))
+    if 'answer_history' in record or 'question_times' in record:
+        # Question text, options and explanations stay in the bank
+        record['answers'] = [list(answer) for answer in record_answers(record)]
+        record.pop('answer_history', None)
+        record.pop('question_times', None)
+    return record
+
+
+class JsonlHistoryStore:
+    """Append-only quiz history log with one JSON record per line"""
+
+    # Rewrite the log once this many unreadable lines have piled up
+    COMPACT_THRESHOLD = 1
+
+    def __init__(self, path='quiz_history.jsonl', legacy_path='quiz_history.json'):
+        self.path = path
+        self.legacy_path = legacy_path
+        self.bad_lines = 0
+
+    def iter_records(self):
+        """Stream records from the log, skipping torn or corrupt lines"""
+        self.bad_lines = 0
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        self.bad_lines += 1
+        except FileNotFoundError:
+            return
+
+    def load(self):
+        """Load all records, migrating the legacy JSON file on first run"""
+        if not os.path.exists(self.path):
+            self.migrate_legacy()
+        records = list(self.iter_records())
+        if self.bad_lines >= self.COMPACT_THRESHOLD:
+            self.compact(records)
+        return records
+
+    def stream(self):
+        """Like load(), but yields records without holding them all"""
+        if not os.path.exists(self.path):
+            self.migrate_legacy()
+        yield from self.iter_records()
+        if self.bad_lines >= self.COMPACT_THRESHOLD:
+            self.compact()
+
+    def append(self, record):
+        """Append a single record"""
+        self.append_many([record])
+
+    def append_many(self, records):
+        """Append records with one write call and fsync them"""
+        if not records:
+            return
+        data = ''.join(
+            json.dumps(r, separators=(',', ':'), default=str) + '\n' for r in records
+        ).encode('utf-8')
+        # O_APPEND makes the write land at the end of the file atomically
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            self._repair_tail(fd)
+            os.write(fd, data)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def compact(self, records=None):
+        """Rewrite the log from valid records and atomically swap it in"""
+        if records is None:
+            records = self.iter_records()
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for record in records:
+                f.write(json.dumps(record, separators=(',', ':'), default=str) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        self.bad_lines = 0
+
+    def migrate_legacy(self):
+        """Convert the old indented quiz_history.json into the line log
+
+        Rows are normalized on the way, timestamp included, so later loads
+        do not have to parse their dates again.
+        """
+        try:
+            with open(self.legacy_path, 'r', encoding='utf-8') as f:
+                records = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        if isinstance(records, list):
+            self.compact(normalize_record(r) for r in records if isinstance(r, dict))
+
+    def _repair_tail(self, fd):
+        """Terminate a torn last line so the next record starts cleanly"""
+        size = os.fstat(fd).st_size
+        if size == 0:
+            return
+        with open(self.path, 'rb') as f:
+            f.seek(size - 1)
+            if f.read(1) != b'\n':
+                os.write(fd, b'\n')
+
+
+class SqliteHistoryStore:
+    """SQLite history backend
+
+    The history page is served from the repository's in-memory table, so
+    this store only loads, appends and migrates records.
+    """
+
+    def __init__(self, path='quiz_history.db', legacy_path='quiz_history.json',
+                 log_path='quiz_history.jsonl'):
+        self.path = path
+        self.legacy_path = legacy_path
+        self.log_path = log_path
+        is_new = not os.path.exists(path)
+        # Writes may come from a background writer thread (see server.py)
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self._create_schema()
+        if is_new:
+            self.migrate_legacy()
+
+    def _create_schema(self):
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS results (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                date TEXT NOT NULL,
+                player_name TEXT NOT NULL,
+                category TEXT NOT NULL,
+                score INTEGER NOT NULL,
+                total INTEGER NOT NULL,
+                percentage REAL NOT NULL,
+                time_seconds INTEGER NOT NULL,
+                data TEXT NOT NULL
+            );
+            -- Earlier versions queried the tabs from these; nothing does now
+            DROP INDEX IF EXISTS idx_results_date;
+            DROP INDEX IF EXISTS idx_results_percentage;
+            DROP INDEX IF EXISTS idx_results_player_percentage;
+        """)
+
+    def _row_values(self, record):
+        record = normalize_record(record)
+        return (
+            record.get('date', ''),
+            record.get('player_name', ''),
+            record.get('category', ''),
+            record['score'],
+            record['total'],
+            record['percentage'],
+            record['time_seconds'],
+            json.dumps(record, separators=(',', ':'), default=str),
+        )
+
+    def iter_records(self):
+        """Stream records in insertion order"""
+        for row in self.conn.execute("SELECT data FROM results ORDER BY id"):
+            yield json.loads(row['data'])
+
+    def load(self):
+        return list(self.iter_records())
+
+    def stream(self):
+        return self.iter_records()
+
+    def append(self, record):
+        self.append_many([record])
+
+    def append_many(self, records):
+        """Insert records in a single transaction"""
+        if not records:
+            return
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO results (date, player_name, category, score, total,"
+                " percentage, time_seconds, data) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [self._row_values(r) for r in records]
+            )
+
+    def compact(self, records=None):
+        self.conn.execute("VACUUM")
+
+    def migrate_legacy(self):
+        """Import the existing JSON log or legacy quiz_history.json"""
+        source = JsonlHistoryStore(self.log_path, self.legacy_path)
+        if os.path.exists(self.log_path):
+            records = list(source.iter_records())
+        else:
+            try:
+                with open(self.legacy_path, 'r', encoding='utf-8') as f:
+                    records = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                records = []
+        if isinstance(records, list):
+            # _row_values() normalizes each row, timestamp included
+            self.append_many([r for r in records if isinstance(r, dict)])
@@ -0,0 +1,102 @@
+import datetime
+from array import array
+from history_store import DATE_FORMAT
+
+
+class HistoryTable:
+    """Columnar, array-backed store for history summary rows
+
+    Each row costs a few dozen bytes: numbers live in typed arrays and
+    player and category names are interned to small integer ids. Per
+    question answers are not kept in memory; they stay in the store.
+    Rows are materialized as dicts only when asked for.
+    """
+
+    def __init__(self):
+        self.ids = array('i')
+        self.timestamps = array('d')
+        self.percentages = array('d')
+        self.scores = array('i')
+        self.totals = array('i')
+        self.time_seconds = array('i')
+        self.player_ids = array('i')
+        self.category_ids = array('i')
+        self.players = []
+        self.categories = []
+        self._player_index = {}
+        self._category_index = {}
+
+    def __len__(self):
+        return len(self.ids)
+
+    def _intern(self, value, values, index):
+        key = index.get(value)
+        if key is None:
+            key = len(values)
+            values.append(value)
+            index[value] = key
+        return key
+
+    def append(self, record):
+        """Add a normalized history record; returns its row number"""
+        row = len(self.ids)
+        self.ids.append(record.get('id') or row + 1)
+        self.timestamps.append(record['timestamp'])
+        self.percentages.append(record['percentage'])
+        self.scores.append(record['score'])
+        self.totals.append(record['total'])
+        self.time_seconds.append(record['time_seconds'])
+        self.player_ids.append(self._intern(record.get('player_name', ''), self.players, self._player_index))
+        self.category_ids.append(self._intern(record.get('category', ''), self.categories, self._category_index))
+        return row
+
+    def player_name(self, row):
+        return self.players[self.player_ids[row]]
+
+    def row(self, row):
+        """Materialize one row as a history record dict"""
+        timestamp = self.timestamps[row]
+        seconds = self.time_seconds[row]
+        if timestamp:
+            date = datetime.datetime.fromtimestamp(timestamp).strftime(DATE_FORMAT)
+        else:
+            date = ""
+        return {
+            'id': self.ids[row],
+            'date': date,
+            'timestamp': timestamp,
+            'player_name': self.players[self.player_ids[row]],
+            'category': self.categories[self.category_ids[row]],
+            'score': self.scores[row],
+            'total': self.totals[row],
+            'percentage': self.percentages[row],
+            'time_seconds': seconds,
+            'time_formatted': f"{seconds // 60}:{seconds % 60:02d}",
+        }
+
+
+class TableRows:
+    """Lazy sequence of table rows, materialized on indexing
+
+    Supports len(), indexing, slicing and iteration, which is all the
+    history views need to page through results.
+    """
+
+    def __init__(self, table, rows):
+        self.table = table
+        self.rows = rows
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return TableRows(self.table, self.rows[index])
+        return self.table.row(self.rows[index])
+
+    def __iter__(self):
+        for row in self.rows:
+            yield self.table.row(row)
+
+    def __bool__(self):
+        return len(self.rows) > 0
@@ -0,0 +1,228 @@
+import argparse
+import csv
+import json
+import math
+import sys
+from array import array
+from history_store import JsonlHistoryStore, SqliteHistoryStore, record_answers
+from models import COMPILED_QUESTIONS_PATH, HISTORY_LOG_PATH, QUESTIONS_PATH
+from question_bank import QuestionBank, open_compiled_bank
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Answers buffered before they are folded into the per-question totals
+CHUNK_SIZE = 65536
+# Option columns counted per question; the last column counts no answer
+MAX_OPTIONS = 8
+# Whole-second time bins 0..TIME_BINS-1, plus one for anything longer
+TIME_BINS = 61
+
+OPTION_COLUMNS = MAX_OPTIONS + 1
+TIME_COLUMNS = TIME_BINS + 1
+
+
+class ItemAnalysis:
+    """Per-question statistics over the answer history in one pass
+
+    Memory depends on the number of questions, not answers: each answer
+    is folded into fixed-size totals per question (responses, correct
+    answers, sums for the point-biserial, option counts and a time
+    histogram), a chunk at a time with numpy when it is installed.
+
+    The point-biserial correlates an answer's correctness with the
+    taker's score on the rest of that quiz (fraction correct), so the
+    item does not correlate with itself.
+    """
+
+    def __init__(self):
+        self.columns = {}
+        self.ids = []
+        # Totals per question column
+        self.responses = array('q')
+        self.correct = array('q')
+        self.rest_sum = array('d')
+        self.rest_sum_correct = array('d')
+        self.rest_sum_squares = array('d')
+        self.options = array('q')  # OPTION_COLUMNS per question
+        self.times = array('q')  # TIME_COLUMNS per question
+        self.clear_chunk()
+
+    def clear_chunk(self):
+        self.chunk_items = array('q')
+        self.chunk_correct = array('d')
+        self.chunk_rest = array('d')
+        self.chunk_options = array('q')
+        self.chunk_times = array('q')
+
+    def column(self, question_id):
+        column = self.columns.get(question_id)
+        if column is None:
+            column = self.columns[question_id] = len(self.ids)
+            self.ids.append(question_id)
+            for totals in (self.responses, self.correct):
+                totals.append(0)
+            for totals in (self.rest_sum, self.rest_sum_correct, self.rest_sum_squares):
+                totals.append(0.0)
+            self.options.extend([0] * OPTION_COLUMNS)
+            self.times.extend([0] * TIME_COLUMNS)
+        return column
+
+    def add_record(self, record):
+        """Add the answers of one history record"""
+        answers = record_answers(record)
+        if not answers:
+            return
+        count = len(answers)
+        score = sum(1 for a in answers if a[2])
+        for question_id, selected_index, is_correct, time_taken in answers:
+            rest = (score - (1 if is_correct else 0)) / (count - 1) if count > 1 else 0.0
+            self.chunk_items.append(self.column(question_id))
+            self.chunk_correct.append(1.0 if is_correct else 0.0)
+            self.chunk_rest.append(rest)
+            if not isinstance(selected_index, int) or not 0 <= selected_index < MAX_OPTIONS:
+                selected_index = MAX_OPTIONS
+            self.chunk_options.append(selected_index)
+            self.chunk_times.append(min(max(int(round(time_taken or 0)), 0), TIME_BINS))
+        if len(self.chunk_items) >= CHUNK_SIZE:
+            self.flush()
+
+    def add_records(self, records):
+        for record in records:
+            self.add_record(record)
+        self.flush()
+        return self
+
+    def flush(self):
+        """Fold the buffered chunk into the totals"""
+        if not self.chunk_items:
+            return
+        if np is not None:
+            self.flush_vectorized()
+        else:
+            self.flush_loop()
+        self.clear_chunk()
+
+    def flush_vectorized(self):
+        size = len(self.ids)
+        items = np.frombuffer(self.chunk_items, dtype=np.int64)
+        correct = np.frombuffer(self.chunk_correct, dtype=np.float64)
+        rest = np.frombuffer(self.chunk_rest, dtype=np.float64)
+        options = np.frombuffer(self.chunk_options, dtype=np.int64)
+        times = np.frombuffer(self.chunk_times, dtype=np.int64)
+
+        np.frombuffer(self.responses, dtype=np.int64)[:] += np.bincount(items, minlength=size)
+        np.frombuffer(self.correct, dtype=np.int64)[:] += np.bincount(items, correct, size).astype(np.int64)
+        np.frombuffer(self.rest_sum, dtype=np.float64)[:] += np.bincount(items, rest, size)
+        np.frombuffer(self.rest_sum_correct, dtype=np.float64)[:] += np.bincount(items, rest * correct, size)
+        np.frombuffer(self.rest_sum_squares, dtype=np.float64)[:] += np.bincount(items, rest * rest, size)
+        np.frombuffer(self.options, dtype=np.int64)[:] += np.bincount(
+            items * OPTION_COLUMNS + options, minlength=size * OPTION_COLUMNS)
+        np.frombuffer(self.times, dtype=np.int64)[:] += np.bincount(
+            items * TIME_COLUMNS + times, minlength=size * TIME_COLUMNS)
+
+    def flush_loop(self):
+        for item, correct, rest, option, seconds in zip(
+                self.chunk_items, self.chunk_correct, self.chunk_rest,
+                self.chunk_options, self.chunk_times):
+            self.responses[item] += 1
+            self.correct[item] += int(correct)
+            self.rest_sum[item] += rest
+            self.rest_sum_correct[item] += rest * correct
+            self.rest_sum_squares[item] += rest * rest
+            self.options[item * OPTION_COLUMNS + option] += 1
+            self.times[item * TIME_COLUMNS + seconds] += 1
+
+    # Results
+    def point_biserial(self, column):
+        n = self.responses[column]
+        k = self.correct[column]
+        if n == 0 or k == 0 or k == n:
+            return None
+        mean = self.rest_sum[column] / n
+        variance = self.rest_sum_squares[column] / n - mean * mean
+        if variance <= 1e-12:
+            return None
+        mean_correct = self.rest_sum_correct[column] / k
+        mean_wrong = (self.rest_sum[column] - self.rest_sum_correct[column]) / (n - k)
+        p = k / n
+        return (mean_correct - mean_wrong) / math.sqrt(variance) * math.sqrt(p * (1 - p))
+
+    def median_time(self, column):
+        """Median answer time in whole seconds, from the histogram"""
+        start = column * TIME_COLUMNS
+        half = self.responses[column] / 2
+        seen = 0
+        for seconds in range(TIME_COLUMNS):
+            seen += self.times[start + seconds]
+            if seen >= half:
+                return f"{seconds}+" if seconds == TIME_BINS else str(seconds)
+        return ""
+
+    def rows(self, bank=None):
+        """One dict per question, in the order questions were first seen"""
+        for column, question_id in enumerate(self.ids):
+            question = bank.get_by_id(question_id) if bank is not None else None
+            n = self.responses[column]
+            start = column * OPTION_COLUMNS
+            option_count = len(question.get("options", [])) if question else MAX_OPTIONS
+            rpb = self.point_biserial(column)
+            yield {
+                "question_id": question_id,
+                "question": question.get("question", "") if question else "",
+                "responses": n,
+                "p_value": round(100 * self.correct[column] / n, 1) if n else "",
+                "point_biserial": "" if rpb is None else round(rpb, 3),
+                "option_counts": "/".join(str(self.options[start + i]) for i in range(min(option_count, MAX_OPTIONS))),
+                "no_answer": self.options[start + MAX_OPTIONS],
+                "median_time": self.median_time(column),
+            }
+
+    def write_csv(self, out, bank=None):
+        fields = ["question_id", "question", "responses", "p_value", "point_biserial",
+                  "option_counts", "no_answer", "median_time"]
+        writer = csv.DictWriter(out, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(self.rows(bank))
+
+
+def load_bank():
+    """Question bank for question texts, or None if unavailable"""
+    bank = open_compiled_bank(COMPILED_QUESTIONS_PATH, QUESTIONS_PATH)
+    if bank is not None:
+        return bank
+    try:
+        with open(QUESTIONS_PATH, 'r', encoding='utf-8') as f:
+            return QuestionBank(json.load(f))
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-question statistics from the quiz history")
+    parser.add_argument("history", nargs="?", default=HISTORY_LOG_PATH,
+                        help="history log (.jsonl), database (.db) or legacy quiz_history.json")
+    parser.add_argument("-o", "--output", help="CSV file (default: stdout)")
+    args = parser.parse_args()
+
+    if args.history.endswith(".db"):
+        records = SqliteHistoryStore(args.history, legacy_path="", log_path="").iter_records()
+    elif args.history.endswith(".json"):
+        with open(args.history, 'r', encoding='utf-8') as f:
+            records = [r for r in json.load(f) if isinstance(r, dict)]
+    else:
+        records = JsonlHistoryStore(args.history, legacy_path="").iter_records()
+    analysis = ItemAnalysis().add_records(records)
+    bank = load_bank()
+    if args.output:
+        with open(args.output, 'w', newline='', encoding='utf-8') as f:
+            analysis.write_csv(f, bank)
+        print(f"Wrote {len(analysis.ids)} questions to {args.output}")
+    else:
+        analysis.write_csv(sys.stdout, bank)
+
+
+if __name__ == "__main__":
+    main()
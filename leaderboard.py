@@ -0,0 +1,68 @@
+import heapq
+
+
+class Leaderboard:
+    """Incrementally maintained Top-K results and per-player bests
+
+    Only history table row numbers are kept, so the leaderboard holds no
+    record dicts; callers materialize the rows they read. add() costs
+    O(log K) for the top-K heap and amortized O(log P) for the player ranking
+    (P = number of players). The ranking is a heap whose entries go
+    stale when a player improves; stale entries are skipped when read
+    and dropped once they outnumber the live ones. Ties keep the
+    earlier row first, matching a stable sort of the history by
+    percentage.
+    """
+
+    def __init__(self, k=10):
+        self.k = k
+        self._count = 0
+        # Min-heap of (percentage, -row): the root is evicted first
+        self._top = []
+        # player -> (percentage, row) of their best result
+        self._best = {}
+        # Min-heap of (-percentage, row, player), best player first
+        self._ranking = []
+
+    def __len__(self):
+        return self._count
+
+    def add(self, row, percentage, player):
+        """Add table row `row`; rows must be added in increasing order"""
+        self._count += 1
+
+        entry = (percentage, -row)
+        if len(self._top) < self.k:
+            heapq.heappush(self._top, entry)
+        elif entry > self._top[0]:
+            heapq.heapreplace(self._top, entry)
+
+        best = self._best.get(player)
+        if best is None or percentage > best[0]:
+            self._best[player] = (percentage, row)
+            heapq.heappush(self._ranking, (-percentage, row, player))
+            if len(self._ranking) > 2 * len(self._best):
+                self._ranking = [(-best[0], best[1], name) for name, best in self._best.items()]
+                heapq.heapify(self._ranking)
+
+    def top(self, limit=None):
+        """Rows of the best results by percentage, at most K"""
+        limit = self.k if limit is None else min(limit, self.k)
+        return [-neg_row for _, neg_row in sorted(self._top, reverse=True)[:limit]]
+
+    def podium(self, limit=3):
+        """Rows of the best result of each of the top `limit` players"""
+        heap = self._ranking
+        picked = []
+        while heap and len(picked) < limit:
+            entry = heapq.heappop(heap)
+            neg_percentage, row, player = entry
+            if self._best[player] == (-neg_percentage, row):
+                picked.append(entry)
+        for entry in picked:
+            heapq.heappush(heap, entry)
+        return [row for _, row, _ in picked]
+
+    def player_best(self, player):
+        best = self._best.get(player)
+        return best[1] if best else None
@@ -0,0 +1,234 @@
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+from engine import QuizEngine, DEFAULT_EXPIRED_TIME
+from history_store import JsonlHistoryStore, SqliteHistoryStore
+from models import QuizModel
+
+
+class VirtualClock:
+    """Simulated wall clock advanced by the players' think times"""
+
+    def __init__(self, start=None):
+        self.now = time.time() if start is None else start
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+class HeadlessController:
+    """Stand-in for QuizController's quiz flow without any Tk widgets"""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.session = None
+
+    def select_category(self, player_name, category):
+        self.session = self.engine.start_session(player_name, category)
+
+    def has_question(self):
+        return self.engine.get_question(self.session) is not None
+
+    def correct_index(self):
+        return self.engine.model.get_correct_index(self.engine.get_question(self.session))
+
+    def submit_answer(self, selected_index, question_time=None):
+        self.engine.submit_answer(self.session, selected_index, question_time)
+        self.engine.advance(self.session)
+
+    def time_expired(self):
+        self.engine.time_expired(self.session)
+        self.engine.advance(self.session)
+
+    def show_results(self):
+        return self.engine.finish(self.session, save=False)
+
+    def _save_quiz_result(self, result):
+        """The writes of engine.finish(save=True): review log, then history"""
+        self.engine.model.reviews.flush()
+        if self.engine.should_save(result):
+            self.engine.model.add_quiz_result(result)
+
+
+def think_time(rng, distribution, mean):
+    """Seconds a simulated player spends on one question"""
+    if distribution == "fixed":
+        return mean
+    if distribution == "uniform":
+        return rng.uniform(0, 2 * mean)
+    return rng.expovariate(1 / mean)
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class LoadTest:
+    """Drive N simulated players through the quiz flow and time each step
+
+    Players are interleaved one step at a time, the way concurrent takers
+    would share a server. Think time only moves a virtual clock, so the
+    numbers measure the application's own hot paths.
+    """
+
+    OPERATIONS = ("select_category", "submit_answer", "time_expired",
+                  "show_results", "_save_quiz_result")
+
+    def __init__(self, players=50, quizzes=10, accuracy=0.7, timeout_rate=0.05,
+                 think="exponential", think_mean=8.0, backend="jsonl",
+                 write_bucket=500, seed=None, workdir=None):
+        self.players = players
+        self.quizzes = quizzes
+        self.accuracy = accuracy
+        self.timeout_rate = timeout_rate
+        self.think = think
+        self.think_mean = think_mean
+        self.write_bucket = write_bucket
+        self.rng = random.Random(seed)
+        self.workdir = workdir or tempfile.mkdtemp(prefix="quiz-loadtest-")
+        if backend == "sqlite":
+            store = SqliteHistoryStore(os.path.join(self.workdir, "history.db"),
+                                       legacy_path="", log_path="")
+        else:
+            store = JsonlHistoryStore(os.path.join(self.workdir, "history.jsonl"), legacy_path="")
+        self.clock = VirtualClock()
+        self.engine = QuizEngine(QuizModel(history_store=store,
+                                           review_path=os.path.join(self.workdir, "reviews.jsonl")),
+                                 clock=self.clock)
+        self.categories = [c for c in self.engine.model.get_categories()
+                           if self.engine.model.get_total_questions(c) > 0]
+        self.latencies = {op: [] for op in self.OPERATIONS}
+        self.write_costs = []  # (history size before the write, seconds)
+
+    def timed(self, operation, func, *args):
+        start = time.perf_counter()
+        value = func(*args)
+        self.latencies[operation].append(time.perf_counter() - start)
+        return value
+
+    def step(self, player):
+        """Advance one simulated player by one action; False when done"""
+        controller = player["controller"]
+        if controller.session is None:
+            if player["remaining"] == 0:
+                return False
+            player["remaining"] -= 1
+            self.timed("select_category", controller.select_category,
+                       player["name"], self.rng.choice(self.categories))
+            return True
+
+        if controller.has_question():
+            if self.rng.random() < self.timeout_rate:
+                self.clock.advance(DEFAULT_EXPIRED_TIME)
+                self.timed("time_expired", controller.time_expired)
+            else:
+                seconds = think_time(self.rng, self.think, self.think_mean)
+                self.clock.advance(seconds)
+                correct = controller.correct_index()
+                if self.rng.random() < self.accuracy:
+                    selected = correct
+                else:
+                    selected = self.rng.choice([i for i in range(4) if i != correct])
+                self.timed("submit_answer", controller.submit_answer, selected, int(seconds))
+            return True
+
+        result = self.timed("show_results", controller.show_results)
+        history_size = len(self.engine.model.history)
+        start = time.perf_counter()
+        controller._save_quiz_result(result)
+        elapsed = time.perf_counter() - start
+        self.latencies["_save_quiz_result"].append(elapsed)
+        self.write_costs.append((history_size, elapsed))
+        controller.session = None
+        return True
+
+    def run(self):
+        active = [
+            {"name": f"player{i}", "remaining": self.quizzes,
+             "controller": HeadlessController(self.engine)}
+            for i in range(self.players)
+        ]
+        start = time.perf_counter()
+        while active:
+            player = self.rng.choice(active)
+            if not self.step(player):
+                active.remove(player)
+        return self.report(time.perf_counter() - start)
+
+    def report(self, elapsed):
+        operations = {}
+        total_ops = 0
+        for op, samples in self.latencies.items():
+            samples = sorted(samples)
+            total_ops += len(samples)
+            operations[op] = {
+                "count": len(samples),
+                "p50_ms": percentile(samples, 0.50) * 1000,
+                "p95_ms": percentile(samples, 0.95) * 1000,
+                "p99_ms": percentile(samples, 0.99) * 1000,
+            }
+        buckets = {}
+        for size, seconds in self.write_costs:
+            buckets.setdefault(size // self.write_bucket * self.write_bucket, []).append(seconds)
+        write_cost = [
+            {"history_size": size, "writes": len(values),
+             "mean_ms": sum(values) / len(values) * 1000}
+            for size, values in sorted(buckets.items())
+        ]
+        return {
+            "elapsed_s": elapsed,
+            "operations_per_s": total_ops / elapsed if elapsed else 0.0,
+            "quizzes_per_s": len(self.write_costs) / elapsed if elapsed else 0.0,
+            "operations": operations,
+            "history_write_cost": write_cost,
+        }
+
+
+def print_report(report):
+    print(f"Elapsed: {report['elapsed_s']:.2f}s  "
+          f"({report['operations_per_s']:.0f} ops/s, {report['quizzes_per_s']:.1f} quizzes/s)")
+    print(f"{'operation':<20}{'count':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for op, stats in report["operations"].items():
+        print(f"{op:<20}{stats['count']:>8}{stats['p50_ms']:>10.3f}"
+              f"{stats['p95_ms']:>10.3f}{stats['p99_ms']:>10.3f}")
+    print("History write cost by history size:")
+    for bucket in report["history_write_cost"]:
+        print(f"  {bucket['history_size']:>8}+  {bucket['writes']:>6} writes  {bucket['mean_ms']:.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate concurrent quiz takers")
+    parser.add_argument("--players", type=int, default=50)
+    parser.add_argument("--quizzes", type=int, default=10, help="quizzes per player")
+    parser.add_argument("--accuracy", type=float, default=0.7)
+    parser.add_argument("--timeout-rate", type=float, default=0.05)
+    parser.add_argument("--think", choices=["fixed", "uniform", "exponential"], default="exponential")
+    parser.add_argument("--think-mean", type=float, default=8.0, help="mean seconds per question")
+    parser.add_argument("--backend", choices=["jsonl", "sqlite"], default="jsonl")
+    parser.add_argument("--write-bucket", type=int, default=500)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--json", help="also write the report to this file")
+    args = parser.parse_args()
+
+    test = LoadTest(players=args.players, quizzes=args.quizzes, accuracy=args.accuracy,
+                    timeout_rate=args.timeout_rate, think=args.think,
+                    think_mean=args.think_mean, backend=args.backend,
+                    write_bucket=args.write_bucket, seed=args.seed)
+    report = test.run()
+    print_report(report)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,41 @@
 import json
 import os
+from collections import namedtuple
+from history_store import JsonlHistoryStore, SqliteHistoryStore
+from history_repository import HistoryRepository
+from categories import CategoryCatalog
+from question_bank import QuestionBank, open_compiled_bank
+from spaced_repetition import ReviewScheduler
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+QUESTIONS_PATH = os.path.join(BASE_DIR, 'questions.json')
+# Built by `python question_bank.py`; used when present and up to date
+COMPILED_QUESTIONS_PATH = os.path.join(BASE_DIR, 'questions.qbank')
+# Optional descriptions, emojis and colors by category name
+CATEGORIES_PATH = os.path.join(BASE_DIR, 'categories.json')
+# "mapped" memory-maps the compiled bank, "compiled" reads it into memory
+QUESTION_BANK_BACKEND = "mapped"
+
+# Spaced-repetition schedule of wrongly answered questions
+REVIEW_LOG_PATH = os.path.join(BASE_DIR, 'review_schedule.jsonl')
+
+# "jsonl" for the append-only log, "sqlite" for the database
+HISTORY_BACKEND = "jsonl"
+# History files live next to the app, whatever the working directory
+HISTORY_LOG_PATH = os.path.join(BASE_DIR, 'quiz_history.jsonl')
+HISTORY_DB_PATH = os.path.join(BASE_DIR, 'quiz_history.db')
+# Written by early versions; migrated into the current store on first run
+LEGACY_HISTORY_PATH = os.path.join(BASE_DIR, 'quiz_history.json')
+
+# Pick each next question with the adaptive (Rasch) selector; needs numpy
+ADAPTIVE_MODE = False
+
+# One answered question; serialized as a plain list in history
+Answer = namedtuple("Answer", ["question_id", "selected_index", "is_correct", "time"])
 
 class Player:
+    __slots__ = ("name", "category", "score", "current_question_index")
+
     def __init__(self):
         self.name = ""
         self.category = ""
@@ -34,15 +68,26 @@ class Player:
         self.current_question_index += 1
 
 class QuizModel:
-    def __init__(self):
+    def __init__(self, history_store=None, review_path=REVIEW_LOG_PATH):
         self.player = Player()
-        self.questions_data = self.load_questions()
-        self.quiz_history = self.load_quiz_history()
-        self.answer_history = []  # NEW: Store answer history
+        self.question_bank = self.load_question_bank()
+        self.categories = CategoryCatalog(self.question_bank, CATEGORIES_PATH)
+        if history_store is None:
+            history_store = self.create_history_store(HISTORY_BACKEND)
+        self.history = HistoryRepository(history_store)
+        self.reviews = ReviewScheduler(review_path)
+    
+    def load_question_bank(self):
+        """Compiled question bank if available, otherwise questions.json"""
+        bank = open_compiled_bank(COMPILED_QUESTIONS_PATH, QUESTIONS_PATH,
+                                  mapped=QUESTION_BANK_BACKEND == "mapped")
+        if bank is None:
+            bank = QuestionBank(self.load_questions())
+        return bank
     
     def load_questions(self):
         try:
-            with open('questions.json', 'r') as f:
+            with open(QUESTIONS_PATH, 'r') as f:
                 return json.load(f)
         except FileNotFoundError:
             print("Error: questions.json not found")
@@ -51,87 +96,75 @@ class QuizModel:
             print("Error: Invalid JSON in questions.json")
             return {}
     
-    def get_current_question(self, category):
-        """Get current question for the selected category"""
-        if category in self.questions_data:
-            questions = self.questions_data[category]
-            if 0 <= self.player.current_question_index < len(questions):
-                return questions[self.player.current_question_index]
-        return None
+    def get_categories(self):
+        """Category names in bank order"""
+        return self.question_bank.categories()
+    
+    def get_question(self, category, index):
+        """Get the question at index in a category, or None"""
+        return self.question_bank.get(category, index)
+    
+    def get_question_ids(self, category):
+        """Ids of a category's questions in bank order, without decoding them"""
+        return self.question_bank.ids(category)
+    
+    def get_question_by_id(self, question_id):
+        """Get a question by its stable id, or None"""
+        return self.question_bank.get_by_id(question_id)
+    
+    @staticmethod
+    def get_correct_index(question):
+        """Correct option index; handles both "answer" and "correct_answer" keys"""
+        if "answer" in question:
+            return question["answer"]
+        elif "correct_answer" in question:
+            return question["correct_answer"]
+        return -1
     
     def get_all_questions(self, category):
-        """Get all questions for a category - NEW METHOD"""
-        if category in self.questions_data:
-            return self.questions_data[category]
-        return []
+        """Get all questions for a category"""
+        return self.question_bank.get_all(category)
     
     def get_total_questions(self, category):
         """Get total number of questions for a category"""
-        if category in self.questions_data:
-            return len(self.questions_data[category])
-        return 0
-    
-    def check_answer(self, category, selected_index):
-        """Check if selected answer is correct and update score"""
-        current_question = self.get_current_question(category)
-        if current_question:
-            # Get correct answer index
-            if "answer" in current_question:
-                correct_index = current_question["answer"]
-            elif "correct_answer" in current_question:
-                correct_index = current_question["correct_answer"]
-            else:
-                correct_index = -1
-            
-            is_correct = selected_index == correct_index
-            
-            # Update score if correct
-            if is_correct and selected_index != -1:
-                self.player.increment_score()
-            
-            # Store answer in history - ENHANCED
-            answer_data = {
+        return self.question_bank.count(category)
+    
+    def resolve_answers(self, answers):
+        """Expand compact answer tuples for review
+
+        Returns (questions, details): the question dicts from the bank and
+        per-answer dicts with selected/correct index, correctness and time.
+        """
+        questions = []
+        details = []
+        for question_id, selected_index, is_correct, time_taken in answers:
+            question = self.get_question_by_id(question_id)
+            if question is None:
+                continue
+            questions.append(question)
+            details.append({
                 "selected_index": selected_index,
-                "correct_index": correct_index,
+                "correct_index": self.get_correct_index(question),
                 "is_correct": is_correct,
-                "question_index": self.player.current_question_index,
-                "question_text": current_question.get("question", ""),
-                "options": current_question.get("options", []),
-                "explanation": current_question.get("explanation", "")
-            }
-            
-            # Add to history
-            self.answer_history.append(answer_data)
-            
-            return is_correct
-        return False
-    
-    def get_answer_history(self):
-        """Get the answer history"""
-        return self.answer_history
-    
-    def next_question(self):
-        """Move to next question"""
-        self.player.next_question()
-    
-    def load_quiz_history(self):
-        """Load quiz history from file"""
-        try:
-            with open('quiz_history.json', 'r') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            return []
-        except json.JSONDecodeError:
-            return []
-    
-    def save_quiz_history(self):
-        """Save quiz history to file"""
-        try:
-            with open('quiz_history.json', 'w') as f:
-                json.dump(self.quiz_history, f, indent=2)
-        except Exception as e:
-            print(f"Error saving quiz history: {e}")
-    
-    def clear_answer_history(self):
-        """Clear answer history for new quiz"""
-        self.answer_history = []
\ No newline at end of file
+                "time": time_taken
+            })
+        return questions, details
+    
+    def create_history_store(self, backend):
+        """Create the configured history storage backend"""
+        if backend == "sqlite":
+            return SqliteHistoryStore(HISTORY_DB_PATH, LEGACY_HISTORY_PATH, HISTORY_LOG_PATH)
+        return JsonlHistoryStore(HISTORY_LOG_PATH, LEGACY_HISTORY_PATH)
+    
+    @property
+    def quiz_history(self):
+        """List of past quiz results, owned by the history repository"""
+        return self.history.records
+    
+    def get_player_stats(self, player_name):
+        """Aggregates for a player (attempts, best, averages, accuracy), or None"""
+        return self.history.player_stats(player_name)
+    
+    def add_quiz_result(self, quiz_result):
+        """Record a finished quiz; the repository persists and notifies views"""
+        self.history.add(quiz_result)
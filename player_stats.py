@@ -0,0 +1,171 @@
+import json
+import os
+import threading
+
+
+class PlayerStats:
+    """Running totals for one player; averages are derived in O(1)"""
+
+    __slots__ = ("player", "attempts", "best_percentage", "total_percentage",
+                 "total_seconds", "correct", "questions", "categories")
+
+    def __init__(self, player):
+        self.player = player
+        self.attempts = 0
+        self.best_percentage = 0.0
+        self.total_percentage = 0.0
+        self.total_seconds = 0
+        self.correct = 0
+        self.questions = 0
+        # category -> [attempts, correct, questions]
+        self.categories = {}
+
+    def add(self, category, score, total, percentage, seconds):
+        self.attempts += 1
+        self.best_percentage = max(self.best_percentage, percentage)
+        self.total_percentage += percentage
+        self.total_seconds += seconds
+        self.correct += score
+        self.questions += total
+        totals = self.categories.get(category)
+        if totals is None:
+            totals = self.categories[category] = [0, 0, 0]
+        totals[0] += 1
+        totals[1] += score
+        totals[2] += total
+
+    @property
+    def average_percentage(self):
+        return self.total_percentage / self.attempts if self.attempts else 0.0
+
+    @property
+    def average_time(self):
+        return self.total_seconds / self.attempts if self.attempts else 0.0
+
+    def accuracy(self, category=None):
+        """Percent of questions answered correctly, overall or in a category"""
+        if category is None:
+            correct, questions = self.correct, self.questions
+        else:
+            _, correct, questions = self.categories.get(category, (0, 0, 0))
+        return correct / questions * 100 if questions else 0.0
+
+    def to_dict(self):
+        return {
+            "player": self.player,
+            "attempts": self.attempts,
+            "best_percentage": self.best_percentage,
+            "total_percentage": self.total_percentage,
+            "total_seconds": self.total_seconds,
+            "correct": self.correct,
+            "questions": self.questions,
+            "categories": {name: list(totals) for name, totals in self.categories.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        stats = cls(data["player"])
+        for key in cls.__slots__[1:]:
+            setattr(stats, key, data[key])
+        return stats
+
+
+class PlayerStatsCache:
+    """Per-player aggregates kept up to date as results are added
+
+    A snapshot is saved next to the history every few results, together
+    with how many history records it covers and the timestamp of the last
+    one, so the history repository can catch it up with later records on
+    load, or rebuild it when it no longer matches the log.
+
+    The snapshot may be written from another thread than the one adding
+    results; the lock keeps the copied aggregates and watermark in step.
+    """
+
+    # Results added between snapshot writes
+    SAVE_INTERVAL = 20
+
+    def __init__(self, path=None):
+        self.path = path
+        self.players = {}
+        self.records = 0  # History records included
+        self.last_timestamp = None
+        self.unsaved = 0
+        self.lock = threading.Lock()
+
+    def get(self, player):
+        return self.players.get(player)
+
+    def __len__(self):
+        return len(self.players)
+
+    def add_row(self, table, row):
+        """Add row `row` of a HistoryTable"""
+        self.add_values(table.players[table.player_ids[row]],
+                        table.categories[table.category_ids[row]],
+                        table.scores[row], table.totals[row], table.percentages[row],
+                        table.time_seconds[row], table.timestamps[row])
+
+    def add_values(self, player, category, score, total, percentage, seconds, timestamp):
+        with self.lock:
+            stats = self.players.get(player)
+            if stats is None:
+                stats = self.players[player] = PlayerStats(player)
+            stats.add(category, score, total, percentage, seconds)
+            self.records += 1
+            self.last_timestamp = timestamp
+            self.unsaved += 1
+
+    def clear(self):
+        self.players = {}
+        self.records = 0
+        self.last_timestamp = None
+
+    def rebuild(self, table):
+        """Recompute every player's aggregates from a HistoryTable"""
+        self.clear()
+        for row in range(len(table)):
+            self.add_row(table, row)
+        self.save()
+
+    def load(self):
+        """Read the snapshot, if any"""
+        if not self.path:
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.players = {name: PlayerStats.from_dict(p) for name, p in data["players"].items()}
+            self.records = data["records"]
+            self.last_timestamp = data["last_timestamp"]
+        except FileNotFoundError:
+            self.clear()
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"Warning: rebuilding player statistics: {e}")
+            self.clear()
+        self.unsaved = 0
+
+    def save(self):
+        """Write the snapshot atomically"""
+        if not self.path:
+            return
+        with self.lock:
+            data = {
+                "records": self.records,
+                "last_timestamp": self.last_timestamp,
+                "players": {name: stats.to_dict() for name, stats in self.players.items()},
+            }
+            unsaved = self.unsaved
+        tmp_path = self.path + '.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, separators=(',', ':'))
+            os.replace(tmp_path, self.path)
+            with self.lock:
+                self.unsaved -= unsaved
+        except OSError as e:
+            print(f"Error saving player statistics: {e}")
+
+    def save_if_due(self):
+        if self.unsaved >= self.SAVE_INTERVAL:
+            self.save()
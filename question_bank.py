@@ -0,0 +1,304 @@
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import pickle
+import struct
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from collections.abc import Sequence
+
+# Compiled bank layout: header (MAGIC, sha256 of the source JSON, question
+# count, index offset and length), then 8-byte aligned sections:
+#   offsets     N+1 uint64 blob offsets, in category order
+#   id_order    N uint64 question positions, sorted by id
+#   id_offsets  N+1 uint64 offsets into ids
+#   ids         utf-8 ids, sorted
+#   blobs       one pickled question each
+# and finally a small pickled index with the categories and section starts.
+MAGIC = b"QBANK002"
+HEADER = struct.Struct("<8s32sQQQ")
+
+# Decoded questions kept by a memory-mapped bank
+QUESTION_CACHE_SIZE = 1024
+
+
+def question_id(category, question):
+    """Stable id for a question
+
+    Uses the question's own "id" field when present, otherwise the
+    category plus a hash of the question text, so ids survive reordering.
+    """
+    if "id" in question:
+        return str(question["id"])
+    digest = hashlib.sha1(question.get("question", "").encode("utf-8")).hexdigest()[:10]
+    return f"{category}-{digest}"
+
+
+class QuestionBank:
+    """Question bank indexed by category and by stable question id"""
+
+    def __init__(self, data):
+        self.data = data
+        self.by_id = {}
+        for category, questions in data.items():
+            for index, question in enumerate(questions):
+                qid = question_id(category, question)
+                if qid in self.by_id:
+                    qid = f"{qid}-{index}"
+                question["id"] = qid
+                self.by_id[qid] = question
+
+    def categories(self):
+        return list(self.data)
+
+    def count(self, category):
+        return len(self.data.get(category, ()))
+
+    def get(self, category, index):
+        """Question at index in category, or None"""
+        questions = self.data.get(category)
+        if questions is not None and 0 <= index < len(questions):
+            return questions[index]
+        return None
+
+    def get_all(self, category):
+        return self.data.get(category, [])
+
+    def ids(self, category):
+        """Question ids of a category, in bank order"""
+        return [question["id"] for question in self.data.get(category, ())]
+
+    def get_by_id(self, qid):
+        return self.by_id.get(qid)
+
+
+class CompiledQuestionBank:
+    """Question bank read from a compiled file, decoding questions on demand
+
+    Opening reads the file and the small index only; a question is
+    unpickled the first time it is asked for. Blob offsets and the id
+    table are read in place, so no per-question objects are built.
+    """
+
+    def __init__(self, path):
+        self.buffer = self.open_buffer(path)
+        self.open_index()
+        self.cache = {}
+
+    def open_buffer(self, path):
+        with open(path, 'rb') as f:
+            return f.read()
+
+    def open_index(self):
+        magic, self.source_hash, self.size, index_offset, index_length = \
+            HEADER.unpack_from(self.buffer)
+        if magic != MAGIC:
+            raise ValueError("unsupported format, recompile it")
+        index = pickle.loads(self.buffer[index_offset:index_offset + index_length])
+        self.ranges = {name: (first, count) for name, first, count in index["categories"]}
+        sections = index["sections"]
+        view = memoryview(self.buffer)
+        self.offsets = self.section(view, sections["offsets"], self.size + 1)
+        self.id_order = self.section(view, sections["id_order"], self.size)
+        self.id_offsets = self.section(view, sections["id_offsets"], self.size + 1)
+        self.ids_start = sections["ids"]
+        self.blob_start = sections["blobs"]
+
+    @staticmethod
+    def section(view, start, count):
+        return view[start:start + count * 8].cast('Q')
+
+    def load(self, position):
+        start = self.blob_start + self.offsets[position]
+        end = self.blob_start + self.offsets[position + 1]
+        return pickle.loads(self.buffer[start:end])
+
+    def decode(self, position):
+        question = self.cache.get(position)
+        if question is None:
+            question = self.cache[position] = self.load(position)
+        return question
+
+    def id_at(self, rank):
+        """Question id at rank in sorted id order"""
+        start = self.ids_start + self.id_offsets[rank]
+        end = self.ids_start + self.id_offsets[rank + 1]
+        return self.buffer[start:end].decode('utf-8')
+
+    def categories(self):
+        return list(self.ranges)
+
+    def count(self, category):
+        return self.ranges.get(category, (0, 0))[1]
+
+    def get(self, category, index):
+        """Question at index in category, or None"""
+        first, count = self.ranges.get(category, (0, 0))
+        if 0 <= index < count:
+            return self.decode(first + index)
+        return None
+
+    def get_all(self, category):
+        """Questions of a category, decoded as they are accessed"""
+        first, count = self.ranges.get(category, (0, 0))
+        return QuestionList(self, first, count)
+
+    def ids(self, category):
+        """Question ids of a category in bank order, read from the id
+        table without decoding any question"""
+        first, count = self.ranges.get(category, (0, 0))
+        ids = [None] * count
+        for rank, position in enumerate(self.id_order):
+            if first <= position < first + count:
+                ids[position - first] = self.id_at(rank)
+        return ids
+
+    def get_by_id(self, qid):
+        """Binary search of the sorted id table"""
+        rank = bisect_left(range(self.size), qid, key=self.id_at)
+        if rank < self.size and self.id_at(rank) == qid:
+            return self.decode(self.id_order[rank])
+        return None
+
+
+class MappedQuestionBank(CompiledQuestionBank):
+    """Compiled question bank backed by mmap with an LRU of hot questions
+
+    Only pages that are touched get read, and at most cache_size decoded
+    questions are kept, so memory stays flat as the bank grows.
+    """
+
+    def __init__(self, path, cache_size=QUESTION_CACHE_SIZE):
+        super().__init__(path)
+        self.cache = OrderedDict()
+        self.cache_size = cache_size
+
+    def open_buffer(self, path):
+        with open(path, 'rb') as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def decode(self, position):
+        question = self.cache.get(position)
+        if question is not None:
+            self.cache.move_to_end(position)
+            return question
+        question = self.cache[position] = self.load(position)
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return question
+
+
+class QuestionList(Sequence):
+    """Read-only list of a category's questions, decoded on access"""
+
+    def __init__(self, bank, first, count):
+        self.bank = bank
+        self.first = first
+        self.count = count
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.count))]
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("question index out of range")
+        return self.bank.decode(self.first + index)
+
+
+def file_hash(path):
+    """sha256 digest of a file's bytes"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def compile_bank(source, target):
+    """Compile a questions JSON file into the indexed binary format"""
+    with open(source, 'r', encoding='utf-8') as f:
+        bank = QuestionBank(json.load(f))
+    categories = []
+    ids = []
+    offsets = array('Q', [0])
+    blobs = []
+    for name, questions in bank.data.items():
+        categories.append((name, len(ids), len(questions)))
+        for question in questions:
+            blob = pickle.dumps(question, protocol=pickle.HIGHEST_PROTOCOL)
+            blobs.append(blob)
+            ids.append(question["id"])
+            offsets.append(offsets[-1] + len(blob))
+    id_order = array('Q', sorted(range(len(ids)), key=ids.__getitem__))
+    encoded_ids = [ids[position].encode('utf-8') for position in id_order]
+    id_offsets = array('Q', [0])
+    for encoded in encoded_ids:
+        id_offsets.append(id_offsets[-1] + len(encoded))
+
+    tmp_path = target + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(b"\0" * HEADER.size)
+        sections = {}
+
+        def begin(name):
+            f.write(b"\0" * (-f.tell() % 8))
+            sections[name] = f.tell()
+
+        for name, column in (("offsets", offsets), ("id_order", id_order), ("id_offsets", id_offsets)):
+            begin(name)
+            f.write(column.tobytes())
+        begin("ids")
+        f.writelines(encoded_ids)
+        begin("blobs")
+        f.writelines(blobs)
+        index = pickle.dumps({"categories": categories, "sections": sections},
+                             protocol=pickle.HIGHEST_PROTOCOL)
+        index_offset = f.tell()
+        f.write(index)
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, file_hash(source), len(ids), index_offset, len(index)))
+    os.replace(tmp_path, target)
+    return len(ids)
+
+
+def open_compiled_bank(path, source=None, mapped=True):
+    """Compiled bank at path, or None if it is missing, unreadable or stale
+
+    The bank is stale when the source JSON exists and its content hash
+    differs from the one recorded at compile time. With mapped=True the
+    file is memory-mapped instead of read into memory.
+    """
+    if not os.path.exists(path):
+        return None
+    try:
+        bank = MappedQuestionBank(path) if mapped else CompiledQuestionBank(path)
+    except (OSError, ValueError, struct.error, pickle.UnpicklingError) as e:
+        print(f"Warning: ignoring compiled question bank {path}: {e}")
+        return None
+    if source and os.path.exists(source) and file_hash(source) != bank.source_hash:
+        print(f"Warning: {path} is out of date; recompile with: python question_bank.py")
+        return None
+    return bank
+
+
+def main():
+    here = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description="Compile questions.json into a fast-loading bank")
+    parser.add_argument("source", nargs="?", default=os.path.join(here, "questions.json"))
+    parser.add_argument("-o", "--output", default=None,
+                        help="compiled file (default: next to the source, .qbank)")
+    args = parser.parse_args()
+    output = args.output or os.path.splitext(args.source)[0] + ".qbank"
+    count = compile_bank(args.source, output)
+    print(f"Compiled {count} questions into {output}")
+
+
+if __name__ == "__main__":
+    main()
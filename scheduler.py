@@ -0,0 +1,33 @@
+class AfterScheduler:
+    """Keyed wrapper around Tk's after() that coalesces and cancels callbacks
+
+    Scheduling a key that is already pending replaces the old callback, so
+    each key has at most one callback in flight.
+    """
+
+    def __init__(self, widget):
+        self.widget = widget
+        self.pending = {}
+
+    def schedule(self, key, delay_ms, callback):
+        """Run callback after delay_ms, replacing any pending one for key"""
+        self.cancel(key)
+
+        def run():
+            self.pending.pop(key, None)
+            callback()
+
+        self.pending[key] = self.widget.after(delay_ms, run)
+
+    def cancel(self, key):
+        """Drop the pending callback for key, if any"""
+        after_id = self.pending.pop(key, None)
+        if after_id is not None:
+            self.widget.after_cancel(after_id)
+
+    def cancel_all(self):
+        for key in list(self.pending):
+            self.cancel(key)
+
+    def is_pending(self, key):
+        return key in self.pending
@@ -0,0 +1,300 @@
+import argparse
+import asyncio
+import json
+import math
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit, parse_qs, unquote
+from history_repository import LEADERBOARD_SIZE
+from sessions import SessionManager
+
+MAX_BODY_SIZE = 64 * 1024
+EXPIRE_INTERVAL = 60
+
+STATUS_TEXT = {
+    200: "OK",
+    201: "Created",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+}
+
+
+class HttpError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class QuizServer:
+    """Local HTTP/JSON API over the quiz engine
+
+    Routes:
+        GET  /categories
+        POST /sessions                    {"player_name", "category", "length"?}
+        GET  /sessions/<id>/question
+        POST /sessions/<id>/answer        {"selected_index", "time"}
+        POST /sessions/<id>/finish
+        GET  /leaderboard?limit=10        (at most LEADERBOARD_SIZE)
+        GET  /players/<name>/stats
+
+    Requests are handled on one event loop with HTTP/1.1 keep-alive.
+    History writes go to a single background thread, so the loop never
+    blocks on disk and results are still written in order.
+    """
+
+    def __init__(self, sessions=None):
+        self.sessions = sessions if sessions is not None else SessionManager()
+        self.model = self.sessions.engine.model
+        self.writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="history-writer")
+
+    # Route handlers
+    def list_categories(self, request):
+        return 200, [
+            {"name": name, "questions": self.model.get_total_questions(name)}
+            for name in self.model.get_categories()
+        ]
+
+    def start_session(self, request):
+        body = request["json"]
+        player_name = str(body.get("player_name", "")).strip()
+        category = body.get("category")
+        if not player_name:
+            raise HttpError(400, "player_name is required")
+        if not isinstance(category, str):
+            raise HttpError(400, "category must be a string")
+        if self.model.get_total_questions(category) == 0:
+            raise HttpError(404, f"Unknown category: {category}")
+        length = body.get("length")
+        if length is not None and (isinstance(length, bool) or not isinstance(length, int) or length < 1):
+            raise HttpError(400, "length must be a positive integer")
+        session_id = self.sessions.start(player_name, category, length)
+        return 201, {"session_id": session_id, "question": self.question_payload(session_id)}
+
+    def get_question(self, request, session_id):
+        self.require_session(session_id)
+        return 200, {"question": self.question_payload(session_id)}
+
+    def submit_answer(self, request, session_id):
+        self.require_session(session_id)
+        body = request["json"]
+        selected_index = body.get("selected_index", -1)
+        if isinstance(selected_index, bool) or not isinstance(selected_index, int):
+            raise HttpError(400, "selected_index must be an integer")
+        question_time = body.get("time")
+        if question_time is not None and (
+                isinstance(question_time, bool) or not isinstance(question_time, (int, float))
+                or not math.isfinite(question_time) or question_time < 0):
+            raise HttpError(400, "time must be a non-negative number")
+        outcome = self.sessions.submit_answer(session_id, selected_index, question_time)
+        if outcome is None:
+            raise HttpError(400, "No question left; finish the session")
+        is_correct, correct_index = outcome
+        question = self.question_payload(session_id)
+        return 200, {
+            "is_correct": is_correct,
+            "correct_index": correct_index,
+            "finished": question is None,
+            "question": question
+        }
+
+    def finish_session(self, request, session_id):
+        self.require_session(session_id)
+        result = self.sessions.finish(session_id, save=False)
+        loop = asyncio.get_running_loop()
+        if self.sessions.engine.should_save(result):
+            # Visible to readers right away; the disk write happens off the loop
+            self.model.history.add(result, persist=False)
+            loop.run_in_executor(self.writer, self.model.history.persist, result)
+        loop.run_in_executor(self.writer, self.model.reviews.flush)
+        summary = {key: value for key, value in result.items()
+                   if key != "answers"}
+        return 200, summary
+
+    def leaderboard(self, request):
+        try:
+            # Within the incremental leaderboard, never a scan of the history
+            limit = max(1, min(int(request["query"].get("limit", ["10"])[0]), LEADERBOARD_SIZE))
+        except ValueError:
+            raise HttpError(400, "limit must be an integer")
+        return 200, [
+            {key: r.get(key) for key in ("player_name", "category", "score", "total", "percentage", "date")}
+            for r in self.model.history.top(limit)
+        ]
+
+    def player_stats(self, request, player_name):
+        stats = self.model.get_player_stats(unquote(player_name))
+        if stats is None:
+            raise HttpError(404, "Unknown player")
+        return 200, {
+            "player": stats.player,
+            "attempts": stats.attempts,
+            "best_percentage": stats.best_percentage,
+            "average_percentage": stats.average_percentage,
+            "average_time": stats.average_time,
+            "accuracy": stats.accuracy(),
+            "categories": {
+                category: {"attempts": attempts, "accuracy": stats.accuracy(category)}
+                for category, (attempts, _, _) in stats.categories.items()
+            }
+        }
+
+    def require_session(self, session_id):
+        if self.sessions.get(session_id) is None:
+            raise HttpError(404, "Unknown or expired session")
+
+    def question_payload(self, session_id):
+        """Current question without its answer, or None when done"""
+        question = self.sessions.get_question(session_id)
+        if question is None:
+            return None
+        number, total = self.sessions.get_progress(session_id)
+        return {
+            "number": number,
+            "total": total,
+            "question": question.get("question", ""),
+            "options": question.get("options", [])
+        }
+
+    def route(self, request):
+        method = request["method"]
+        parts = [p for p in request["path"].split("/") if p]
+        if parts == ["categories"]:
+            routes = {"GET": self.list_categories}
+            args = ()
+        elif parts == ["sessions"]:
+            routes = {"POST": self.start_session}
+            args = ()
+        elif parts == ["leaderboard"]:
+            routes = {"GET": self.leaderboard}
+            args = ()
+        elif len(parts) == 3 and parts[0] == "players" and parts[2] == "stats":
+            routes = {"GET": self.player_stats}
+            args = (parts[1],)
+        elif len(parts) == 3 and parts[0] == "sessions":
+            routes = {
+                "question": {"GET": self.get_question},
+                "answer": {"POST": self.submit_answer},
+                "finish": {"POST": self.finish_session},
+            }.get(parts[2])
+            args = (parts[1],)
+            if routes is None:
+                raise HttpError(404, "Not found")
+        else:
+            raise HttpError(404, "Not found")
+        handler = routes.get(method)
+        if handler is None:
+            raise HttpError(405, "Method not allowed")
+        return handler(request, *args)
+
+    # HTTP plumbing
+    async def read_request(self, reader):
+        """Parse one request; returns None when the client closed the connection"""
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except asyncio.IncompleteReadError:
+            return None
+        except asyncio.LimitOverrunError:
+            raise HttpError(413, "Headers too large")
+        lines = head.decode("latin-1").split("\r\n")
+        try:
+            method, target, version = lines[0].split(" ", 2)
+        except ValueError:
+            raise HttpError(400, "Malformed request line")
+        headers = {}
+        for line in lines[1:]:
+            if ":" in line:
+                name, value = line.split(":", 1)
+                headers[name.strip().lower()] = value.strip()
+        try:
+            length = int(headers.get("content-length", "0") or 0)
+        except ValueError:
+            raise HttpError(400, "Invalid Content-Length")
+        if length > MAX_BODY_SIZE:
+            raise HttpError(413, "Body too large")
+        body = await reader.readexactly(length) if length else b""
+        url = urlsplit(target)
+        try:
+            data = json.loads(body) if body else {}
+        except json.JSONDecodeError:
+            raise HttpError(400, "Body is not valid JSON")
+        if not isinstance(data, dict):
+            raise HttpError(400, "Body must be a JSON object")
+        keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+        return {
+            "method": method.upper(),
+            "path": url.path,
+            "query": parse_qs(url.query),
+            "json": data,
+            "keep_alive": keep_alive
+        }
+
+    def write_response(self, writer, status, payload, keep_alive):
+        body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        head = (
+            f"HTTP/1.1 {status} {STATUS_TEXT.get(status, 'OK')}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + body)
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                try:
+                    request = await self.read_request(reader)
+                    if request is None:
+                        break
+                    keep_alive = request["keep_alive"]
+                    status, payload = self.route(request)
+                except HttpError as e:
+                    status, payload, keep_alive = e.status, {"error": e.message}, False
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    raise
+                except Exception as e:
+                    print(f"Error handling request: {e!r}")
+                    status, payload, keep_alive = 500, {"error": "Internal server error"}, False
+                self.write_response(writer, status, payload, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def expire_sessions(self):
+        while True:
+            await asyncio.sleep(EXPIRE_INTERVAL)
+            self.sessions.expire_idle()
+
+    async def serve(self, host="127.0.0.1", port=8080):
+        # Read the history before accepting requests, not in the first one
+        self.model.history.ensure_loaded()
+        server = await asyncio.start_server(self.handle_connection, host, port)
+        expirer = asyncio.create_task(self.expire_sessions())
+        print(f"Quiz API listening on http://{host}:{port}")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            expirer.cancel()
+            self.writer.shutdown(wait=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the quiz over a local HTTP/JSON API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    args = parser.parse_args()
+    try:
+        asyncio.run(QuizServer().serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
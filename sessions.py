@@ -0,0 +1,85 @@
+import secrets
+from collections import OrderedDict
+from engine import QuizEngine
+
+# Sessions untouched for this many seconds are dropped by expire_idle()
+SESSION_TTL = 30 * 60
+
+
+class SessionManager:
+    """Many concurrent quiz sessions over one shared question bank
+
+    Each session only holds its own progress (player, index, score,
+    answers, timings); questions are read from the engine's model,
+    which all sessions share. Sessions are kept in least-recently-used
+    order so expiring idle ones only touches the expired entries.
+    """
+
+    def __init__(self, engine=None, ttl=SESSION_TTL):
+        self.engine = engine if engine is not None else QuizEngine()
+        self.ttl = ttl
+        self.sessions = OrderedDict()
+
+    def __len__(self):
+        return len(self.sessions)
+
+    def start(self, player_name, category, length=None):
+        """Start a session and return its id"""
+        session_id = secrets.token_urlsafe(12)
+        self.sessions[session_id] = self.engine.start_session(player_name, category, length=length)
+        return session_id
+
+    def get(self, session_id):
+        """Live session for session_id (marking it active), or None"""
+        session = self.sessions.get(session_id)
+        if session is not None:
+            session.last_active = self.engine.clock()
+            self.sessions.move_to_end(session_id)
+        return session
+
+    def get_question(self, session_id):
+        session = self.get(session_id)
+        return self.engine.get_question(session) if session else None
+
+    def get_progress(self, session_id):
+        session = self.get(session_id)
+        return self.engine.get_progress(session) if session else None
+
+    def submit_answer(self, session_id, selected_index, question_time=None):
+        """Grade and advance; returns (is_correct, correct_index) or None"""
+        session = self.get(session_id)
+        if session is None or self.engine.get_question(session) is None:
+            return None
+        outcome = self.engine.submit_answer(session, selected_index, question_time)
+        self.engine.advance(session)
+        return outcome
+
+    def time_expired(self, session_id):
+        session = self.get(session_id)
+        if session is None or self.engine.get_question(session) is None:
+            return None
+        correct_index = self.engine.time_expired(session)
+        self.engine.advance(session)
+        return correct_index
+
+    def finish(self, session_id, save=True):
+        """Finish and close a session; returns its result or None"""
+        session = self.sessions.get(session_id)
+        if session is None:
+            return None
+        # Only closed once the result exists, so a failure keeps the session
+        result = self.engine.finish(session, save=save)
+        del self.sessions[session_id]
+        return result
+
+    def expire_idle(self, now=None):
+        """Drop sessions idle for longer than the TTL; returns how many"""
+        now = self.engine.clock() if now is None else now
+        expired = 0
+        while self.sessions:
+            session_id, session = next(iter(self.sessions.items()))
+            if now - session.last_active < self.ttl:
+                break
+            del self.sessions[session_id]
+            expired += 1
+        return expired
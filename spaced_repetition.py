@@ -0,0 +1,153 @@
+import heapq
+import time
+from history_store import JsonlHistoryStore
+
+DAY = 24 * 60 * 60
+INITIAL_EASE = 2.5
+MIN_EASE = 1.3
+# Correct answers at least this fast (seconds) count as easy recalls
+FAST_ANSWER_TIME = 10
+# Rewrite the log once it holds this many lines per live card
+COMPACT_RATIO = 4
+
+
+def answer_quality(selected_index, is_correct, time_taken):
+    """SM-2 recall quality (0-5) for a quiz answer"""
+    if is_correct:
+        return 5 if time_taken and time_taken <= FAST_ANSWER_TIME else 4
+    return 0 if selected_index == -1 else 1
+
+
+class ReviewCard:
+    """SM-2 state of one question for one player"""
+
+    __slots__ = ("player", "question_id", "repetitions", "interval", "ease", "due")
+
+    def __init__(self, player, question_id, repetitions=0, interval=0, ease=INITIAL_EASE, due=0.0):
+        self.player = player
+        self.question_id = question_id
+        self.repetitions = repetitions
+        self.interval = interval
+        self.ease = ease
+        self.due = due
+
+    def review(self, quality, now):
+        """Apply one SM-2 review and set the next due time"""
+        if quality < 3:
+            self.repetitions = 0
+            self.interval = 1
+        else:
+            self.repetitions += 1
+            if self.repetitions == 1:
+                self.interval = 1
+            elif self.repetitions == 2:
+                self.interval = 6
+            else:
+                self.interval = round(self.interval * self.ease)
+        self.ease = max(MIN_EASE, self.ease + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+        self.due = now + self.interval * DAY
+
+    def to_record(self):
+        return {
+            "player": self.player,
+            "id": self.question_id,
+            "repetitions": self.repetitions,
+            "interval": self.interval,
+            "ease": round(self.ease, 4),
+            "due": self.due,
+        }
+
+
+class ReviewScheduler:
+    """Per-player spaced repetition of questions answered wrongly
+
+    A question enters a player's schedule the first time they get it
+    wrong; every later answer to it reschedules it with SM-2. Each player
+    has a heap of (due, question_id) entries, so picking due questions
+    costs O(log n) each; superseded entries are skipped when popped.
+
+    Card updates are appended to a JSONL log (one line per update) and
+    replayed on load, last line winning. The log is compacted once it
+    is several times larger than the live cards.
+    """
+
+    def __init__(self, path='review_schedule.jsonl'):
+        self.store = JsonlHistoryStore(path, legacy_path='')
+        self.cards = {}  # (player, question_id) -> ReviewCard
+        self.queues = {}  # player -> heap of (due, question_id)
+        self.pending = []
+        self.log_lines = 0
+        self.load()
+
+    def load(self):
+        try:
+            for record in self.store.iter_records():
+                card = ReviewCard(record["player"], record["id"], record["repetitions"],
+                                  record["interval"], record["ease"], record["due"])
+                self.cards[card.player, card.question_id] = card
+                self.log_lines += 1
+        except (OSError, KeyError, TypeError) as e:
+            print(f"Error loading review schedule: {e}")
+        for card in self.cards.values():
+            self.queues.setdefault(card.player, []).append((card.due, card.question_id))
+        for heap in self.queues.values():
+            heapq.heapify(heap)
+        if self.store.bad_lines or self.log_lines > COMPACT_RATIO * max(len(self.cards), 1):
+            self.compact()
+
+    def record(self, player, question_id, selected_index, is_correct, time_taken=0, now=None):
+        """Feed one answer; wrong answers start a schedule, later ones move it"""
+        now = time.time() if now is None else now
+        card = self.cards.get((player, question_id))
+        if card is None:
+            if is_correct:
+                return
+            card = self.cards[player, question_id] = ReviewCard(player, question_id)
+        card.review(answer_quality(selected_index, is_correct, time_taken), now)
+        heapq.heappush(self.queues.setdefault(player, []), (card.due, question_id))
+        self.pending.append(card.to_record())
+
+    def flush(self):
+        """Append pending card updates to the log in one write
+
+        Safe to call from a writer thread while answers are recorded:
+        the pending list is swapped out before writing.
+        """
+        pending, self.pending = self.pending, []
+        if not pending:
+            return
+        try:
+            self.store.append_many(pending)
+        except OSError as e:
+            print(f"Error saving review schedule: {e}")
+            self.pending[:0] = pending
+            return
+        self.log_lines += len(pending)
+        if self.log_lines > COMPACT_RATIO * max(len(self.cards), 1):
+            self.compact()
+
+    def compact(self):
+        try:
+            self.store.compact([card.to_record() for card in list(self.cards.values())])
+            self.log_lines = len(self.cards)
+        except OSError as e:
+            print(f"Error compacting review schedule: {e}")
+
+    def due(self, player, limit=10, now=None):
+        """Up to `limit` question ids due for player, most overdue first
+
+        The picked entries stay queued until the questions are answered.
+        """
+        now = time.time() if now is None else now
+        heap = self.queues.get(player)
+        if not heap:
+            return []
+        picked = []
+        while heap and len(picked) < limit and heap[0][0] <= now:
+            due, question_id = heapq.heappop(heap)
+            card = self.cards.get((player, question_id))
+            if card is not None and card.due == due:
+                picked.append((due, question_id))
+        for entry in picked:
+            heapq.heappush(heap, entry)
+        return [question_id for _, question_id in picked]
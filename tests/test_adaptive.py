@@ -0,0 +1,72 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from adaptive import AdaptiveSelector, fit_rasch
+from history_store import JsonlHistoryStore
+from models import QuizModel
+
+
+@pytest.fixture
+def model(tmp_path):
+    store = JsonlHistoryStore(str(tmp_path / "history.jsonl"), legacy_path="")
+    return QuizModel(history_store=store, review_path=str(tmp_path / "reviews.jsonl"))
+
+
+def test_fit_rasch_recovers_difficulty_order():
+    rng = np.random.default_rng(1)
+    true_ability = rng.normal(size=200)
+    true_difficulty = np.array([-2.0, -1.0, 0.0, 1.0, 2.0])
+    players = np.repeat(np.arange(200), 5)
+    items = np.tile(np.arange(5), 200)
+    p = 1.0 / (1.0 + np.exp(true_difficulty[items] - true_ability[players]))
+    correct = (rng.random(len(p)) < p).astype(float)
+    ability, difficulty = fit_rasch(players, items, correct, np.zeros(200), np.zeros(5), iterations=30)
+    assert list(np.argsort(difficulty)) == [0, 1, 2, 3, 4]
+    assert np.corrcoef(ability, true_ability)[0, 1] > 0.5
+
+
+def test_next_index_picks_the_closest_unasked_question(model):
+    selector = AdaptiveSelector(model, background=False)
+    category = model.get_categories()[0]
+    ids = model.get_question_ids(category)
+    selector.next_index(category, "ann", ())
+    with selector.lock:
+        selector.estimates()
+        selector.difficulty[selector.columns(category)] = np.linspace(-2, 2, len(ids))
+        selector.ability = np.zeros(len(selector.players))
+    middle = int(np.argmin(np.abs(np.linspace(-2, 2, len(ids)))))
+    assert selector.next_index(category, "ann", ()) == middle
+    assert selector.next_index(category, "ann", {middle}) != middle
+    assert selector.next_index(category, "ann", set(range(len(ids)))) is None
+
+
+def test_correct_answers_raise_ability(model):
+    selector = AdaptiveSelector(model, background=False)
+    category = model.get_categories()[0]
+    qid = model.get_question_ids(category)[0]
+    selector.record("ann", qid, True)
+    assert selector.ability_of("ann") > 0
+    selector.record("bob", qid, False)
+    assert selector.ability_of("bob") < 0
+
+
+def test_history_is_read_on_first_use_including_legacy_rows(model):
+    category = model.get_categories()[0]
+    ids = model.get_question_ids(category)
+    model.history.store.append_many([{
+        "date": "2024-05-01 10:00", "player_name": "ann", "category": category,
+        "score": 2, "total": 2, "answers": [[ids[0], 1, True, 3], [ids[1], 0, True, 3]],
+    }, {
+        "date": "2024-05-01 11:00", "player_name": "bob", "category": category,
+        "score": 0, "total": 1,
+        "answer_history": [{"question_text": model.get_question(category, 2)["question"],
+                            "selected_index": 0, "is_correct": False}],
+        "question_times": [5],
+    }])
+    selector = AdaptiveSelector(model, background=False)
+    assert len(selector.response_items) == 0
+    selector.next_index(category, "ann", ())
+    assert len(selector.response_items) == 3
+    assert selector.ability_of("ann") > selector.ability_of("bob")
+    assert ids[2] in selector.items
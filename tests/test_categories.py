@@ -0,0 +1,58 @@
+import json
+from categories import DEFAULT_EMOJI, PALETTE, CategoryCatalog
+from question_bank import QuestionBank
+
+
+def make_bank(count):
+    return QuestionBank({f"Cat{i}": [{"question": f"q{i}-{j}"} for j in range(i % 3)]
+                         for i in range(count)})
+
+
+def test_names_skip_empty_categories_in_bank_order():
+    catalog = CategoryCatalog(make_bank(7))
+    assert catalog.names() == ["Cat1", "Cat2", "Cat4", "Cat5"]
+    assert len(catalog) == 4
+
+
+def test_pages_cover_every_category_once():
+    catalog = CategoryCatalog(make_bank(20))
+    size = 4
+    assert catalog.page_count(size) == 4
+    pages = [catalog.page(number, size) for number in range(catalog.page_count(size))]
+    assert [len(page) for page in pages] == [4, 4, 4, 1]
+    assert [info.name for page in pages for info in page] == catalog.names()
+    assert catalog.page(catalog.page_count(size), size) == []
+
+
+def test_empty_bank_has_one_empty_page():
+    catalog = CategoryCatalog(QuestionBank({}))
+    assert catalog.page_count(6) == 1
+    assert catalog.page(0, 6) == []
+
+
+def test_metadata_and_defaults(tmp_path):
+    path = tmp_path / "categories.json"
+    path.write_text(json.dumps({"Cat1": {"description": "First", "emoji": "1", "color": "#000"}}))
+    catalog = CategoryCatalog(make_bank(3), str(path))
+    first, second = catalog.page(0, 2)
+    assert (first.description, first.emoji, first.color, first.count) == ("First", "1", "#000", 1)
+    assert (second.description, second.emoji, second.count) == ("2 questions", DEFAULT_EMOJI, 2)
+    assert second.color in PALETTE
+    assert catalog.info("Cat2") is second
+
+
+def test_missing_or_bad_metadata_falls_back(tmp_path):
+    assert CategoryCatalog(make_bank(2), str(tmp_path / "missing.json")).metadata == {}
+    bad = tmp_path / "bad.json"
+    bad.write_text("{")
+    assert CategoryCatalog(make_bank(2), str(bad)).metadata == {}
+
+
+def test_invalidate_rereads_the_bank():
+    bank = make_bank(3)
+    catalog = CategoryCatalog(bank)
+    assert catalog.names() == ["Cat1", "Cat2"]
+    bank.data["Cat0"].append({"question": "new"})
+    assert catalog.names() == ["Cat1", "Cat2"]
+    catalog.invalidate()
+    assert catalog.names() == ["Cat0", "Cat1", "Cat2"]
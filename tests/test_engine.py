@@ -0,0 +1,103 @@
+import random
+import pytest
+from engine import REVIEW_CATEGORY, QuizEngine
+from history_store import JsonlHistoryStore
+from models import QuizModel
+
+
+@pytest.fixture
+def model(tmp_path):
+    store = JsonlHistoryStore(str(tmp_path / "history.jsonl"), legacy_path="")
+    return QuizModel(history_store=store, review_path=str(tmp_path / "reviews.jsonl"))
+
+
+def make_engine(model, **options):
+    return QuizEngine(model, clock=lambda: 1000.0, rng=random.Random(7), **options)
+
+
+def test_walks_the_category_in_bank_order(model):
+    engine = make_engine(model)
+    category = model.get_categories()[0]
+    session = engine.start_session("ann", category)
+    assert engine.get_progress(session) == (1, model.get_total_questions(category))
+    assert engine.get_question(session) == model.get_question(category, 0)
+    correct = model.get_correct_index(model.get_question(category, 0))
+    assert engine.submit_answer(session, correct, 2) == (True, correct)
+    assert engine.advance(session)
+    assert engine.get_question(session) == model.get_question(category, 1)
+
+
+def test_finish_saves_once(model):
+    engine = make_engine(model)
+    session = engine.start_session("ann", model.get_categories()[0], length=2)
+    for _ in range(2):
+        engine.submit_answer(session, 0, 2)
+        engine.advance(session)
+    result = engine.finish(session)
+    assert engine.finish(session) is result
+    assert result["total"] == 2
+    assert result["time_seconds"] == 4
+    assert len(model.history) == 1
+
+
+def test_sampled_quiz_asks_distinct_questions(model):
+    engine = make_engine(model, quiz_length=4)
+    category = model.get_categories()[0]
+    session = engine.start_session("ann", category)
+    assert session.length == 4
+    assert len(set(session.questions)) == 4
+    assert all(0 <= index < model.get_total_questions(category) for index in session.questions)
+
+
+def test_shuffled_answers_are_recorded_in_bank_order(model):
+    engine = make_engine(model, shuffle_options=True)
+    category = model.get_categories()[0]
+    session = engine.start_session("ann", category, length=5)
+    while True:
+        position = session.player.current_question_index
+        presented = engine.get_question(session)
+        original = model.get_question(category, session.questions[position])
+        order = session.option_orders[position]
+        assert presented["options"] == [original["options"][i] for i in order]
+        # Pick a wrong option when there is one, else the right one
+        wrong = [i for i in range(len(order)) if i != presented["answer"]]
+        selected = wrong[0] if wrong else presented["answer"]
+        is_correct, correct_index = engine.submit_answer(session, selected, 3)
+        assert correct_index == presented["answer"]
+        assert is_correct == (selected == presented["answer"])
+        answer = session.answers[-1]
+        assert answer.question_id == original["id"]
+        assert answer.selected_index == order[selected]
+        assert answer.is_correct == (order[selected] == model.get_correct_index(original))
+        if not engine.advance(session):
+            break
+    assert len(session.answers) == 5
+
+
+def test_unanswered_question_is_recorded_as_minus_one(model):
+    engine = make_engine(model, shuffle_options=True)
+    session = engine.start_session("ann", model.get_categories()[0])
+    engine.time_expired(session)
+    assert session.answers[-1].selected_index == -1
+    assert not session.answers[-1].is_correct
+
+
+def test_review_sessions_stay_out_of_history(model):
+    engine = make_engine(model)
+    session = engine.start_session("ann", model.get_categories()[0], length=3)
+    for _ in range(3):
+        engine.time_expired(session)
+        engine.advance(session)
+    engine.finish(session)
+
+    engine.clock = lambda: 1000.0 + 2 * 24 * 60 * 60
+    review = engine.start_review_session("ann")
+    assert review.player.get_category() == REVIEW_CATEGORY
+    assert review.length == 3
+    while engine.get_question(review) is not None:
+        engine.submit_answer(review, 0, 2)
+        engine.advance(review)
+    result = engine.finish(review)
+    assert result["total"] == 3
+    assert len(model.history) == 1
+    assert model.get_player_stats("ann").attempts == 1
@@ -0,0 +1,56 @@
+import datetime
+import random
+import pytest
+from history_store import JsonlHistoryStore, parse_timestamp
+from history_repository import HistoryRepository
+
+
+def result(id, date, player="ann", percentage=50.0):
+    return {"id": id, "date": date, "player_name": player, "category": "Core",
+            "score": int(percentage // 10), "total": 10, "percentage": percentage,
+            "time_seconds": 30, "time_formatted": "0:30"}
+
+
+@pytest.fixture
+def repository(tmp_path):
+    return HistoryRepository(JsonlHistoryStore(str(tmp_path / "history.jsonl"), legacy_path=""))
+
+
+def test_between_with_out_of_order_inserts(repository):
+    rng = random.Random(5)
+    days = list(range(1, 29))
+    rng.shuffle(days)
+    for id, day in enumerate(days, 1):
+        repository.add(result(id, f"2024-02-{day:02d} 12:00"))
+    start = datetime.datetime(2024, 2, 10)
+    end = datetime.datetime(2024, 2, 20, 12, 0)
+    got = [r["date"] for r in repository.between(start, end)]
+    assert got == [f"2024-02-{day:02d} 12:00" for day in range(20, 9, -1)]
+    newest_first = [r["timestamp"] for r in repository.all_scores()]
+    assert newest_first == sorted(newest_first, reverse=True)
+    assert len(repository.between(None, start)) == 9
+    assert len(repository.between(end.timestamp() + 1, None)) == 8
+
+
+def test_last_days_counts_from_now(repository):
+    now = datetime.datetime(2024, 3, 31, 12, 0)
+    for id, date in enumerate(["2024-03-30 09:00", "2024-01-02 09:00", "2024-03-02 13:00",
+                               "2024-03-01 11:00"], 1):
+        repository.add(result(id, date))
+    assert [r["id"] for r in repository.last_days(30, now=now)] == [1, 3]
+    assert [r["id"] for r in repository.last_days(90, now=now)] == [1, 3, 4, 2]
+
+
+def test_add_accepts_legacy_rows(repository):
+    repository.add({"date": "2024-05-01 10:00", "player_name": "ann", "category": "Core",
+                    "score": "7/10", "time": "1:05"})
+    row = repository.records[0]
+    assert (row["score"], row["total"], row["percentage"], row["time_seconds"]) == (7, 10, 70.0, 65)
+    assert row["timestamp"] == parse_timestamp("2024-05-01 10:00")
+
+
+def test_reload_matches_added_rows(tmp_path, repository):
+    for id, date in enumerate(["2024-03-02 13:00", "2024-03-01 11:00"], 1):
+        repository.add(result(id, date))
+    reloaded = HistoryRepository(JsonlHistoryStore(repository.store.path, legacy_path=""))
+    assert list(reloaded.all_scores()) == list(repository.all_scores())
@@ -0,0 +1,91 @@
+import json
+from history_store import JsonlHistoryStore, normalize_record, parse_timestamp
+from question_bank import question_id
+
+
+def test_normalize_legacy_score_string():
+    record = normalize_record({"date": "2024-05-01 10:00", "player_name": "ann",
+                               "category": "Core", "score": "10/10", "time": "1:05"})
+    assert record["score"] == 10
+    assert record["total"] == 10
+    assert record["percentage"] == 100
+    assert record["time_formatted"] == "1:05"
+    assert record["time_seconds"] == 65
+    assert record["timestamp"] == parse_timestamp("2024-05-01 10:00")
+    assert "time" not in record
+
+
+def test_normalize_keeps_current_records():
+    current = {"date": "2024-05-01 10:00", "timestamp": 1.0, "score": 3, "total": 4,
+               "percentage": 75.0, "time_seconds": 9, "time_formatted": "0:09"}
+    assert normalize_record(current) == current
+
+
+def test_normalize_bad_score_and_missing_date():
+    record = normalize_record({"score": "x/5"})
+    assert record["score"] == 0
+    assert record["percentage"] == 0
+    assert record["timestamp"] == 0.0
+
+
+def test_append_repairs_torn_tail(tmp_path):
+    path = tmp_path / "history.jsonl"
+    path.write_text('{"id": 1}\n{"id": 2, "sco')
+    store = JsonlHistoryStore(str(path), legacy_path="")
+    store.append({"id": 3})
+    assert [r["id"] for r in store.iter_records()] == [1, 3]
+    assert store.bad_lines == 1
+
+
+def test_load_compacts_corrupt_lines(tmp_path):
+    path = tmp_path / "history.jsonl"
+    path.write_text('{"id": 1}\nnot json\n{"id": 2}\n')
+    store = JsonlHistoryStore(str(path), legacy_path="")
+    assert [r["id"] for r in store.load()] == [1, 2]
+    assert path.read_text().splitlines() == ['{"id":1}', '{"id":2}']
+    assert list(store.iter_records()) == [{"id": 1}, {"id": 2}]
+    assert store.bad_lines == 0
+
+
+def test_stream_compacts_after_reading(tmp_path):
+    path = tmp_path / "history.jsonl"
+    path.write_text('{"id": 1}\n{"id"\n')
+    store = JsonlHistoryStore(str(path), legacy_path="")
+    assert [r["id"] for r in store.stream()] == [1]
+    assert path.read_text() == '{"id":1}\n'
+
+
+
+LEGACY_ROW = {
+    "date": "2024-05-01 10:00", "player_name": "ann", "category": "Core",
+    "score": 1, "total": 2, "percentage": 50.0, "time_seconds": 16, "time_formatted": "0:16",
+    "answer_history": [
+        {"selected_index": 1, "correct_index": 1, "is_correct": True, "question_index": 0,
+         "question_text": "2 + 2?", "options": ["3", "4"], "explanation": "Arithmetic."},
+        {"selected_index": 0, "correct_index": 1, "is_correct": False, "question_index": 1,
+         "question_text": "3 + 3?", "options": ["5", "6"], "explanation": "Arithmetic."},
+    ],
+    "question_times": [4, 12],
+}
+
+
+def test_normalize_compacts_legacy_answer_history():
+    record = normalize_record(LEGACY_ROW)
+    assert "answer_history" not in record and "question_times" not in record
+    assert record["answers"] == [
+        [question_id("Core", {"question": "2 + 2?"}), 1, True, 4],
+        [question_id("Core", {"question": "3 + 3?"}), 0, False, 12],
+    ]
+    assert normalize_record(record) == record
+
+
+def test_migrate_legacy_writes_compact_rows(tmp_path):
+    legacy = tmp_path / "quiz_history.json"
+    legacy.write_text(json.dumps([LEGACY_ROW, "junk"], indent=4))
+    path = tmp_path / "history.jsonl"
+    store = JsonlHistoryStore(str(path), legacy_path=str(legacy))
+    assert len(store.load()) == 1
+    written = json.loads(path.read_text())
+    assert written["timestamp"] == parse_timestamp("2024-05-01 10:00")
+    assert len(written["answers"]) == 2
+    assert "options" not in path.read_text()
@@ -0,0 +1,110 @@
+import io
+import math
+import random
+import pytest
+import item_analysis
+from item_analysis import MAX_OPTIONS, TIME_BINS, ItemAnalysis
+from question_bank import question_id
+
+
+def make_history(count=300, seed=3):
+    rng = random.Random(seed)
+    records = []
+    for _ in range(count):
+        asked = rng.sample(range(12), 5)
+        answers = []
+        for q in asked:
+            selected = rng.choice([-1, 0, 1, 2, 3])
+            answers.append([f"q{q}", selected, selected == q % 4, rng.uniform(0, 70)])
+        records.append({"player_name": "ann", "category": "Core", "answers": answers})
+    return records
+
+
+def pearson(xs, ys):
+    n = len(xs)
+    mx, my = sum(xs) / n, sum(ys) / n
+    sxy = sum((x - mx) * (y - my) for x, y in zip(xs, ys))
+    sxx = sum((x - mx) ** 2 for x in xs)
+    syy = sum((y - my) ** 2 for y in ys)
+    if sxx == 0 or syy / n <= 1e-12:
+        return None
+    return sxy / math.sqrt(sxx * syy)
+
+
+def brute_force(records):
+    """Per-question statistics computed straight from the answers"""
+    responses = {}
+    for record in records:
+        answers = record["answers"]
+        score = sum(1 for a in answers if a[2])
+        for qid, selected, correct, seconds in answers:
+            rest = (score - correct) / (len(answers) - 1)
+            responses.setdefault(qid, []).append((selected, correct, rest, seconds))
+    stats = {}
+    for qid, rows in responses.items():
+        n = len(rows)
+        correct = [1.0 if r[1] else 0.0 for r in rows]
+        bins = sorted(min(max(int(round(r[3])), 0), TIME_BINS) for r in rows)
+        median = bins[math.ceil(n / 2) - 1]
+        rpb = pearson(correct, [r[2] for r in rows])
+        stats[qid] = {
+            "responses": n,
+            "p_value": round(100 * sum(correct) / n, 1),
+            "point_biserial": "" if rpb is None else round(rpb, 3),
+            "option_counts": "/".join(str(sum(1 for r in rows if r[0] == i)) for i in range(MAX_OPTIONS)),
+            "no_answer": sum(1 for r in rows if r[0] == -1),
+            "median_time": f"{median}+" if median == TIME_BINS else str(median),
+        }
+    return stats
+
+
+def check_against_brute_force(records):
+    rows = {row["question_id"]: row for row in ItemAnalysis().add_records(records).rows()}
+    expected = brute_force(records)
+    assert set(rows) == set(expected)
+    for qid, stats in expected.items():
+        row = rows[qid]
+        for key, value in stats.items():
+            if key == "point_biserial" and value != "":
+                assert row[key] == pytest.approx(value, abs=1e-3)
+            else:
+                assert row[key] == value, (qid, key)
+
+
+def test_loop_path_matches_brute_force(monkeypatch):
+    monkeypatch.setattr(item_analysis, "np", None)
+    monkeypatch.setattr(item_analysis, "CHUNK_SIZE", 64)
+    check_against_brute_force(make_history())
+
+
+def test_numpy_path_matches_brute_force(monkeypatch):
+    pytest.importorskip("numpy")
+    monkeypatch.setattr(item_analysis, "CHUNK_SIZE", 64)
+    check_against_brute_force(make_history())
+
+
+def test_legacy_answer_history_is_counted(monkeypatch):
+    monkeypatch.setattr(item_analysis, "np", None)
+    record = {
+        "category": "Core",
+        "answer_history": [
+            {"question_text": "2 + 2?", "selected_index": 1, "is_correct": True},
+            {"question_text": "3 + 3?", "selected_index": 0, "is_correct": False},
+        ],
+        "question_times": [4, 12],
+    }
+    analysis = ItemAnalysis().add_records([record])
+    rows = {row["question_id"]: row for row in analysis.rows()}
+    first = rows[question_id("Core", {"question": "2 + 2?"})]
+    assert (first["responses"], first["p_value"], first["median_time"]) == (1, 100.0, "4")
+    second = rows[question_id("Core", {"question": "3 + 3?"})]
+    assert (second["p_value"], second["median_time"]) == (0.0, "12")
+
+
+def test_write_csv_has_a_row_per_question(monkeypatch):
+    monkeypatch.setattr(item_analysis, "np", None)
+    out = io.StringIO()
+    ItemAnalysis().add_records(make_history(20)).write_csv(out)
+    lines = out.getvalue().splitlines()
+    assert lines[0].startswith("question_id,")
+    assert len(lines) == 1 + len(brute_force(make_history(20)))
@@ -0,0 +1,49 @@
+import random
+from leaderboard import Leaderboard
+
+
+def test_top_keeps_earlier_rows_first_on_ties():
+    board = Leaderboard(k=3)
+    for row, percentage in enumerate([50.0, 80.0, 80.0, 50.0, 80.0, 90.0]):
+        board.add(row, percentage, f"p{row}")
+    assert board.top() == [5, 1, 2]
+    assert board.top(2) == [5, 1]
+    assert len(board) == 6
+
+
+def test_top_matches_stable_sort():
+    percentages = [70.0, 70.0, 40.0, 100.0, 70.0, 100.0, 10.0, 70.0]
+    board = Leaderboard(k=5)
+    for row, percentage in enumerate(percentages):
+        board.add(row, percentage, "ann")
+    expected = sorted(range(len(percentages)), key=lambda row: -percentages[row])[:5]
+    assert board.top() == expected
+
+
+def test_podium_ranks_each_players_best():
+    board = Leaderboard(k=10)
+    board.add(0, 60.0, "ann")
+    board.add(1, 90.0, "bob")
+    board.add(2, 90.0, "cy")
+    board.add(3, 95.0, "ann")
+    board.add(4, 20.0, "dee")
+    assert board.podium(3) == [3, 1, 2]
+    assert board.player_best("ann") == 3
+    assert board.player_best("nobody") is None
+
+
+def test_podium_matches_brute_force_as_players_improve():
+    rng = random.Random(11)
+    board = Leaderboard(k=10)
+    best = {}
+    for row in range(2000):
+        player = f"p{rng.randrange(40)}"
+        percentage = float(rng.randrange(0, 101, 5))
+        board.add(row, percentage, player)
+        if player not in best or percentage > best[player][0]:
+            best[player] = (percentage, row)
+        if row % 97 == 0:
+            expected = sorted(best.values(), key=lambda b: (-b[0], b[1]))[:5]
+            assert board.podium(5) == [r for _, r in expected]
+    # Stale ranking entries are dropped instead of piling up
+    assert len(board._ranking) <= 2 * len(best)
@@ -0,0 +1,134 @@
+import json
+import random
+import pytest
+from history_store import JsonlHistoryStore, SqliteHistoryStore
+from history_repository import HistoryRepository
+from player_stats import PlayerStatsCache
+
+
+def make_store(backend, tmp_path):
+    if backend == "sqlite":
+        return SqliteHistoryStore(str(tmp_path / "history.db"), legacy_path="", log_path="")
+    return JsonlHistoryStore(str(tmp_path / "history.jsonl"), legacy_path="")
+
+
+def make_results(count, seed=0, start_day=1):
+    rng = random.Random(seed)
+    results = []
+    for i in range(count):
+        total = rng.choice([5, 10])
+        score = rng.randint(0, total)
+        results.append({
+            "date": f"2024-03-{start_day + i // 100:02d} {i // 60 % 24:02d}:{i % 60:02d}",
+            "player_name": f"p{rng.randrange(6)}", "category": rng.choice(["Core", "Modules"]),
+            "score": score, "total": total, "percentage": score / total * 100,
+            "time_seconds": rng.randint(10, 300), "time_formatted": "",
+        })
+    return results
+
+
+def brute_force(records):
+    """Aggregates straight from the records, per player"""
+    players = {}
+    for r in records:
+        p = players.setdefault(r["player_name"], {"attempts": 0, "best": 0.0, "percent": 0.0,
+                                                  "seconds": 0, "correct": 0, "questions": 0,
+                                                  "categories": {}})
+        p["attempts"] += 1
+        p["best"] = max(p["best"], r["percentage"])
+        p["percent"] += r["percentage"]
+        p["seconds"] += r["time_seconds"]
+        p["correct"] += r["score"]
+        p["questions"] += r["total"]
+        c = p["categories"].setdefault(r["category"], [0, 0, 0])
+        c[0] += 1
+        c[1] += r["score"]
+        c[2] += r["total"]
+    return players
+
+
+def assert_matches(repository, records):
+    expected = brute_force(records)
+    repository.ensure_loaded()
+    assert len(repository.stats) == len(expected)
+    for name, p in expected.items():
+        stats = repository.player_stats(name)
+        assert stats.attempts == p["attempts"]
+        assert stats.best_percentage == p["best"]
+        assert stats.average_percentage == pytest.approx(p["percent"] / p["attempts"])
+        assert stats.average_time == pytest.approx(p["seconds"] / p["attempts"])
+        assert stats.accuracy() == pytest.approx(p["correct"] / p["questions"] * 100)
+        assert stats.categories == p["categories"]
+        for category, (_, correct, questions) in p["categories"].items():
+            assert stats.accuracy(category) == pytest.approx(correct / questions * 100)
+
+
+@pytest.mark.parametrize("backend", ["jsonl", "sqlite"])
+def test_incremental_stats_match_brute_force(tmp_path, backend):
+    records = make_results(250)
+    repository = HistoryRepository(make_store(backend, tmp_path))
+    for record in records:
+        repository.add(dict(record))
+    assert_matches(repository, records)
+    reloaded = HistoryRepository(make_store(backend, tmp_path))
+    assert_matches(reloaded, records)
+
+
+@pytest.mark.parametrize("backend", ["jsonl", "sqlite"])
+def test_snapshot_catches_up_with_newer_records(tmp_path, backend):
+    records = make_results(50) + make_results(30, seed=1, start_day=5)
+    store = make_store(backend, tmp_path)
+    store.append_many(records[:50])
+    HistoryRepository(store).ensure_loaded()
+    snapshot = json.loads(open(store.path + ".stats.json").read())
+    assert snapshot["records"] == 50
+    # Written by another process, without updating the snapshot
+    store.append_many(records[50:])
+    repository = HistoryRepository(make_store(backend, tmp_path))
+    repository.ensure_loaded()
+    assert_matches(repository, records)
+    assert json.loads(open(store.path + ".stats.json").read())["records"] == 80
+
+
+def test_mismatched_snapshot_is_rebuilt(tmp_path):
+    path = tmp_path / "history.jsonl"
+    store = JsonlHistoryStore(str(path), legacy_path="")
+    store.append_many(make_results(40))
+    HistoryRepository(store).ensure_loaded()
+    # The log is replaced by a different history of the same length
+    path.unlink()
+    replacement = make_results(40, seed=9, start_day=7)
+    store.append_many(replacement)
+    repository = HistoryRepository(JsonlHistoryStore(str(path), legacy_path=""))
+    repository.ensure_loaded()
+    assert_matches(repository, replacement)
+
+
+def test_shorter_log_and_corrupt_snapshot_are_rebuilt(tmp_path):
+    path = tmp_path / "history.jsonl"
+    store = JsonlHistoryStore(str(path), legacy_path="")
+    records = make_results(30)
+    store.append_many(records)
+    HistoryRepository(store).ensure_loaded()
+    store.compact(records[:20])
+    repository = HistoryRepository(JsonlHistoryStore(str(path), legacy_path=""))
+    repository.ensure_loaded()
+    assert_matches(repository, records[:20])
+    (tmp_path / "history.jsonl.stats.json").write_text("{not json")
+    repository = HistoryRepository(JsonlHistoryStore(str(path), legacy_path=""))
+    repository.ensure_loaded()
+    assert_matches(repository, records[:20])
+
+
+def test_snapshot_is_written_every_save_interval(tmp_path):
+    cache = PlayerStatsCache(str(tmp_path / "stats.json"))
+    for i in range(PlayerStatsCache.SAVE_INTERVAL - 1):
+        cache.add_values("ann", "Core", 1, 2, 50.0, 10, float(i))
+        cache.save_if_due()
+    assert not (tmp_path / "stats.json").exists()
+    cache.add_values("ann", "Core", 1, 2, 50.0, 10, 99.0)
+    cache.save_if_due()
+    saved = json.loads((tmp_path / "stats.json").read_text())
+    assert saved["records"] == PlayerStatsCache.SAVE_INTERVAL
+    assert saved["last_timestamp"] == 99.0
+    assert cache.unsaved == 0
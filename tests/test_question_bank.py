@@ -0,0 +1,60 @@
+import json
+import os
+import pytest
+from question_bank import (CompiledQuestionBank, MappedQuestionBank, QuestionBank,
+                           compile_bank, open_compiled_bank)
+
+DATA = {
+    "Core": [
+        {"id": "c1", "question": "2 + 2?", "options": ["3", "4"], "answer": 1},
+        {"question": "Type of 1?", "options": ["int", "str"], "answer": 0},
+    ],
+    "Strings": [
+        {"id": "s1", "question": "len('ab')?", "options": ["1", "2"], "answer": 1},
+    ],
+}
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "questions.json"
+    path.write_text(json.dumps(DATA))
+    return str(path)
+
+
+@pytest.mark.parametrize("bank_class", [CompiledQuestionBank, MappedQuestionBank])
+def test_compiled_round_trip(tmp_path, source, bank_class):
+    target = str(tmp_path / "questions.qbank")
+    assert compile_bank(source, target) == 3
+    bank = bank_class(target)
+    reference = QuestionBank(json.loads(open(source).read()))
+    assert bank.categories() == ["Core", "Strings"]
+    assert bank.count("Core") == 2
+    assert bank.get("Core", 0) == reference.get("Core", 0)
+    assert bank.get("Core", 2) is None
+    assert list(bank.get_all("Strings")) == reference.get_all("Strings")
+    for category in bank.categories():
+        assert bank.ids(category) == reference.ids(category)
+        for qid in reference.ids(category):
+            assert bank.get_by_id(qid) == reference.get_by_id(qid)
+    assert bank.get_by_id("missing") is None
+
+
+def test_open_compiled_bank_detects_stale_source(tmp_path, source):
+    target = str(tmp_path / "questions.qbank")
+    compile_bank(source, target)
+    assert open_compiled_bank(target, source) is not None
+    with open(source, "a") as f:
+        f.write(" ")
+    assert open_compiled_bank(target, source) is None
+    # Without a source to compare against the bank is used as is
+    assert open_compiled_bank(target, None, mapped=False) is not None
+
+
+def test_open_compiled_bank_rejects_missing_and_corrupt(tmp_path, source):
+    target = str(tmp_path / "questions.qbank")
+    assert open_compiled_bank(target, source) is None
+    with open(target, "wb") as f:
+        f.write(b"not a bank" * 10)
+    assert open_compiled_bank(target, source) is None
+    assert os.path.exists(target)
@@ -0,0 +1,145 @@
+import asyncio
+import json
+import pytest
+from engine import QuizEngine
+from history_repository import LEADERBOARD_SIZE
+from history_store import JsonlHistoryStore
+from models import QuizModel
+from server import HttpError, QuizServer
+from sessions import SessionManager
+
+
+@pytest.fixture
+def server(tmp_path):
+    store = JsonlHistoryStore(str(tmp_path / "history.jsonl"), legacy_path="")
+    model = QuizModel(history_store=store, review_path=str(tmp_path / "reviews.jsonl"))
+    server = QuizServer(SessionManager(QuizEngine(model)))
+    yield server
+    server.writer.shutdown(wait=True)
+
+
+def request(method, path, body=None, query=None):
+    return {"method": method, "path": path, "query": query or {}, "json": body or {},
+            "keep_alive": False}
+
+
+def start(server, **body):
+    body.setdefault("player_name", "ann")
+    body.setdefault("category", server.model.get_categories()[0])
+    status, payload = server.route(request("POST", "/sessions", body))
+    assert status == 201
+    return payload["session_id"]
+
+
+@pytest.mark.parametrize("body", [
+    {"player_name": ""},
+    {"category": 5},
+    {"category": ["Core"]},
+    {"length": 0},
+    {"length": True},
+    {"length": "3"},
+])
+def test_start_session_rejects_bad_bodies(server, body):
+    body = {"player_name": "ann", "category": server.model.get_categories()[0], **body}
+    with pytest.raises(HttpError) as error:
+        server.route(request("POST", "/sessions", body))
+    assert error.value.status == 400
+
+
+def test_unknown_category_is_404(server):
+    with pytest.raises(HttpError) as error:
+        server.route(request("POST", "/sessions", {"player_name": "ann", "category": "Nope"}))
+    assert error.value.status == 404
+
+
+@pytest.mark.parametrize("body", [
+    {"selected_index": "1"},
+    {"selected_index": True},
+    {"selected_index": 1, "time": -1},
+    {"selected_index": 1, "time": "3"},
+    {"selected_index": 1, "time": False},
+    {"selected_index": 1, "time": float("inf")},
+])
+def test_submit_answer_rejects_bad_bodies(server, body):
+    session_id = start(server)
+    with pytest.raises(HttpError) as error:
+        server.route(request("POST", f"/sessions/{session_id}/answer", body))
+    assert error.value.status == 400
+
+
+def test_routes_and_methods(server):
+    with pytest.raises(HttpError) as error:
+        server.route(request("GET", "/nowhere"))
+    assert error.value.status == 404
+    with pytest.raises(HttpError) as error:
+        server.route(request("DELETE", "/categories"))
+    assert error.value.status == 405
+    with pytest.raises(HttpError) as error:
+        server.route(request("GET", "/sessions/missing/question"))
+    assert error.value.status == 404
+
+
+def test_leaderboard_limit_stays_within_the_leaderboard(server, monkeypatch):
+    def no_scan(*args, **kwargs):
+        raise AssertionError("history scanned")
+    monkeypatch.setattr("history_repository.heapq.nlargest", no_scan)
+    status, rows = server.route(request("GET", "/leaderboard", query={"limit": ["1000"]}))
+    assert (status, rows) == (200, [])
+    with pytest.raises(HttpError):
+        server.route(request("GET", "/leaderboard", query={"limit": ["ten"]}))
+    assert server.model.history.leaderboard.k == LEADERBOARD_SIZE
+
+
+def exchange(server, raw):
+    """Send raw bytes over a real connection; returns (status line, body)"""
+    async def run():
+        listener = await asyncio.start_server(server.handle_connection, "127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(raw)
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+        listener.close()
+        await listener.wait_closed()
+        return response
+    head, _, body = asyncio.run(run()).partition(b"\r\n\r\n")
+    return head.split(b"\r\n")[0].decode(), json.loads(body)
+
+
+def post(path, body):
+    data = body if isinstance(body, bytes) else json.dumps(body).encode()
+    return (f"POST {path} HTTP/1.1\r\nContent-Length: {len(data)}\r\n"
+            "Connection: close\r\n\r\n").encode() + data
+
+
+def test_bad_json_bodies_over_http(server):
+    assert exchange(server, post("/sessions", b"{nope"))[0] == "HTTP/1.1 400 Bad Request"
+    assert exchange(server, post("/sessions", [1, 2]))[0] == "HTTP/1.1 400 Bad Request"
+
+
+def test_unexpected_errors_answer_500(server, monkeypatch):
+    def broken(request):
+        raise KeyError("boom")
+    monkeypatch.setattr(server, "list_categories", broken)
+    status, body = exchange(server, b"GET /categories HTTP/1.1\r\nConnection: close\r\n\r\n")
+    assert status == "HTTP/1.1 500 Internal Server Error"
+    assert body == {"error": "Internal server error"}
+
+
+def test_full_quiz_over_http(server):
+    category = server.model.get_categories()[0]
+    status, body = exchange(server, post("/sessions", {"player_name": "ann", "category": category,
+                                                       "length": 2}))
+    assert status == "HTTP/1.1 201 Created"
+    session_id = body["session_id"]
+    for _ in range(2):
+        status, body = exchange(server, post(f"/sessions/{session_id}/answer",
+                                             {"selected_index": 0, "time": 1.5}))
+        assert status == "HTTP/1.1 200 OK"
+    assert body["finished"]
+    status, body = exchange(server, post(f"/sessions/{session_id}/finish", {}))
+    assert status == "HTTP/1.1 200 OK"
+    assert body["total"] == 2 and "answers" not in body
+    server.writer.shutdown(wait=True)
+    assert len(server.model.history.store.load()) == 1
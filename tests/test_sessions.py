@@ -0,0 +1,59 @@
+import pytest
+from engine import QuizEngine
+from history_store import JsonlHistoryStore
+from models import QuizModel
+from sessions import SessionManager
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def manager(tmp_path):
+    store = JsonlHistoryStore(str(tmp_path / "history.jsonl"), legacy_path="")
+    model = QuizModel(history_store=store, review_path=str(tmp_path / "reviews.jsonl"))
+    return SessionManager(QuizEngine(model, clock=Clock()), ttl=60)
+
+
+def test_sessions_progress_independently(manager):
+    category = manager.engine.model.get_categories()[0]
+    first = manager.start("ann", category, length=2)
+    second = manager.start("bob", category, length=2)
+    manager.submit_answer(first, 0, 1)
+    assert manager.get_progress(first) == (2, 2)
+    assert manager.get_progress(second) == (1, 2)
+    manager.submit_answer(first, 0, 1)
+    result = manager.finish(first, save=False)
+    assert result["player_name"] == "ann" and result["total"] == 2
+    assert manager.get(first) is None
+    assert len(manager) == 1
+
+
+def test_expire_idle_drops_only_idle_sessions(manager):
+    clock = manager.engine.clock
+    category = manager.engine.model.get_categories()[0]
+    old = manager.start("ann", category)
+    clock.now += 30
+    touched = manager.start("bob", category)
+    fresh = manager.start("cy", category)
+    clock.now += 20
+    # Answering marks a session active again
+    manager.submit_answer(old, 0, 1)
+    clock.now += 45
+    assert manager.expire_idle() == 2
+    assert manager.get(old) is not None
+    assert manager.get(touched) is None and manager.get(fresh) is None
+    assert manager.expire_idle(now=clock.now + 59) == 0
+    assert manager.expire_idle(now=clock.now + 60) == 1
+    assert len(manager) == 0
+
+
+def test_unknown_sessions_return_none(manager):
+    assert manager.get_question("missing") is None
+    assert manager.submit_answer("missing", 0) is None
+    assert manager.finish("missing") is None
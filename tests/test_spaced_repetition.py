@@ -0,0 +1,69 @@
+from spaced_repetition import DAY, INITIAL_EASE, MIN_EASE, ReviewCard, ReviewScheduler
+
+
+def test_card_intervals_follow_sm2():
+    card = ReviewCard("ann", "q1")
+    card.review(4, now=0)
+    assert (card.repetitions, card.interval) == (1, 1)
+    card.review(4, now=0)
+    assert (card.repetitions, card.interval) == (2, 6)
+    ease = card.ease
+    card.review(5, now=0)
+    assert card.repetitions == 3
+    # The interval grows by the ease from before this review
+    assert card.interval == round(6 * ease)
+    assert card.ease > ease
+    assert card.due == card.interval * DAY
+
+
+def test_failed_review_resets_and_lowers_ease():
+    card = ReviewCard("ann", "q1", repetitions=3, interval=15)
+    card.review(0, now=100)
+    assert (card.repetitions, card.interval) == (0, 1)
+    assert card.ease < INITIAL_EASE
+    assert card.due == 100 + DAY
+    for _ in range(20):
+        card.review(0, now=100)
+    assert card.ease == MIN_EASE
+
+
+def test_only_wrong_answers_start_a_schedule(tmp_path):
+    scheduler = ReviewScheduler(str(tmp_path / "reviews.jsonl"))
+    scheduler.record("ann", "q1", 0, True, 5, now=0)
+    scheduler.record("ann", "q2", 1, False, 5, now=0)
+    assert list(scheduler.cards) == [("ann", "q2")]
+
+
+def test_due_returns_most_overdue_first_and_keeps_them_queued(tmp_path):
+    scheduler = ReviewScheduler(str(tmp_path / "reviews.jsonl"))
+    scheduler.record("ann", "late", 1, False, 5, now=0)
+    scheduler.record("ann", "early", 1, False, 5, now=-DAY)
+    scheduler.record("bob", "other", 1, False, 5, now=0)
+    assert scheduler.due("ann", now=-1) == []
+    assert scheduler.due("ann", now=DAY) == ["early", "late"]
+    assert scheduler.due("ann", limit=1, now=DAY) == ["early"]
+    # Answering a question moves it; the stale heap entry is skipped
+    scheduler.record("ann", "early", 0, True, 5, now=DAY)
+    assert scheduler.due("ann", now=DAY) == ["late"]
+
+
+def test_schedule_survives_reload(tmp_path):
+    path = str(tmp_path / "reviews.jsonl")
+    scheduler = ReviewScheduler(path)
+    scheduler.record("ann", "q1", 1, False, 5, now=0)
+    scheduler.record("ann", "q1", 0, True, 5, now=DAY)
+    scheduler.flush()
+    reloaded = ReviewScheduler(path)
+    card = reloaded.cards["ann", "q1"]
+    assert (card.repetitions, card.interval, card.due) == (1, 1, 2 * DAY)
+    assert reloaded.due("ann", now=2 * DAY) == ["q1"]
+
+
+def test_flush_compacts_a_long_log(tmp_path):
+    path = tmp_path / "reviews.jsonl"
+    scheduler = ReviewScheduler(str(path))
+    for step in range(10):
+        scheduler.record("ann", "q1", 1, False, 5, now=step)
+    scheduler.flush()
+    assert len(path.read_text().splitlines()) == 1
+    assert scheduler.pending == []
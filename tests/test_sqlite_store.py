@@ -0,0 +1,53 @@
+import json
+import sqlite3
+from history_store import JsonlHistoryStore, SqliteHistoryStore
+
+
+def test_migrates_the_jsonl_log(tmp_path):
+    log = tmp_path / "history.jsonl"
+    JsonlHistoryStore(str(log), legacy_path="").append_many([
+        {"id": 1, "date": "2024-05-01 10:00", "player_name": "ann", "category": "Core",
+         "score": 3, "total": 4, "percentage": 75.0, "time_seconds": 9, "time_formatted": "0:09"},
+        {"id": 2, "date": "2024-05-02 10:00", "player_name": "bob", "category": "Core",
+         "score": "2/4", "time": "0:20"},
+    ])
+    store = SqliteHistoryStore(str(tmp_path / "history.db"), legacy_path="", log_path=str(log))
+    records = store.load()
+    assert [r["id"] for r in records] == [1, 2]
+    assert records[1]["score"] == 2 and records[1]["percentage"] == 50.0
+    assert records[1]["timestamp"] > 0
+
+
+def test_migrates_legacy_json_once(tmp_path):
+    legacy = tmp_path / "quiz_history.json"
+    legacy.write_text(json.dumps([{"date": "2024-05-01 10:00", "player_name": "ann",
+                                   "category": "Core", "score": "7/10", "time": "1:05"}, 5]))
+    path = str(tmp_path / "history.db")
+    store = SqliteHistoryStore(path, legacy_path=str(legacy), log_path=str(tmp_path / "none.jsonl"))
+    assert [r["score"] for r in store.load()] == [7]
+    store.conn.close()
+    # An existing database is not migrated again
+    reopened = SqliteHistoryStore(path, legacy_path=str(legacy), log_path="")
+    assert len(reopened.load()) == 1
+
+
+def test_append_and_stream_in_order(tmp_path):
+    store = SqliteHistoryStore(str(tmp_path / "history.db"), legacy_path="", log_path="")
+    store.append({"id": 1, "date": "2024-05-01 10:00", "score": 1, "total": 2})
+    store.append_many([{"id": 2, "score": 2, "total": 2}, {"id": 3, "score": 0, "total": 2}])
+    assert [r["id"] for r in store.stream()] == [1, 2, 3]
+
+
+def test_drops_unused_indexes(tmp_path):
+    path = str(tmp_path / "history.db")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE results (id INTEGER PRIMARY KEY AUTOINCREMENT, date TEXT NOT NULL,"
+                 " player_name TEXT NOT NULL, category TEXT NOT NULL, score INTEGER NOT NULL,"
+                 " total INTEGER NOT NULL, percentage REAL NOT NULL,"
+                 " time_seconds INTEGER NOT NULL, data TEXT NOT NULL)")
+    conn.execute("CREATE INDEX idx_results_date ON results (date)")
+    conn.commit()
+    conn.close()
+    store = SqliteHistoryStore(path, legacy_path="", log_path="")
+    indexes = store.conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'").fetchall()
+    assert indexes == []
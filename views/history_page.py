@@ -1,9 +1,8 @@
 import customtkinter as ctk
 from PIL import Image, ImageTk
-import json
-import os
-import datetime
-from collections import defaultdict
+from views.virtual_list import VirtualList
+
+SCORE_ROW_HEIGHT = 96
 
 class HistoryPageView(ctk.CTkFrame):
     def __init__(self, master, controller):
@@ -26,9 +25,10 @@ class HistoryPageView(ctk.CTkFrame):
             "podium_bronze": "#CD7F32"
         }
         
-        # Data storage
-        self.history_file = "quiz_history.json"
-        self.history_data = self.load_history()
+        # Shared history repository; refresh lazily when it changes
+        self.history = controller.model.history
+        self.history.subscribe(self.on_history_changed)
+        self.needs_refresh = False
         self.current_tab = "All Scores"
         
         self.configure(fg_color=self.colors["soft_beige"], corner_radius=0)
@@ -132,14 +132,17 @@ class HistoryPageView(ctk.CTkFrame):
         list_container = ctk.CTkFrame(content_frame, fg_color=self.colors["soft_beige"])
         list_container.pack(fill="both", expand=True)
         
-        # Create scrollable frame
-        self.scrollable_frame = ctk.CTkScrollableFrame(
+        # Virtualized list: only the visible score rows exist as widgets
+        self.score_list = VirtualList(
             list_container,
+            row_height=SCORE_ROW_HEIGHT,
+            create_row=lambda parent: ScoreRow(parent, self),
+            empty_text="No scores found for this filter.",
             fg_color=self.colors["soft_beige"],
             scrollbar_button_color=self.colors["neutral_beige"],
             scrollbar_button_hover_color=self.colors["text_secondary"]
         )
-        self.scrollable_frame.pack(fill="both", expand=True)
+        self.score_list.pack(fill="both", expand=True)
         
         # Navigation buttons
         nav_frame = ctk.CTkFrame(content_frame, fg_color=self.colors["soft_beige"])
@@ -177,84 +180,20 @@ class HistoryPageView(ctk.CTkFrame):
         # Load initial data
         self.refresh_data()
     
-    def load_history(self):
-        """Load quiz history from JSON file"""
-        if os.path.exists(self.history_file):
-            try:
-                with open(self.history_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
-                return []
-        return []
-    
-    def save_history(self):
-        """Save quiz history to JSON file"""
-        try:
-            with open(self.history_file, 'w', encoding='utf-8') as f:
-                json.dump(self.history_data, f, indent=2, default=str)
-        except IOError:
-            print("Warning: Could not save history data")
-    
-    def add_quiz_result(self, player_name, category, score, total, answer_history):
-        """Add a new quiz result to history"""
-        quiz_result = {
-            'id': len(self.history_data) + 1,
-            'date': datetime.datetime.now().strftime("%Y-%m-%d %H:%M"),
-            'player_name': player_name,
-            'category': category,
-            'score': score,
-            'total': total,
-            'percentage': (score / total * 100) if total > 0 else 0,
-            'answer_history': answer_history
-        }
-        
-        self.history_data.append(quiz_result)
-        self.save_history()
-        return quiz_result
-    
     def get_filtered_data(self):
         """Get data filtered by current tab"""
-        if not self.history_data:
-            return []
-        
-        now = datetime.datetime.now()
-        
         if self.current_tab == "All Scores":
-            return sorted(self.history_data, key=lambda x: x['date'], reverse=True)
-        
+            return self.history.all_scores()
         elif self.current_tab == "Last 30 Days":
-            thirty_days_ago = now - datetime.timedelta(days=30)
-            filtered = [
-                result for result in self.history_data
-                if datetime.datetime.strptime(result['date'], "%Y-%m-%d %H:%M") >= thirty_days_ago
-            ]
-            return sorted(filtered, key=lambda x: x['date'], reverse=True)
-        
+            return self.history.last_days(30)
         elif self.current_tab == "Top 10":
-            # Get top 10 by percentage
-            sorted_data = sorted(self.history_data, key=lambda x: x['percentage'], reverse=True)
-            return sorted_data[:10]
-        
+            return self.history.top(10)
         return []
     
     def get_podium_data(self):
         """Get top 3 scores for podium"""
-        if not self.history_data:
-            return []
-        
-        # Group by player and get best score per player
-        player_best = {}
-        for result in self.history_data:
-            player = result['player_name']
-            percentage = result['percentage']
-            if player not in player_best or percentage > player_best[player]['percentage']:
-                player_best[player] = result
-        
-        # Get top 3 players
-        top_players = sorted(player_best.values(), key=lambda x: x['percentage'], reverse=True)[:3]
-        
         podium_data = []
-        for i, player in enumerate(top_players):
+        for i, player in enumerate(self.history.podium(3)):
             podium_data.append({
                 "rank": str(i + 1),
                 "score": f"{int(player['percentage'])}%",
@@ -267,13 +206,12 @@ class HistoryPageView(ctk.CTkFrame):
     
     def refresh_data(self):
         """Refresh all displayed data"""
+        self.needs_refresh = False
+        
         # Clear existing content
         for widget in self.podium_frame.winfo_children():
             widget.destroy()
         
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
-        
         # Get filtered data
         filtered_data = self.get_filtered_data()
         
@@ -291,19 +229,8 @@ class HistoryPageView(ctk.CTkFrame):
             )
             no_data_label.pack(pady=20)
         
-        # Update score list
-        if filtered_data:
-            for result in filtered_data:
-                self.add_score_entry(result)
-        else:
-            # Show placeholder if no data
-            no_scores_label = ctk.CTkLabel(
-                self.scrollable_frame,
-                text="No scores found for this filter.",
-                font=("Arial", 14),
-                text_color=self.colors["text_secondary"]
-            )
-            no_scores_label.pack(pady=20)
+        # Update score list (rows are recycled, not rebuilt)
+        self.score_list.set_items(filtered_data)
     
     def create_podium_section(self, podium_data):
         """Create podium with top 3 scores"""
@@ -404,108 +331,6 @@ class HistoryPageView(ctk.CTkFrame):
             )
             category_label.pack(pady=(5, 0))
     
-    def add_score_entry(self, result):
-        """Add a score entry to the list"""
-        entry_frame = ctk.CTkFrame(
-            self.scrollable_frame,
-            fg_color=self.colors["white"],
-            corner_radius=12,
-            border_width=1,
-            border_color=self.colors["neutral_beige"]
-        )
-        entry_frame.pack(fill="x", pady=5, padx=5)
-        
-        content_frame = ctk.CTkFrame(entry_frame, fg_color=self.colors["white"])
-        content_frame.pack(fill="both", expand=True, padx=15, pady=12)
-        
-        left_frame = ctk.CTkFrame(content_frame, fg_color=self.colors["white"])
-        left_frame.pack(side="left", fill="y")
-        
-        # Rank (based on percentage)
-        rank = self.calculate_rank(result['percentage'])
-        rank_label = ctk.CTkLabel(
-            left_frame,
-            text=f"#{rank}",
-            font=("Arial", 16, "bold"),
-            text_color=self.colors["text_primary"],
-            width=30
-        )
-        rank_label.pack(side="left", padx=(0, 15))
-        
-        # Avatar
-        avatar_frame = ctk.CTkFrame(
-            left_frame,
-            fg_color=self.get_avatar_color(result['player_name'][0].upper() if result['player_name'] else "?"),
-            width=35,
-            height=35,
-            corner_radius=35//2
-        )
-        avatar_frame.pack(side="left")
-        avatar_frame.pack_propagate(False)
-        
-        initial_label = ctk.CTkLabel(
-            avatar_frame,
-            text=result['player_name'][0].upper() if result['player_name'] else "?",
-            font=("Arial", 12, "bold"),
-            text_color="white"
-        )
-        initial_label.pack(expand=True)
-        
-        # Middle section
-        middle_frame = ctk.CTkFrame(content_frame, fg_color=self.colors["white"])
-        middle_frame.pack(side="left", fill="both", expand=True, padx=(15, 0))
-        
-        # Player name and date
-        name_date_label = ctk.CTkLabel(
-            middle_frame,
-            text=f"{result['player_name']} • {result['date']}",
-            font=("Arial", 12),
-            text_color=self.colors["text_primary"],
-            anchor="w"
-        )
-        name_date_label.pack(anchor="w")
-        
-        # Category
-        category_label = ctk.CTkLabel(
-            middle_frame,
-            text=result['category'],
-            font=("Arial", 11),
-            text_color=self.colors["text_secondary"],
-            anchor="w"
-        )
-        category_label.pack(anchor="w", pady=(2, 0))
-        
-        # Score details
-        details_label = ctk.CTkLabel(
-            middle_frame,
-            text=f"{result.get('score', 0)}/{result.get('total', 10)} correct",
-            font=("Arial", 11),
-            text_color=self.colors["text_secondary"],
-            anchor="w"
-        )
-        details_label.pack(anchor="w", pady=(2, 0))
-        
-        # Score pill with percentage
-        percentage = result['percentage']
-        score_color = self.get_score_color(percentage)
-        
-        score_pill = ctk.CTkFrame(
-            content_frame,
-            fg_color=score_color,
-            corner_radius=10
-        )
-        score_pill.pack(side="right")
-        
-        score_label = ctk.CTkLabel(
-            score_pill,
-            text=f"{percentage:.0f}%",
-            font=("Arial", 12, "bold"),
-            text_color="white",
-            padx=15,
-            pady=5
-        )
-        score_label.pack()
-    
     def calculate_rank(self, percentage):
         """Calculate rank based on percentage"""
         if percentage >= 90:
@@ -562,23 +387,19 @@ class HistoryPageView(ctk.CTkFrame):
             )
             underline.configure(fg_color=self.colors["text_primary"] if is_active else "transparent")
         
-        # Update controller
-        if index == 0:
-            self.controller.on_all_scores()
-        elif index == 1:
-            self.controller.on_last_30_days()
-        elif index == 2:
-            self.controller.on_top_10()
-        
         # Refresh data for this tab
         self.refresh_data()
     
-    def update_history_data(self, new_data=None):
-        """Update history data from controller"""
-        if new_data:
-            self.history_data = new_data
-            self.save_history()
-        self.refresh_data()
+    def on_history_changed(self, record):
+        """Repository notification: a new result was added"""
+        self.needs_refresh = True
+        if self.winfo_ismapped():
+            self.refresh_if_needed()
+    
+    def refresh_if_needed(self):
+        """Redraw only if history changed since the last refresh"""
+        if self.needs_refresh:
+            self.refresh_data()
     
     # Controller callbacks
     def on_all_scores(self):
@@ -594,4 +415,126 @@ class HistoryPageView(ctk.CTkFrame):
         self.controller.on_home()
     
     def on_play_again(self):
-        self.controller.on_play_again()
\ No newline at end of file
+        self.controller.on_play_again()
+
+
+class ScoreRow:
+    """Reusable score list row; built once and refilled by show()"""
+    
+    def __init__(self, parent, page):
+        self.page = page
+        colors = page.colors
+        
+        self.frame = ctk.CTkFrame(parent, fg_color=colors["soft_beige"], height=SCORE_ROW_HEIGHT)
+        self.frame.pack_propagate(False)
+        
+        entry_frame = ctk.CTkFrame(
+            self.frame,
+            fg_color=colors["white"],
+            corner_radius=12,
+            border_width=1,
+            border_color=colors["neutral_beige"]
+        )
+        entry_frame.pack(fill="both", expand=True, pady=5, padx=5)
+        
+        content_frame = ctk.CTkFrame(entry_frame, fg_color=colors["white"])
+        content_frame.pack(fill="both", expand=True, padx=15, pady=12)
+        
+        left_frame = ctk.CTkFrame(content_frame, fg_color=colors["white"])
+        left_frame.pack(side="left", fill="y")
+        
+        # Rank (based on percentage)
+        self.rank_label = ctk.CTkLabel(
+            left_frame,
+            text="",
+            font=("Arial", 16, "bold"),
+            text_color=colors["text_primary"],
+            width=30
+        )
+        self.rank_label.pack(side="left", padx=(0, 15))
+        
+        # Avatar
+        self.avatar_frame = ctk.CTkFrame(
+            left_frame,
+            width=35,
+            height=35,
+            corner_radius=35//2
+        )
+        self.avatar_frame.pack(side="left")
+        self.avatar_frame.pack_propagate(False)
+        
+        self.initial_label = ctk.CTkLabel(
+            self.avatar_frame,
+            text="",
+            font=("Arial", 12, "bold"),
+            text_color="white"
+        )
+        self.initial_label.pack(expand=True)
+        
+        # Middle section
+        middle_frame = ctk.CTkFrame(content_frame, fg_color=colors["white"])
+        middle_frame.pack(side="left", fill="both", expand=True, padx=(15, 0))
+        
+        # Player name and date
+        self.name_date_label = ctk.CTkLabel(
+            middle_frame,
+            text="",
+            font=("Arial", 12),
+            text_color=colors["text_primary"],
+            anchor="w"
+        )
+        self.name_date_label.pack(anchor="w")
+        
+        # Category
+        self.category_label = ctk.CTkLabel(
+            middle_frame,
+            text="",
+            font=("Arial", 11),
+            text_color=colors["text_secondary"],
+            anchor="w"
+        )
+        self.category_label.pack(anchor="w", pady=(2, 0))
+        
+        # Score details
+        self.details_label = ctk.CTkLabel(
+            middle_frame,
+            text="",
+            font=("Arial", 11),
+            text_color=colors["text_secondary"],
+            anchor="w"
+        )
+        self.details_label.pack(anchor="w", pady=(2, 0))
+        
+        # Score pill with percentage
+        self.score_pill = ctk.CTkFrame(content_frame, corner_radius=10)
+        self.score_pill.pack(side="right")
+        
+        self.score_label = ctk.CTkLabel(
+            self.score_pill,
+            text="",
+            font=("Arial", 12, "bold"),
+            text_color="white",
+            padx=15,
+            pady=5
+        )
+        self.score_label.pack()
+        
+        self.result = None
+    
+    def show(self, result):
+        """Fill the row with a history record"""
+        if result == self.result:
+            return
+        self.result = result
+        
+        initial = result['player_name'][0].upper() if result['player_name'] else "?"
+        percentage = result['percentage']
+        
+        self.rank_label.configure(text=f"#{self.page.calculate_rank(percentage)}")
+        self.avatar_frame.configure(fg_color=self.page.get_avatar_color(initial))
+        self.initial_label.configure(text=initial)
+        self.name_date_label.configure(text=f"{result['player_name']} • {result['date']}")
+        self.category_label.configure(text=result['category'])
+        self.details_label.configure(text=f"{result.get('score', 0)}/{result.get('total', 10)} correct")
+        self.score_pill.configure(fg_color=self.page.get_score_color(percentage))
+        self.score_label.configure(text=f"{percentage:.0f}%")
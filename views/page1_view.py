@@ -1,6 +1,6 @@
 import customtkinter as ctk
 from tkinter import messagebox
-from PIL import Image, ImageTk
+from assets import load_image
 
 class Page1View(ctk.CTkFrame):
     def __init__(self, master, controller):
@@ -35,19 +35,15 @@ class Page1View(ctk.CTkFrame):
         header_content = ctk.CTkFrame(header_frame, fg_color=self.colors["dark_navy"])
         header_content.pack(expand=True, fill="both", padx=30)
         
-        try:
-            brain_img = ctk.CTkImage(
-                light_image=Image.open("brain.png"),
-                dark_image=Image.open("brain.png"),
-                size=(50, 50)
-            )
+        brain_img = load_image("brain.png", (50, 50))
+        if brain_img is not None:
             brain_label = ctk.CTkLabel(
                 header_content,
                 image=brain_img,
                 text=""
             )
             brain_label.pack(side="left", padx=(0, 15))
-        except:
+        else:
             brain_label = ctk.CTkLabel(
                 header_content,
                 text="🧠",
@@ -101,12 +97,8 @@ class Page1View(ctk.CTkFrame):
         image_container.pack()
         image_container.pack_propagate(False)
         
-        try:
-            boy_img = ctk.CTkImage(
-                light_image=Image.open("boy.png"),
-                dark_image=Image.open("boy.png"),
-                size=(200, 200)
-            )
+        boy_img = load_image("boy.png", (200, 200))
+        if boy_img is not None:
             boy_label = ctk.CTkLabel(
                 image_container,
                 image=boy_img,
@@ -114,7 +106,7 @@ class Page1View(ctk.CTkFrame):
                 fg_color=self.colors["white"]
             )
             boy_label.pack(expand=True, padx=10, pady=10)
-        except:
+        else:
             fallback_label = ctk.CTkLabel(
                 image_container,
                 text="🧑‍💻",
@@ -1,7 +1,12 @@
 import customtkinter as ctk
-from PIL import Image, ImageTk
+from tkinter import messagebox
+from assets import load_image
 
 class Page2View(ctk.CTkFrame):
+    # Category cards per page; cards are built once and refilled on paging
+    PAGE_SIZE = 6
+    COLUMNS = 2
+    
     def __init__(self, master, controller):
         super().__init__(master)
         self.controller = controller
@@ -15,14 +20,10 @@ class Page2View(ctk.CTkFrame):
             "text_secondary": "#4A4E69",
             "accent": "#4A4E69",
             "button_bg": "#22223B",
-            "highlight": "#ECB45E",
-            "category_colors": {
-                "Core": "#FF6B6B",
-                "Advanced": "#4ECDC4",
-                "Modules": "#45B7D1",
-                "Techniques": "#96CEB4"
-            }
+            "highlight": "#ECB45E"
         }
+        self.catalog = controller.model.categories
+        self.page = 0
         
         self.configure(fg_color=self.colors["soft_beige"], corner_radius=0)
         self.grid_columnconfigure(0, weight=1)
@@ -82,12 +83,8 @@ class Page2View(ctk.CTkFrame):
         subtitle_label.pack(anchor="w", pady=(8, 0))
         
         # Character illustration (right) - transparent background
-        try:
-            character_img = ctk.CTkImage(
-                light_image=Image.open("boy_yellow.png"),
-                dark_image=Image.open("boy_yellow.png"),
-                size=(140, 140)
-            )
+        character_img = load_image("boy_yellow.png", (140, 140))
+        if character_img is not None:
             character_label = ctk.CTkLabel(
                 header_content,
                 image=character_img,
@@ -95,7 +92,7 @@ class Page2View(ctk.CTkFrame):
                 fg_color=self.colors["dark_navy"]  # Match header background
             )
             character_label.pack(side="right")
-        except:
+        else:
             character_label = ctk.CTkLabel(
                 header_content,
                 text="🧑‍💻",
@@ -151,126 +148,203 @@ class Page2View(ctk.CTkFrame):
             border_color=self.colors["accent"],
             command=self.controller.show_history
         )
-        history_button.grid(row=0, column=1, sticky="e")
+        history_button.grid(row=0, column=2, sticky="e")
+        
+        review_button = ctk.CTkButton(
+            explore_header,
+            text="Review",
+            font=("Arial", 14),
+            width=100,
+            height=40,
+            corner_radius=20,
+            fg_color=self.colors["white"],
+            hover_color="#F0F0F0",
+            text_color=self.colors["text_primary"],
+            border_width=2,
+            border_color=self.colors["accent"],
+            command=self.start_review
+        )
+        review_button.grid(row=0, column=1, sticky="e", padx=(0, 10))
         
         # CATEGORIES GRID - Using grid for equal sizing
-        categories_frame = ctk.CTkFrame(body_frame, fg_color=self.colors["soft_beige"])
+        self.categories_frame = categories_frame = ctk.CTkFrame(body_frame, fg_color=self.colors["soft_beige"])
         categories_frame.pack(fill="both", expand=True)
         
         # Configure grid with equal columns
-        categories_frame.grid_columnconfigure(0, weight=1)
-        categories_frame.grid_columnconfigure(1, weight=1)
-        categories_frame.grid_rowconfigure(0, weight=1)
-        categories_frame.grid_rowconfigure(1, weight=1)
-        
-        # Category descriptions
-        category_info = {
-            "Core": "Basic Python concepts",
-            "Advanced": "Complex Python features", 
-            "Modules": "Standard libraries & packages",
-            "Techniques": "Programming techniques"
-        }
+        for col in range(self.COLUMNS):
+            categories_frame.grid_columnconfigure(col, weight=1)
+        
+        # Card pool for one page, filled from the category catalog
+        self.cards = []
+        for i in range(self.PAGE_SIZE):
+            row = i // self.COLUMNS
+            col = i % self.COLUMNS
+            card = CategoryCard(categories_frame, self.colors, self.controller.select_category)
+            card.container.grid(row=row, column=col, padx=(0, 15) if col == 0 else (15, 0), pady=(0, 15) if row == 0 else 15, sticky="nsew")
+            self.cards.append(card)
+        
+        # Pager, shown only when the categories don't fit on one page
+        self.pager = ctk.CTkFrame(body_frame, fg_color=self.colors["soft_beige"])
+        pager_button = dict(
+            font=("Arial", 14),
+            width=100,
+            height=36,
+            corner_radius=18,
+            fg_color=self.colors["white"],
+            hover_color="#F0F0F0",
+            text_color=self.colors["text_primary"],
+            border_width=2,
+            border_color=self.colors["accent"]
+        )
+        self.prev_button = ctk.CTkButton(self.pager, text="← Prev", command=lambda: self.show_page(self.page - 1), **pager_button)
+        self.prev_button.pack(side="left")
+        self.next_button = ctk.CTkButton(self.pager, text="Next →", command=lambda: self.show_page(self.page + 1), **pager_button)
+        self.next_button.pack(side="right")
+        self.page_label = ctk.CTkLabel(
+            self.pager,
+            text="",
+            font=("Arial", 14),
+            text_color=self.colors["text_secondary"]
+        )
+        self.page_label.pack(expand=True)
         
-        # Create category cards in grid
-        categories = ["Core", "Advanced", "Modules", "Techniques"]
-        for i, category in enumerate(categories):
-            row = i // 2
-            col = i % 2
-            
-            # Create card container with fixed minimum size
-            card_container = ctk.CTkFrame(
-                categories_frame,
-                fg_color=self.colors["white"],
-                corner_radius=20,
-                border_width=0
-            )
-            card_container.grid(row=row, column=col, padx=(0, 15) if col == 0 else (15, 0), pady=(0, 15) if row == 0 else 15, sticky="nsew")
-            
-            # Make card clickable
-            card_container.bind("<Button-1>", lambda e, cat=category: self.controller.select_category(cat))
-            card_container.configure(cursor="hand2")
-            
-            # Create the card content
-            self.create_category_card(card_container, category, category_info[category])
+        self.show_page(0)
         
         # Add bottom padding
         bottom_padding = ctk.CTkFrame(scrollable_frame, fg_color=self.colors["soft_beige"], height=40)
         bottom_padding.pack(fill="x")
     
-    def create_category_card(self, parent, category, description):
-        color = self.colors["category_colors"][category]
+    def start_review(self):
+        """Start a review of due questions, or say that none are due"""
+        if not self.controller.start_review():
+            messagebox.showinfo(
+                "Review",
+                "No questions are due for review.\nQuestions you get wrong come back here on a schedule."
+            )
+    
+    def show_page(self, page):
+        """Fill the card pool with one page of categories"""
+        page_count = self.catalog.page_count(self.PAGE_SIZE)
+        self.page = min(max(page, 0), page_count - 1)
+        infos = self.catalog.page(self.page, self.PAGE_SIZE)
+        for i, card in enumerate(self.cards):
+            if i < len(infos):
+                card.show(infos[i])
+            else:
+                card.hide()
+        # Only rows holding cards share the extra height
+        for row in range(self.PAGE_SIZE // self.COLUMNS):
+            filled = row * self.COLUMNS < len(infos)
+            self.categories_frame.grid_rowconfigure(row, weight=1 if filled else 0)
+        
+        if page_count > 1:
+            self.page_label.configure(text=f"{self.page + 1} / {page_count}")
+            self.prev_button.configure(state="normal" if self.page > 0 else "disabled")
+            self.next_button.configure(state="normal" if self.page < page_count - 1 else "disabled")
+            self.pager.pack(fill="x", pady=(10, 0))
+        else:
+            self.pager.pack_forget()
+
+
+class CategoryCard:
+    """Reusable category card; show() refills it for another category"""
+    
+    def __init__(self, parent, colors, on_select):
+        self.colors = colors
+        self.on_select = on_select
+        self.info = None
+        
+        # Create card container with fixed minimum size
+        self.container = ctk.CTkFrame(
+            parent,
+            fg_color=colors["white"],
+            corner_radius=20,
+            border_width=0
+        )
+        
+        # Make card clickable
+        self.container.bind("<Button-1>", self.select)
+        self.container.configure(cursor="hand2")
         
         # Configure parent to expand
-        parent.grid_rowconfigure(0, weight=1)
-        parent.grid_columnconfigure(0, weight=1)
+        self.container.grid_rowconfigure(0, weight=1)
+        self.container.grid_columnconfigure(0, weight=1)
         
         # Main content frame
-        content_frame = ctk.CTkFrame(parent, fg_color=self.colors["white"])
+        content_frame = ctk.CTkFrame(self.container, fg_color=colors["white"])
         content_frame.grid(row=0, column=0, sticky="nsew", padx=25, pady=20)
         
         # Left section (icon and text)
-        left_frame = ctk.CTkFrame(content_frame, fg_color=self.colors["white"])
+        left_frame = ctk.CTkFrame(content_frame, fg_color=colors["white"])
         left_frame.pack(side="left", fill="both", expand=True)
         
         # Icon with background color
-        icon_frame = ctk.CTkFrame(
+        self.icon_frame = ctk.CTkFrame(
             left_frame,
-            fg_color=color,
             width=60,
             height=60,
             corner_radius=15
         )
-        icon_frame.pack(anchor="w")
-        icon_frame.pack_propagate(False)
-        
-        # Category emojis
-        category_emojis = {
-            "Core": "🐍",
-            "Advanced": "🚀", 
-            "Modules": "📦",
-            "Techniques": "💡"
-        }
+        self.icon_frame.pack(anchor="w")
+        self.icon_frame.pack_propagate(False)
         
-        icon_label = ctk.CTkLabel(
-            icon_frame,
-            text=category_emojis.get(category, "📚"),
+        self.icon_label = ctk.CTkLabel(
+            self.icon_frame,
+            text="",
             font=("Arial", 28),
-            text_color="white",
-            fg_color=color
+            text_color="white"
         )
-        icon_label.pack(expand=True)
+        self.icon_label.pack(expand=True)
         
-        # Category name - MAKE SURE IT SHOWS
-        category_label = ctk.CTkLabel(
+        # Category name
+        self.category_label = ctk.CTkLabel(
             left_frame,
-            text=category,
+            text="",
             font=("Arial", 18, "bold"),
-            text_color=self.colors["text_primary"],
+            text_color=colors["text_primary"],
             anchor="w"
         )
-        category_label.pack(anchor="w", pady=(15, 5))
+        self.category_label.pack(anchor="w", pady=(15, 5))
         
-        # Description - MAKE SURE IT SHOWS
-        desc_label = ctk.CTkLabel(
+        # Description
+        self.desc_label = ctk.CTkLabel(
             left_frame,
-            text=description,
+            text="",
             font=("Arial", 12),
-            text_color=self.colors["text_secondary"],
+            text_color=colors["text_secondary"],
             anchor="w"
         )
-        desc_label.pack(anchor="w")
+        self.desc_label.pack(anchor="w")
         
         # Right section (arrow)
-        right_frame = ctk.CTkFrame(content_frame, fg_color=self.colors["white"], width=40)
+        right_frame = ctk.CTkFrame(content_frame, fg_color=colors["white"], width=40)
         right_frame.pack(side="right")
         right_frame.pack_propagate(False)
         
-        arrow_label = ctk.CTkLabel(
+        self.arrow_label = ctk.CTkLabel(
             right_frame,
             text="→",
             font=("Arial", 28, "bold"),
-            text_color=color,
-            fg_color=self.colors["white"]
+            fg_color=colors["white"]
         )
-        arrow_label.pack(expand=True)
-        arrow_label.bind("<Button-1>", lambda e, cat=category: self.controller.select_category(cat))
\ No newline at end of file
+        self.arrow_label.pack(expand=True)
+        self.arrow_label.bind("<Button-1>", self.select)
+    
+    def select(self, event=None):
+        if self.info is not None:
+            self.on_select(self.info.name)
+    
+    def show(self, info):
+        """Fill the card with a CategoryInfo"""
+        if info != self.info:
+            self.info = info
+            self.icon_frame.configure(fg_color=info.color)
+            self.icon_label.configure(text=info.emoji, fg_color=info.color)
+            self.category_label.configure(text=info.name)
+            self.desc_label.configure(text=info.description)
+            self.arrow_label.configure(text_color=info.color)
+        self.container.grid()
+    
+    def hide(self):
+        self.info = None
+        self.container.grid_remove()
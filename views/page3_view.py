@@ -1,5 +1,6 @@
 import customtkinter as ctk
 import time
+from scheduler import AfterScheduler
 
 class Page3View(ctk.CTkFrame):
     def __init__(self, master, controller):
@@ -20,6 +21,9 @@ class Page3View(ctk.CTkFrame):
             "selected_blue": "#2196F3"
         }
         
+        # All after() callbacks of this view go through one scheduler
+        self.scheduler = AfterScheduler(self)
+        
         self.configure(fg_color=self.colors["soft_beige"], corner_radius=0)
         self.create_widgets()
     
@@ -305,6 +309,7 @@ class Page3View(ctk.CTkFrame):
     
     def stop_question_timer(self):
         """Stop timing the current question"""
+        self.scheduler.cancel("tick")
         if self.question_start_time:
             self.question_time = int(time.time() - self.question_start_time)
             self.question_start_time = 0
@@ -314,7 +319,8 @@ class Page3View(ctk.CTkFrame):
         if self.question_start_time:
             current_time = int(time.time() - self.question_start_time)
             self.timer_label.configure(text=f"{current_time}s")
-            self.after(1000, self.update_timer_display)
+            # Re-arming the same key keeps a single tick loop alive
+            self.scheduler.schedule("tick", 1000, self.update_timer_display)
     
     def start_quiz_timer(self):
         """Start the overall quiz timer"""
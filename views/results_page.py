@@ -1,5 +1,5 @@
 import customtkinter as ctk
-from PIL import Image, ImageTk
+from assets import load_image
 
 class ResultsPageView(ctk.CTkFrame):
     def __init__(self, master, controller):
@@ -63,19 +63,15 @@ class ResultsPageView(ctk.CTkFrame):
         )
         self.score_label.pack(side="left", expand=True)
         
-        try:
-            trophy_img = ctk.CTkImage(
-                light_image=Image.open("trophy.png"),
-                dark_image=Image.open("trophy.png"),
-                size=(40, 40)
-            )
+        trophy_img = load_image("trophy.png", (40, 40))
+        if trophy_img is not None:
             trophy_label = ctk.CTkLabel(
                 score_trophy_frame,
                 image=trophy_img,
                 text=""
             )
             trophy_label.pack(side="right", padx=(10, 0))
-        except:
+        else:
             trophy_label = ctk.CTkLabel(
                 score_trophy_frame,
                 text="🏆",
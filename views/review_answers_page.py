@@ -28,6 +28,7 @@ class ReviewAnswersPage(ctk.CTkFrame):
         # Store answer history and questions
         self.answer_history = []
         self.questions_data = []
+        self.cards = []  # Pool of QuestionCard widgets reused across reviews
         
         self.create_widgets()
     
@@ -81,6 +82,13 @@ class ReviewAnswersPage(ctk.CTkFrame):
         )
         self.scrollable_frame.pack(fill="both", expand=True, padx=20, pady=20)
         
+        self.no_data_label = ctk.CTkLabel(
+            self.scrollable_frame,
+            text="No answer data available for review.",
+            font=("Arial", 16),
+            text_color=self.colors["text_secondary"]
+        )
+        
         # Summary frame
         self.summary_frame = ctk.CTkFrame(
             main_frame,
@@ -106,182 +114,237 @@ class ReviewAnswersPage(ctk.CTkFrame):
         self.display_review()
     
     def display_review(self):
-        """Display all questions with answers"""
-        # Clear existing content
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
-        
+        """Display all questions with answers, reusing pooled cards"""
         if not self.answer_history or not self.questions_data:
-            no_data_label = ctk.CTkLabel(
-                self.scrollable_frame,
-                text="No answer data available for review.",
-                font=("Arial", 16),
-                text_color=self.colors["text_secondary"]
-            )
-            no_data_label.pack(pady=50)
+            for card in self.cards:
+                card.hide()
+            self.no_data_label.pack(pady=50)
+            self.summary_label.configure(text="")
             return
+        self.no_data_label.pack_forget()
         
         total_questions = len(self.questions_data)
         correct_count = 0
         
-        for i, (question_data, answer_data) in enumerate(zip(self.questions_data, self.answer_history)):
-            # Create question card
-            question_card = ctk.CTkFrame(
-                self.scrollable_frame,
-                fg_color=self.colors["white"],
-                corner_radius=15,
-                border_width=2,
-                border_color=self.colors["neutral_gray"]
-            )
-            question_card.pack(fill="x", pady=10, padx=5)
-            
-            # Question header
-            header_frame = ctk.CTkFrame(question_card, fg_color=self.colors["white"])
-            header_frame.pack(fill="x", padx=20, pady=(15, 10))
-            
-            # Question number and status
-            is_correct = answer_data.get("is_correct", False)
-            if is_correct:
+        pairs = list(zip(self.questions_data, self.answer_history))
+        while len(self.cards) < len(pairs):
+            self.cards.append(QuestionCard(self.scrollable_frame, self.colors))
+        
+        for i, (question_data, answer_data) in enumerate(pairs):
+            if answer_data.get("is_correct", False):
                 correct_count += 1
-                status_text = "✓ Correct"
-                status_color = self.colors["correct_green"]
-                card_bg = self.colors["light_green"]
-            else:
-                status_text = "✗ Incorrect"
-                status_color = self.colors["incorrect_red"]
-                card_bg = self.colors["light_red"]
-            
-            # Set card background color based on correctness
-            question_card.configure(fg_color=card_bg)
-            
-            # Question number
-            question_num_label = ctk.CTkLabel(
-                header_frame,
-                text=f"Question {i + 1}",
-                font=("Arial", 16, "bold"),
-                text_color=self.colors["text_primary"]
-            )
-            question_num_label.pack(side="left")
-            
-            # Status indicator
-            status_label = ctk.CTkLabel(
-                header_frame,
-                text=status_text,
-                font=("Arial", 14, "bold"),
-                text_color=status_color
-            )
-            status_label.pack(side="right")
-            
-            # Question text
-            question_frame = ctk.CTkFrame(question_card, fg_color=card_bg)
-            question_frame.pack(fill="x", padx=20, pady=(0, 10))
-            
-            question_text_label = ctk.CTkLabel(
-                question_frame,
-                text=question_data["question"],
-                font=("Arial", 14),
-                text_color=self.colors["text_primary"],
-                wraplength=550,
-                justify="left"
-            )
-            question_text_label.pack(anchor="w")
-            
-            # Answers section
-            answers_frame = ctk.CTkFrame(question_card, fg_color=card_bg)
-            answers_frame.pack(fill="x", padx=20, pady=(0, 15))
-            
-            # User's answer
-            user_answer_frame = ctk.CTkFrame(answers_frame, fg_color=card_bg)
-            user_answer_frame.pack(fill="x", pady=(0, 10))
-            
-            user_label = ctk.CTkLabel(
-                user_answer_frame,
-                text="Your Answer:",
-                font=("Arial", 13, "bold"),
-                text_color=self.colors["text_secondary"]
-            )
-            user_label.pack(anchor="w", pady=(0, 5))
-            
-            selected_index = answer_data.get("selected_index", -1)
-            if 0 <= selected_index < len(question_data["options"]):
-                user_answer_text = question_data["options"][selected_index]
-                user_answer_color = status_color
-            else:
-                user_answer_text = "No answer selected"
-                user_answer_color = self.colors["text_secondary"]
-            
-            user_answer_label = ctk.CTkLabel(
-                user_answer_frame,
-                text=user_answer_text,
-                font=("Arial", 13),
-                text_color=user_answer_color,
-                wraplength=500,
-                justify="left"
-            )
-            user_answer_label.pack(anchor="w", padx=20)
-            
-            # Correct answer
-            correct_answer_frame = ctk.CTkFrame(answers_frame, fg_color=card_bg)
-            correct_answer_frame.pack(fill="x")
-            
-            correct_label = ctk.CTkLabel(
-                correct_answer_frame,
-                text="Correct Answer:",
-                font=("Arial", 13, "bold"),
-                text_color=self.colors["text_secondary"]
-            )
-            correct_label.pack(anchor="w", pady=(0, 5))
-            
-            correct_index = question_data.get("answer", question_data.get("correct_answer", 0))
-            if 0 <= correct_index < len(question_data["options"]):
-                correct_answer_text = question_data["options"][correct_index]
-            else:
-                correct_answer_text = "Error: No correct answer found"
-            
-            correct_answer_label = ctk.CTkLabel(
-                correct_answer_frame,
-                text=correct_answer_text,
-                font=("Arial", 13),
-                text_color=self.colors["correct_green"],
-                wraplength=500,
-                justify="left"
-            )
-            correct_answer_label.pack(anchor="w", padx=20)
-            
-            # Explanation (if available)
-            if "explanation" in question_data:
-                explanation_frame = ctk.CTkFrame(question_card, fg_color=card_bg)
-                explanation_frame.pack(fill="x", padx=20, pady=(0, 15))
-                
-                explanation_label = ctk.CTkLabel(
-                    explanation_frame,
-                text="Explanation:",
-                    font=("Arial", 13, "bold"),
-                    text_color=self.colors["text_secondary"]
-                )
-                explanation_label.pack(anchor="w", pady=(0, 5))
-                
-                explanation_text_label = ctk.CTkLabel(
-                    explanation_frame,
-                    text=question_data["explanation"],
-                    font=("Arial", 12),
-                    text_color=self.colors["text_primary"],
-                    wraplength=500,
-                    justify="left"
-                )
-                explanation_text_label.pack(anchor="w", padx=20)
-            
-            # Separator
-            if i < total_questions - 1:
-                separator = ctk.CTkFrame(
-                    self.scrollable_frame,
-                    height=2,
-                    fg_color=self.colors["neutral_gray"]
-                )
-                separator.pack(fill="x", pady=5, padx=20)
+            # Only cards whose content changed are reconfigured
+            self.cards[i].update(i, question_data, answer_data, is_last=(i == total_questions - 1))
+            self.cards[i].show()
+        
+        for card in self.cards[len(pairs):]:
+            card.hide()
         
         # Update summary
         percentage = (correct_count / total_questions * 100) if total_questions > 0 else 0
         self.summary_label.configure(
             text=f"Score: {correct_count}/{total_questions} ({percentage:.1f}%)"
-        )
\ No newline at end of file
+        )
+
+
+class QuestionCard:
+    """Pooled review card; widgets are built once and reconfigured in place"""
+    
+    def __init__(self, parent, colors):
+        self.colors = colors
+        self.key = None
+        self.visible = False
+        
+        # Wrapper keeps the card and its separator together in pack order
+        self.wrapper = ctk.CTkFrame(parent, fg_color=colors["soft_beige"])
+        
+        self.card = ctk.CTkFrame(
+            self.wrapper,
+            fg_color=colors["white"],
+            corner_radius=15,
+            border_width=2,
+            border_color=colors["neutral_gray"]
+        )
+        self.card.pack(fill="x", pady=10, padx=5)
+        
+        # Question header
+        self.header_frame = ctk.CTkFrame(self.card, fg_color=colors["white"])
+        self.header_frame.pack(fill="x", padx=20, pady=(15, 10))
+        
+        self.question_num_label = ctk.CTkLabel(
+            self.header_frame,
+            text="",
+            font=("Arial", 16, "bold"),
+            text_color=colors["text_primary"]
+        )
+        self.question_num_label.pack(side="left")
+        
+        self.status_label = ctk.CTkLabel(
+            self.header_frame,
+            text="",
+            font=("Arial", 14, "bold")
+        )
+        self.status_label.pack(side="right")
+        
+        # Question text
+        self.question_frame = ctk.CTkFrame(self.card)
+        self.question_frame.pack(fill="x", padx=20, pady=(0, 10))
+        
+        self.question_text_label = ctk.CTkLabel(
+            self.question_frame,
+            text="",
+            font=("Arial", 14),
+            text_color=colors["text_primary"],
+            wraplength=550,
+            justify="left"
+        )
+        self.question_text_label.pack(anchor="w")
+        
+        # Answers section
+        self.answers_frame = ctk.CTkFrame(self.card)
+        self.answers_frame.pack(fill="x", padx=20, pady=(0, 15))
+        
+        # User's answer
+        self.user_answer_frame = ctk.CTkFrame(self.answers_frame)
+        self.user_answer_frame.pack(fill="x", pady=(0, 10))
+        
+        user_label = ctk.CTkLabel(
+            self.user_answer_frame,
+            text="Your Answer:",
+            font=("Arial", 13, "bold"),
+            text_color=colors["text_secondary"]
+        )
+        user_label.pack(anchor="w", pady=(0, 5))
+        
+        self.user_answer_label = ctk.CTkLabel(
+            self.user_answer_frame,
+            text="",
+            font=("Arial", 13),
+            wraplength=500,
+            justify="left"
+        )
+        self.user_answer_label.pack(anchor="w", padx=20)
+        
+        # Correct answer
+        self.correct_answer_frame = ctk.CTkFrame(self.answers_frame)
+        self.correct_answer_frame.pack(fill="x")
+        
+        correct_label = ctk.CTkLabel(
+            self.correct_answer_frame,
+            text="Correct Answer:",
+            font=("Arial", 13, "bold"),
+            text_color=colors["text_secondary"]
+        )
+        correct_label.pack(anchor="w", pady=(0, 5))
+        
+        self.correct_answer_label = ctk.CTkLabel(
+            self.correct_answer_frame,
+            text="",
+            font=("Arial", 13),
+            text_color=colors["correct_green"],
+            wraplength=500,
+            justify="left"
+        )
+        self.correct_answer_label.pack(anchor="w", padx=20)
+        
+        # Explanation (shown only when available)
+        self.explanation_frame = ctk.CTkFrame(self.card)
+        
+        explanation_label = ctk.CTkLabel(
+            self.explanation_frame,
+            text="Explanation:",
+            font=("Arial", 13, "bold"),
+            text_color=colors["text_secondary"]
+        )
+        explanation_label.pack(anchor="w", pady=(0, 5))
+        
+        self.explanation_text_label = ctk.CTkLabel(
+            self.explanation_frame,
+            text="",
+            font=("Arial", 12),
+            text_color=colors["text_primary"],
+            wraplength=500,
+            justify="left"
+        )
+        self.explanation_text_label.pack(anchor="w", padx=20)
+        
+        # Separator
+        self.separator = ctk.CTkFrame(
+            self.wrapper,
+            height=2,
+            fg_color=colors["neutral_gray"]
+        )
+    
+    def update(self, index, question_data, answer_data, is_last):
+        """Reconfigure the card; skipped entirely when nothing changed"""
+        selected_index = answer_data.get("selected_index", -1)
+        is_correct = answer_data.get("is_correct", False)
+        key = (
+            index,
+            question_data["question"],
+            tuple(question_data["options"]),
+            question_data.get("answer", question_data.get("correct_answer", 0)),
+            question_data.get("explanation"),
+            selected_index,
+            is_correct,
+            is_last
+        )
+        if key == self.key:
+            return
+        self.key = key
+        
+        if is_correct:
+            status_text = "✓ Correct"
+            status_color = self.colors["correct_green"]
+            card_bg = self.colors["light_green"]
+        else:
+            status_text = "✗ Incorrect"
+            status_color = self.colors["incorrect_red"]
+            card_bg = self.colors["light_red"]
+        
+        # Set card background color based on correctness
+        self.card.configure(fg_color=card_bg)
+        for frame in (self.question_frame, self.answers_frame, self.user_answer_frame,
+                      self.correct_answer_frame, self.explanation_frame):
+            frame.configure(fg_color=card_bg)
+        
+        self.question_num_label.configure(text=f"Question {index + 1}")
+        self.status_label.configure(text=status_text, text_color=status_color)
+        self.question_text_label.configure(text=question_data["question"])
+        
+        options = question_data["options"]
+        if 0 <= selected_index < len(options):
+            self.user_answer_label.configure(text=options[selected_index], text_color=status_color)
+        else:
+            self.user_answer_label.configure(
+                text="No answer selected",
+                text_color=self.colors["text_secondary"]
+            )
+        
+        correct_index = question_data.get("answer", question_data.get("correct_answer", 0))
+        if 0 <= correct_index < len(options):
+            correct_answer_text = options[correct_index]
+        else:
+            correct_answer_text = "Error: No correct answer found"
+        self.correct_answer_label.configure(text=correct_answer_text)
+        
+        if "explanation" in question_data:
+            self.explanation_text_label.configure(text=question_data["explanation"])
+            self.explanation_frame.pack(fill="x", padx=20, pady=(0, 15))
+        else:
+            self.explanation_frame.pack_forget()
+        
+        if is_last:
+            self.separator.pack_forget()
+        else:
+            self.separator.pack(fill="x", pady=5, padx=20)
+    
+    def show(self):
+        if not self.visible:
+            self.wrapper.pack(fill="x")
+            self.visible = True
+    
+    def hide(self):
+        if self.visible:
+            self.wrapper.pack_forget()
+            self.visible = False
@@ -0,0 +1,132 @@
+import math
+import customtkinter as ctk
+
+class VirtualList(ctk.CTkFrame):
+    """Scrollable list that only builds widgets for the visible rows
+
+    Rows are created by `create_row(parent)`, which must return an object
+    with a `frame` attribute (built with height=row_height) and a
+    `show(item)` method. Row widgets are
+    recycled while scrolling, so the cost of a redraw depends on the
+    viewport height and not on the number of items.
+    """
+
+    BUFFER_ROWS = 2
+
+    def __init__(self, master, row_height, create_row, empty_text="",
+                 fg_color="transparent", scrollbar_button_color=None,
+                 scrollbar_button_hover_color=None):
+        super().__init__(master, fg_color=fg_color)
+        self.row_height = row_height
+        self.create_row = create_row
+        self.items = []
+        self.rows = []  # Pool of row objects, grows with the viewport only
+        self.offset = 0  # Scroll position in pixels
+
+        self.viewport = ctk.CTkFrame(self, fg_color=fg_color, corner_radius=0)
+        self.viewport.pack(side="left", fill="both", expand=True)
+
+        self.scrollbar = ctk.CTkScrollbar(
+            self,
+            command=self.on_scrollbar,
+            button_color=scrollbar_button_color,
+            button_hover_color=scrollbar_button_hover_color
+        )
+        self.scrollbar.pack(side="right", fill="y")
+
+        self.empty_label = ctk.CTkLabel(
+            self.viewport,
+            text=empty_text,
+            font=("Arial", 14),
+            text_color="#4A4E69"
+        )
+
+        self.viewport.bind("<Configure>", lambda e: self.render())
+        self.viewport.bind("<Enter>", self.bind_mousewheel)
+        self.viewport.bind("<Leave>", self.unbind_mousewheel)
+
+    def set_items(self, items):
+        """Replace the list contents and scroll back to the top"""
+        self.items = items
+        self.offset = 0
+        self.render()
+
+    def max_offset(self):
+        height = self.viewport.winfo_height()
+        return max(0, len(self.items) * self.row_height - height)
+
+    def ensure_rows(self, count):
+        """Grow the row pool to `count` rows"""
+        while len(self.rows) < count:
+            self.rows.append(self.create_row(self.viewport))
+
+    def render(self):
+        """Place and fill the rows that intersect the viewport"""
+        height = max(self.viewport.winfo_height(), self.row_height)
+        visible = math.ceil(height / self.row_height) + self.BUFFER_ROWS
+        self.ensure_rows(min(visible, len(self.items)))
+        self.offset = min(max(self.offset, 0), self.max_offset())
+
+        if self.items:
+            self.empty_label.place_forget()
+        else:
+            self.empty_label.place(relx=0.5, y=20, anchor="n")
+
+        first = self.offset // self.row_height
+        shift = self.offset % self.row_height
+        for i, row in enumerate(self.rows):
+            index = first + i
+            if i < visible and index < len(self.items):
+                row.show(self.items[index])
+                row.frame.place(x=0, y=i * self.row_height - shift, relwidth=1.0)
+            else:
+                row.frame.place_forget()
+
+        self.update_scrollbar()
+
+    def update_scrollbar(self):
+        total = len(self.items) * self.row_height
+        height = self.viewport.winfo_height()
+        if total <= height or total == 0:
+            self.scrollbar.set(0.0, 1.0)
+        else:
+            self.scrollbar.set(self.offset / total, (self.offset + height) / total)
+
+    def scroll_to(self, offset):
+        offset = min(max(int(offset), 0), self.max_offset())
+        if offset != self.offset:
+            self.offset = offset
+            self.render()
+
+    def on_scrollbar(self, action, value, unit=None):
+        """Handle CTkScrollbar 'moveto' and 'scroll' commands"""
+        if action == "moveto":
+            self.scroll_to(float(value) * len(self.items) * self.row_height)
+        elif action == "scroll":
+            step = self.viewport.winfo_height() if unit == "pages" else self.row_height
+            self.scroll_to(self.offset + int(value) * step)
+
+    def on_mousewheel(self, event):
+        if event.num == 4:
+            direction = -1
+        elif event.num == 5:
+            direction = 1
+        else:
+            direction = -1 if event.delta > 0 else 1
+        self.scroll_to(self.offset + direction * self.row_height // 2)
+
+    def bind_mousewheel(self, event=None):
+        self.viewport.bind_all("<MouseWheel>", self.on_mousewheel)
+        self.viewport.bind_all("<Button-4>", self.on_mousewheel)
+        self.viewport.bind_all("<Button-5>", self.on_mousewheel)
+
+    def unbind_mousewheel(self, event=None):
+        # Leave also fires when the pointer moves onto a row inside the viewport
+        x, y = self.viewport.winfo_pointerxy()
+        left = self.viewport.winfo_rootx()
+        top = self.viewport.winfo_rooty()
+        if left <= x < left + self.viewport.winfo_width() and top <= y < top + self.viewport.winfo_height():
+            return
+        self.viewport.unbind_all("<MouseWheel>")
+        self.viewport.unbind_all("<Button-4>")
+        self.viewport.unbind_all("<Button-5>")